@@ -5,6 +5,7 @@ import logging
 from amaascore.asset_managers.utils import json_to_asset_manager, json_to_relationship
 from amaascore.config import ENVIRONMENT
 from amaascore.core.interface import Interface
+from amaascore.core.json_codec import decode
 
 
 class AssetManagersInterface(Interface):
@@ -22,7 +23,7 @@ class AssetManagersInterface(Interface):
         url = '%s/asset-managers' % self.endpoint
         response = self.session.post(url, json=asset_manager.to_interface())
         if response.ok:
-            asset_manager = json_to_asset_manager(response.json())
+            asset_manager = json_to_asset_manager(decode(response.content))
             self.logger.info('Successfully Created Asset Manager: %s', asset_manager.asset_manager_id)
             return asset_manager
         else:
@@ -35,7 +36,7 @@ class AssetManagersInterface(Interface):
         response = self.session.get(url)
         if response.ok:
             self.logger.info('Successfully Retrieved Asset Manager: %s', asset_manager_id)
-            return json_to_asset_manager(response.json())
+            return json_to_asset_manager(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -53,7 +54,7 @@ class AssetManagersInterface(Interface):
         response = self.session.delete(url)
         if response.ok:
             self.logger.info('Successfully deactivated Asset Manager: %s', asset_manager_id)
-            return json_to_asset_manager(response.json())
+            return json_to_asset_manager(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -69,7 +70,8 @@ class AssetManagersInterface(Interface):
         url = self.endpoint + '/asset-managers'
         response = self.session.get(url, params=search_params)
         if response.ok:
-            asset_managers = [json_to_asset_manager(json_asset_manager) for json_asset_manager in response.json()]
+            asset_managers = [json_to_asset_manager(json_asset_manager)
+                              for json_asset_manager in decode(response.content)]
             self.logger.info('Returned %s Asset Managers.', len(asset_managers))
             return asset_managers
         else:
@@ -83,7 +85,7 @@ class AssetManagersInterface(Interface):
         response = self.session.post(url, json=relationship.to_interface())
         if response.ok:
             self.logger.info('Successfully Created Asset Manager Relationship: %s', relationship.asset_manager_id)
-            return json_to_relationship(response.json())
+            return json_to_relationship(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -95,7 +97,7 @@ class AssetManagersInterface(Interface):
         response = self.session.put(url, json=relationship.to_interface())
         if response.ok:
             self.logger.info('Successfully Amended Asset Manager Relationship: %s', relationship.asset_manager_id)
-            return json_to_relationship(response.json())
+            return json_to_relationship(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -109,7 +111,7 @@ class AssetManagersInterface(Interface):
         response = self.session.get(url, params=params)
         if response.ok:
             self.logger.info('Successfully Amended Asset Manager Relationship: %s', asset_manager_id)
-            return [json_to_relationship(json_relationship) for json_relationship in response.json()]
+            return [json_to_relationship(json_relationship) for json_relationship in decode(response.content)]
         else:
             self.logger.error(response.text)
             response.raise_for_status()
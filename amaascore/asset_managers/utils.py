@@ -2,13 +2,16 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from amaascore.asset_managers.asset_manager import AssetManager
 from amaascore.asset_managers.relationship import Relationship
+from amaascore.core.interning import intern_json
 
 
 def json_to_asset_manager(json_asset_manager):
+    json_asset_manager = intern_json(json_asset_manager)
     asset_manager = AssetManager(**json_asset_manager)
     return asset_manager
 
 
 def json_to_relationship(json_relationship):
+    json_relationship = intern_json(json_relationship)
     relationship = Relationship(**json_relationship)
     return relationship
@@ -1,7 +1,6 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date
-from dateutil.parser import parse
 import re
 import sys
 import uuid
@@ -9,6 +8,7 @@ import uuid
 from amaascore.assets.children import Link
 from amaascore.core.amaas_model import AMaaSModel
 from amaascore.core.comment import Comment
+from amaascore.core.date_utils import parse_date
 from amaascore.core.reference import Reference
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
@@ -71,7 +71,7 @@ class Asset(AMaaSModel):
         :return:
         """
         if value:
-            self._issue_date = parse(value).date() if isinstance(value, type_check) else value
+            self._issue_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def maturity_date(self):
@@ -86,7 +86,7 @@ class Asset(AMaaSModel):
         :return:
         """
         if value:
-            self._maturity_date = parse(value).date() if isinstance(value, type_check) else value
+            self._maturity_date = parse_date(value) if isinstance(value, type_check) else value
 
     def __str__(self):
         return "Asset object - ID: %s" % self.asset_id
@@ -1,11 +1,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 
 from amaascore.assets.asset import Asset
+from amaascore.core.date_utils import parse_date
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -67,7 +67,7 @@ class BondBase(Asset):
     @maturity_date.setter
     def maturity_date(self, maturity_date):
         if maturity_date:
-            self._maturity_date = parse(maturity_date).date() if isinstance(maturity_date, type_check) \
+            self._maturity_date = parse_date(maturity_date) if isinstance(maturity_date, type_check) \
                 else maturity_date
 
 
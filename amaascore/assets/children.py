@@ -1,6 +1,6 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, FrozenModel
 
 
 class Link(AMaaSModel):
@@ -17,4 +17,13 @@ class Reference(AMaaSModel):
         self.reference_value = reference_value
         self.active = active
         super(Reference, self).__init__(*args, **kwargs)
-        
\ No newline at end of file
+
+
+class FrozenLink(FrozenModel):
+    model_class = Link
+    attributes = ('linked_asset_id', 'active')
+
+
+class FrozenReference(FrozenModel):
+    model_class = Reference
+    attributes = ('reference_value', 'active')
@@ -1,11 +1,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 
 from amaascore.assets.listed_derivative import ListedDerivative
+from amaascore.core.date_utils import parse_date
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -92,4 +92,4 @@ class Future(ListedDerivative):
         :return:
         """
         if value:
-            self._expiry_date = parse(value).date() if isinstance(value, type_check) else value
+            self._expiry_date = parse_date(value) if isinstance(value, type_check) else value
@@ -1,12 +1,12 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 import logging
 
 from amaascore.assets.utils import json_to_asset
 from amaascore.config import ENVIRONMENT
+from amaascore.core.diff import minimal_updates
 from amaascore.core.interface import Interface
-from amaascore.core.amaas_model import json_handler
+from amaascore.core.json_codec import decode
 
 
 class AssetsInterface(Interface):
@@ -22,20 +22,27 @@ class AssetsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Created Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id,
                              asset.asset_id)
-            asset = json_to_asset(response.json())
+            asset = json_to_asset(decode(response.content))
             return asset
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def amend(self, asset):
+    def amend(self, asset, minimal=False):
+        """
+        :param asset: The amended asset
+        :param minimal: Only send the attributes which have changed since the asset was retrieved, as a partial amend
+        :return:
+        """
+        if minimal:
+            return self.amend_minimal(asset)
         self.logger.info('Amend Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id, asset.asset_id)
         url = '%s/assets/%s/%s' % (self.endpoint, asset.asset_manager_id, asset.asset_id)
         response = self.session.put(url, json=asset.to_interface())
         if response.ok:
             self.logger.info('Successfully Amended Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id,
                              asset.asset_id)
-            asset = json_to_asset(response.json())
+            asset = json_to_asset(decode(response.content))
             return asset
         else:
             self.logger.error(response.text)
@@ -45,15 +52,27 @@ class AssetsInterface(Interface):
         self.logger.info('Partial Amend Asset - Asset Manager: %s - Asset ID: %s', asset_manager_id,
                          asset_id)
         url = '%s/assets/%s/%s' % (self.endpoint, asset_manager_id, asset_id)
-        # Setting handler ourselves so we can be sure Decimals work
-        response = self.session.patch(url, data=json.dumps(updates, default=json_handler), headers=self.json_header)
+        # The session encodes the body with the json codec, so Decimals and dates are handled
+        response = self.session.patch(url, json=updates)
         if response.ok:
-            asset = json_to_asset(response.json())
+            asset = json_to_asset(decode(response.content))
             return asset
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
+    def amend_minimal(self, asset):
+        # Without a clean state to compare against, compare against the version in AMaaS
+        original = None
+        if not asset.tracks_changes():
+            original = self.retrieve(asset_manager_id=asset.asset_manager_id, asset_id=asset.asset_id)
+        updates = minimal_updates(asset, original)
+        if not updates:
+            self.logger.info('No changes to Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id,
+                             asset.asset_id)
+            return asset
+        return self.partial(asset_manager_id=asset.asset_manager_id, asset_id=asset.asset_id, updates=updates)
+
     def retrieve(self, asset_manager_id, asset_id, version=None):
         self.logger.info('Retrieve Asset - Asset Manager: %s - Asset ID: %s', asset_manager_id, asset_id)
         url = '%s/assets/%s/%s' % (self.endpoint, asset_manager_id, asset_id)
@@ -63,7 +82,10 @@ class AssetsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Retrieved Asset - Asset Manager: %s - Asset ID: %s', asset_manager_id,
                              asset_id)
-            return json_to_asset(response.json())
+            asset = json_to_asset(decode(response.content))
+            # Changes made from here can be sent with amend(minimal=True)
+            asset.mark_clean()
+            return asset
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -76,7 +98,7 @@ class AssetsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Deactivated Asset - Asset Manager: %s - Asset ID: %s', asset_manager_id,
                              asset_id)
-            return json_to_asset(response.json())
+            return json_to_asset(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -92,19 +114,25 @@ class AssetsInterface(Interface):
         url = self.endpoint + '/assets'
         response = self.session.get(url, params=search_params)
         if response.ok:
-            assets = [json_to_asset(json_asset) for json_asset in response.json()]
+            assets = [json_to_asset(json_asset) for json_asset in decode(response.content)]
             self.logger.info('Returned %s Assets.', len(assets))
             return assets
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def assets_by_asset_manager(self, asset_manager_id):
+    def assets_by_asset_manager(self, asset_manager_id, updated_since=None):
+        """
+        :param asset_manager_id:
+        :param updated_since: Optionally, only return the assets updated since this time (an ISO 8601 string)
+        :return:
+        """
         self.logger.info('Retrieve Assets By Asset Manager: %s', asset_manager_id)
         url = '%s/assets/%s' % (self.endpoint, asset_manager_id)
-        response = self.session.get(url)
+        params = {'updated_since': updated_since} if updated_since else {}
+        response = self.session.get(url, params=params)
         if response.ok:
-            assets = [json_to_asset(json_asset) for json_asset in response.json()]
+            assets = [json_to_asset(json_asset) for json_asset in decode(response.content)]
             self.logger.info('Returned %s Assets.', len(assets))
             return assets
         else:
@@ -119,7 +147,7 @@ class AssetsInterface(Interface):
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
         if response.ok:
-            count = response.json().get('count', 'Unknown')
+            count = decode(response.content).get('count', 'Unknown')
             self.logger.info('Deleted %s Assets.', count)
             return count
         else:
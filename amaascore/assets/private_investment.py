@@ -1,11 +1,11 @@
 from datetime import datetime, date
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 
 from amaascore.assets.asset import Asset
 from amaascore.assets.enums import PRIVATE_INVESTMENT_CATEGORY, PRIVATE_INVESTMENT_SHARE_TYPE,\
     PRIVATE_INVESTMENT_SUBCATEGORY
+from amaascore.core.date_utils import parse_date
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -87,7 +87,7 @@ class PrivateInvestment(Asset):
     @investment_date.setter
     def investment_date(self, investment_date):
         if investment_date:
-            self._investment_date = parse(investment_date).date() if isinstance(investment_date, type_check)\
+            self._investment_date = parse_date(investment_date) if isinstance(investment_date, type_check)\
                 else investment_date
 
     @property
@@ -136,7 +136,7 @@ class PrivateInvestment(Asset):
     @maturity_date.setter
     def maturity_date(self, maturity_date):
         if maturity_date:
-            self._maturity_date = parse(maturity_date).date() if isinstance(maturity_date, type_check)\
+            self._maturity_date = parse_date(maturity_date) if isinstance(maturity_date, type_check)\
                 else maturity_date
 
     @property
@@ -2,6 +2,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import inspect
 
+from amaascore.core.interning import intern_json
+
 #  All possible class names must be inserted into the globals collection.
 #  If there is a better way of doing this, please suggest!
 from amaascore.assets.asset import Asset
@@ -38,6 +40,7 @@ from amaascore.assets.warrants import Warrant
 from amaascore.assets.private_investment import PrivateInvestment
 
 def json_to_asset(json_asset):
+    json_asset = intern_json(json_asset)
     # Iterate through the asset children, converting the various JSON attributes into the relevant class type
     for (collection_name, clazz) in Asset.children().items():
         children = json_asset.pop(collection_name, {})
@@ -5,6 +5,7 @@ import logging
 from amaascore.books.utils import json_to_book
 from amaascore.config import ENVIRONMENT
 from amaascore.core.interface import Interface
+from amaascore.core.json_codec import decode
 
 
 class BooksInterface(Interface):
@@ -21,7 +22,7 @@ class BooksInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Created Book - Asset Manager: %s - Book ID: %s', book.asset_manager_id,
                              book.book_id)
-            book = json_to_book(response.json())
+            book = json_to_book(decode(response.content))
             return book
         else:
             self.logger.error(response.text)
@@ -34,7 +35,7 @@ class BooksInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Amended Book - Asset Manager: %s - Book ID: %s', book.asset_manager_id,
                              book.book_id)
-            book = json_to_book(response.json())
+            book = json_to_book(decode(response.content))
             return book
         else:
             self.logger.error(response.text)
@@ -49,7 +50,7 @@ class BooksInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Retrieved Book - Asset Manager: %s - Book ID: %s', asset_manager_id,
                              book_id)
-            return json_to_book(response.json())
+            return json_to_book(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -61,7 +62,7 @@ class BooksInterface(Interface):
         response = self.session.patch(url, json=json)
         if response.ok:
             self.logger.info('Successfully Retired Book - Asset Manager: %s - Book ID: %s', asset_manager_id, book_id)
-            return json_to_book(response.json())
+            return json_to_book(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -83,19 +84,25 @@ class BooksInterface(Interface):
         url = self.endpoint + '/books'
         response = self.session.get(url, params=search_params)
         if response.ok:
-            books = [json_to_book(json_book) for json_book in response.json()]
+            books = [json_to_book(json_book) for json_book in decode(response.content)]
             self.logger.info('Returned %s Books.', len(books))
             return books
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def books_by_asset_manager(self, asset_manager_id):
+    def books_by_asset_manager(self, asset_manager_id, updated_since=None):
+        """
+        :param asset_manager_id:
+        :param updated_since: Optionally, only return the books updated since this time (an ISO 8601 string)
+        :return:
+        """
         self.logger.info('Retrieve Books by Asset Manager: %s', asset_manager_id)
         url = '%s/books/%s' % (self.endpoint, asset_manager_id)
-        response = self.session.get(url)
+        params = {'updated_since': updated_since} if updated_since else {}
+        response = self.session.get(url, params=params)
         if response.ok:
-            books = [json_to_book(json_book) for json_book in response.json()]
+            books = [json_to_book(json_book) for json_book in decode(response.content)]
             self.logger.info('Returned %s Books.', len(books))
             return books
         else:
@@ -107,7 +114,7 @@ class BooksInterface(Interface):
         url = '%s/book_config/%s' % (self.endpoint, asset_manager_id)
         response = self.session.get(url)
         if response.ok:
-            book_config = response.json()
+            book_config = decode(response.content)
             self.logger.info('Successfully returned Book Config for %s', asset_manager_id)
             return book_config
         else:
@@ -122,7 +129,7 @@ class BooksInterface(Interface):
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
         if response.ok:
-            count = response.json().get('count', 'Unknown')
+            count = decode(response.content).get('count', 'Unknown')
             self.logger.info('Deleted %s Books.', count)
             return count
         else:
@@ -1,5 +1,8 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.transactions.position import Position
+from amaascore.transactions.position_frame import PositionFrame
+
 
 class Portfolio(object):
     """
@@ -7,31 +10,51 @@ class Portfolio(object):
     """
 
     def __init__(self, books=None):
-        self.books = books
+        self.books = books or []
+        self._frame = None
+
+    @property
+    def books(self):
+        return self._books
+
+    @books.setter
+    def books(self, books):
+        self._books = books
+        self._frame = None
+
+    def frame(self):
+        """
+        A PositionFrame of the positions in all of the books.  This is built once, so reset the books if their
+        positions change.
+        :return:
+        """
+        if self._frame is None:
+            self._frame = PositionFrame()
+            for book in self.books:
+                self._frame.extend(book.positions or [])
+        return self._frame
 
     def positions_by_book(self):
         """
-        A dictionary of Position objects keyed by book_id.
+        A dictionary of lists of Position objects keyed by book_id.
         :return:
         """
-        positions = None
-        for book in self.books():
-            positions[book] = book.positions()
+        return {book.book_id: list(book.positions or []) for book in self.books}
 
     def positions_by_asset(self):
         """
         A dictionary of Position objects keyed by asset_id.  If an asset position exists in more than one book, they
-         are combined into a single position.
+         are combined into a single position, which has no book_id.
+        :return:
+        """
+        return {asset_id: Position(asset_manager_id=asset_manager_id, book_id=None, asset_id=asset_id,
+                                   quantity=quantity)
+                for (asset_manager_id, asset_id), quantity
+                in self.frame().group_by(['asset_manager_id', 'asset_id']).items()}
+
+    def group_by(self, by, assets=None):
+        """
+        The total quantity across all books for each group - see PositionFrame.group_by.
         :return:
         """
-        positions = None
-        for book in self.books():
-            book_positions = book.positions_by_asset()
-            # unique positions
-            positions.update({position.asset_id: position for position in book_positions
-                              if position.asset_id not in positions.keys()})
-            # Existing positions
-            keys = [position.asset_id for position in book_positions if position.asset_id in positions.key()]
-            for key in keys:
-                positions.get(key).quantity += book_positions.get(key).quantity
-        return positions
+        return self.frame().group_by(by, assets=assets)
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from amaascore.books.book import Book
+from amaascore.core.interning import intern_json
 
 
 def json_to_book(json_book):
+    json_book = intern_json(json_book)
     book = Book(**json_book)
     return book
@@ -0,0 +1,123 @@
+"""
+Multi-currency valuation.  Positions are joined to EOD prices and the currencies of their assets, and the local market
+values are converted into each book's base_currency and a single reporting currency.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+
+from amaascore.market_data.fx import ONE, FXRateCache
+from amaascore.transactions.position_frame import PositionFrame
+
+
+class Valuation(object):
+    """
+    The result of ValuationEngine.value - a PositionFrame and columns aligned with its rows.
+    """
+
+    def __init__(self, frame, columns, assets):
+        self.frame = frame
+        self.columns = columns
+        self.assets = assets
+
+    def __len__(self):
+        return len(self.frame)
+
+    def rows(self):
+        """
+        :return: A list of dicts, one per position
+        """
+        names = list(self.columns.keys())
+        return [dict(zip(names, row)) for row in zip(*self.columns.values())]
+
+    def group_by(self, by, column='reporting_market_value'):
+        """
+        Total a value column by position or asset attributes - see PositionFrame.group_by.  Rows without a price or FX
+        rate are left out of the totals.
+        :param by: e.g. 'book_id', or ['book_id', 'asset_id', 'currency']
+        :param column: 'market_value' (only meaningful grouped by currency), 'base_market_value' (only meaningful
+        grouped by book) or 'reporting_market_value'
+        :return: An OrderedDict of group to total
+        """
+        return self.frame.group_by(by, assets=self.assets, values=self.columns[column])
+
+
+class ValuationEngine(object):
+    """
+    Market values are Decimals, or floats for a PositionFrame with exact=False.  The FX rates for each business date
+    are converted into CrossRates (for Decimals) or an FXMatrix (for floats) once and cached by the FXRateCache, and
+    each valuation only looks up the rate for each distinct pair of currencies rather than for every row.
+    """
+
+    def __init__(self, fx_rate_cache=None, reporting_currency='USD'):
+        """
+        :param fx_rate_cache: An FXRateCache - e.g. FXRateCache(MarketDataInterface(), asset_manager_id).  Its
+        default rate type is EOD.
+        :param reporting_currency: The currency of the portfolio totals
+        """
+        self.fx_rate_cache = fx_rate_cache or FXRateCache()
+        self.reporting_currency = reporting_currency
+
+    def value(self, positions, prices, assets, business_date, books=None):
+        """
+        :param positions: A list of Positions, or a PositionFrame
+        :param prices: A dict of asset_id to price, or a list of EODPrices
+        :param assets: A dict of asset_id to Asset, for the currency of each asset
+        :param business_date: The date of the FX rates
+        :param books: A dict of book_id to Book, for the base_currency of each book.  Books which are missing are
+        valued in the reporting currency.
+        :return: A Valuation with the columns asset_manager_id, book_id, asset_id, currency, quantity, price,
+        market_value, base_currency, base_market_value and reporting_market_value.  Values are None where there is no
+        price, asset currency or FX rate.
+        """
+        frame = positions if isinstance(positions, PositionFrame) else PositionFrame.from_positions(positions)
+        if not isinstance(prices, dict):
+            prices = {eod_price.asset_id: eod_price.price for eod_price in prices}
+        books = books or {}
+        currencies = frame.join({asset_id: asset.currency for asset_id, asset in assets.items()})
+        base_currencies = [books[book_id].base_currency if book_id in books else self.reporting_currency
+                           for book_id in frame.column('book_id')]
+        market_values = frame.market_values(prices)
+        # One lookup per distinct pair of currencies.  The FX rates are only needed if some pair has to be converted.
+        rates = {}
+        conversions = None
+        for pair in set(zip(currencies, base_currencies)) | {(currency, self.reporting_currency)
+                                                             for currency in set(currencies)}:
+            if pair[0] is None:
+                rates[pair] = None
+            elif pair[0] == pair[1]:
+                rates[pair] = ONE if frame.exact else 1.0
+            else:
+                if conversions is None:
+                    conversions = (self.fx_rate_cache.cross_rates(business_date) if frame.exact else
+                                   self.fx_rate_cache.matrix(business_date))
+                rate = conversions.get(*pair) if frame.exact else conversions.rate(*pair)
+                # FXMatrix gives NaN where there is no rate
+                rates[pair] = rate if rate == rate else None
+        base_market_values = []
+        reporting_market_values = []
+        for market_value, currency, base_currency in zip(market_values, currencies, base_currencies):
+            base_rate = rates[(currency, base_currency)]
+            reporting_rate = rates[(currency, self.reporting_currency)]
+            base_market_values.append(market_value * base_rate
+                                      if market_value is not None and base_rate is not None else None)
+            reporting_market_values.append(market_value * reporting_rate
+                                           if market_value is not None and reporting_rate is not None else None)
+        columns = OrderedDict([('asset_manager_id', frame.column('asset_manager_id')),
+                               ('book_id', frame.column('book_id')),
+                               ('asset_id', frame.column('asset_id')),
+                               ('currency', currencies),
+                               ('quantity', list(frame.quantities)),
+                               ('price', frame.join(prices)),
+                               ('market_value', market_values),
+                               ('base_currency', base_currencies),
+                               ('base_market_value', base_market_values),
+                               ('reporting_market_value', reporting_market_values)])
+        return Valuation(frame, columns, assets)
+
+    def value_portfolio(self, portfolio, prices, assets, business_date):
+        """
+        Value all of the positions in a Portfolio, using the base_currency of each of its books.
+        """
+        return self.value(portfolio.frame(), prices, assets, business_date,
+                          books={book.book_id: book for book in portfolio.books})
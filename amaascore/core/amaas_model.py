@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import datetime
 from decimal import Decimal
+import hashlib
 import json
 import sys
 
@@ -18,7 +19,7 @@ def json_handler(value):
         return list(value)
     if isinstance(value, Decimal):
         return str(value)
-    if isinstance(value, AMaaSModel):
+    if isinstance(value, (AMaaSModel, FrozenModel)):
         return value.to_json()
     raise TypeError("JSON Handler Failed on value '%s': Unknown type '%s'" % (value, type(value)))
 
@@ -31,7 +32,43 @@ def to_json_string(dict_to_convert):
     return json.dumps(dict_to_convert, ensure_ascii=False, default=json_handler, indent=4, separators=(',', ': '))
 
 
+def _canonical_key(value):
+    return json.dumps(value, sort_keys=True, default=json_handler)
+
+
+def canonical(value, excluded=()):
+    """
+    A canonical version of a value, for hashing and comparing content regardless of how it was built.  Children are
+    converted to dicts without their audit attributes, sets are sorted, Decimals are normalised (so 1.0 == 1.00) and
+    dates are converted to ISO strings.
+    :param value: A model, or a value of one of the model attributes
+    :param excluded: Keys to drop from value if it is a dict
+    :return: A JSON serialisable value
+    """
+    if isinstance(value, (AMaaSModel, FrozenModel)):
+        return canonical(value.to_dict(), value.amaas_model_attributes())
+    if isinstance(value, dict):
+        return {key: canonical(item) for key, item in value.items() if key not in excluded}
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonical(item) for item in value), key=_canonical_key)
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    if isinstance(value, Decimal):
+        return '{:f}'.format(value.normalize()) if value.is_finite() else str(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.timedelta)):
+        return json_handler(value)
+    return value
+
+
+_MISSING = object()
+# Model class -> the names of its collections of children
+_CHILD_ATTRIBUTES = {}
+
+
 class AMaaSModel(object):
+    # The state as of the last mark_clean is kept in a slot so that it stays out of __dict__, which drives to_json,
+    # __eq__ etc.  Nothing is recorded until then, so building models costs nothing extra.
+    __slots__ = ('_clean_state', '__dict__', '__weakref__')
 
     @staticmethod
     def non_interface_attributes():
@@ -49,6 +86,98 @@ class AMaaSModel(object):
         self.created_time = kwargs.get('created_time')  # Comes from database
         self.updated_time = kwargs.get('updated_time')  # Comes from database
 
+    def __getstate__(self):
+        return self.__dict__, getattr(self, '_clean_state', None)
+
+    def __setstate__(self, state):
+        # Pickles from before change tracking only contain the __dict__
+        state, clean_state = state if isinstance(state, tuple) else (state, None)
+        self.__dict__.update(state)
+        if clean_state is not None:
+            self._clean_state = clean_state
+
+    @classmethod
+    def _child_attributes(cls):
+        child_attributes = _CHILD_ATTRIBUTES.get(cls)
+        if child_attributes is None:
+            child_attributes = _CHILD_ATTRIBUTES[cls] = tuple(cls.children().keys()) if hasattr(cls, 'children') \
+                else ()
+        return child_attributes
+
+    def _collection(self, attribute):
+        return self.__dict__.get(attribute, self.__dict__.get('_' + attribute))
+
+    def _child_models(self, attribute):
+        for child in (self._collection(attribute) or {}).values():
+            if isinstance(child, AMaaSModel):
+                yield child
+            elif isinstance(child, (set, frozenset, list)):
+                for child_in_set in child:
+                    if isinstance(child_in_set, AMaaSModel):
+                        yield child_in_set
+
+    def _children_changed(self, attribute, clean_collection):
+        collection = self._collection(attribute)
+        if not isinstance(collection, dict) or clean_collection is None:
+            return collection != clean_collection
+        if len(collection) != len(clean_collection):
+            return True
+        for child_type, child in collection.items():
+            if child_type not in clean_collection:
+                return True
+            clean_child = clean_collection[child_type]
+            if isinstance(child, (set, frozenset)):
+                if not isinstance(clean_child, frozenset) or frozenset(child) != clean_child:
+                    return True
+            elif child is not clean_child and child != clean_child:
+                return True
+        # Children added since the last mark_clean have no state of their own, and were picked up above
+        return any(child.dirty_attributes() for child in self._child_models(attribute))
+
+    def tracks_changes(self):
+        """
+        :return: True if the model has been marked clean, so that dirty_attributes can tell what has changed since
+        """
+        return getattr(self, '_clean_state', None) is not None
+
+    def dirty_attributes(self):
+        """
+        The attributes that have changed since the model was last marked clean.  A collection of children is dirty if
+        it was replaced, if a child was added, removed or replaced within it (e.g. charges['Levy'] = Charge(...) or
+        links['Multiple'].add(link)), or if any of the children has changed.
+        :return: A set of attribute names, or None if the model has never been marked clean
+        """
+        if not self.tracks_changes():
+            return None
+        clean_dict, clean_children = self._clean_state
+        state = self.__dict__
+        dirty_attributes = set()
+        for key in set(state) | set(clean_dict):
+            value = state.get(key, _MISSING)
+            clean_value = clean_dict.get(key, _MISSING)
+            if value is not clean_value and (value is _MISSING or clean_value is _MISSING or value != clean_value):
+                dirty_attributes.add(key[1:] if key[0] == '_' else key)
+        for attribute in self._child_attributes():
+            if attribute not in dirty_attributes and self._children_changed(attribute, clean_children.get(attribute)):
+                dirty_attributes.add(attribute)
+        return dirty_attributes
+
+    def mark_clean(self):
+        """
+        Record the current state - e.g. as retrieved from AMaaS - so that later changes can be found by
+        dirty_attributes.  This takes a shallow copy of the attributes and of each collection of children (and each
+        set of children within them), and marks each child clean so that changes inside a child are found too.
+        """
+        children = {}
+        for attribute in self._child_attributes():
+            for child in self._child_models(attribute):
+                child.mark_clean()
+            collection = self._collection(attribute)
+            if isinstance(collection, dict):
+                children[attribute] = {child_type: frozenset(child) if isinstance(child, (set, frozenset)) else child
+                                       for child_type, child in collection.items()}
+        self._clean_state = (self.__dict__.copy(), children)
+
     @property
     def version(self):
         return self._version
@@ -71,6 +200,17 @@ class AMaaSModel(object):
         [dict_to_convert.pop(attr) for attr in self.non_interface_attributes()]
         return self.to_json(dict_to_convert)
 
+    def content_digest(self):
+        """
+        A stable hash of the interface attributes, ignoring the audit attributes (version, created_time etc) which
+        AMaaS maintains.  Two models with the same content have the same digest, across processes and Python versions.
+        :return: A SHA-256 hex digest
+        """
+        excluded = set(self.amaas_model_attributes()) | set(self.non_interface_attributes())
+        content = json.dumps(canonical(self.to_dict(), excluded), sort_keys=True, separators=(',', ':'),
+                             ensure_ascii=False, default=json_handler)
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
     def to_dict(self, dict_to_convert=None):
         dict_to_convert = dict_to_convert or self.__dict__
         # Convert internal property values (_XYZ) to the correctly named one (XYZ)
@@ -97,12 +237,14 @@ class AMaaSModel(object):
     def __eq__(self, other):
         """Override the default Equals behavior"""
         if isinstance(other, self.__class__):
+            # Ignore the database generated fields, without removing them from either model
+            excluded = self.amaas_model_attributes()
             my_dict = self.__dict__
             other_dict = other.__dict__
-            # Strip out the database generated fields:
-            [my_dict.pop(attr, None) for attr in self.amaas_model_attributes()]
-            [other_dict.pop(attr, None) for attr in self.amaas_model_attributes()]
-            return my_dict == other_dict
+            keys = set(my_dict).difference(excluded)
+            if keys != set(other_dict).difference(excluded):
+                return False
+            return all(my_dict[key] == other_dict[key] for key in keys)
         return NotImplemented
 
     def __ne__(self, other):
@@ -120,3 +262,117 @@ class AMaaSModel(object):
                 output.append((key, output_value))
         return hash(tuple(sorted(output)))
 
+    def freeze(self):
+        """
+        :return: The immutable FrozenModel version of this model
+        """
+        return FrozenModel.frozen_class(self.__class__).freeze(self)
+
+
+def _restore_frozen(clazz, values, audit):
+    frozen = clazz.__new__(clazz)
+    frozen._set_state(values, audit)
+    return frozen
+
+
+class FrozenModel(object):
+    """
+    An immutable, hashable version of a child model (e.g. a Link or Reference) for when children are held in large
+    sets or used as dict keys.  The hash is calculated once, and equality compares the value attributes only - the audit
+    attributes (including version) are kept but ignored.
+
+    Subclasses set model_class to the mutable AMaaSModel class and attributes to its value attributes.  The constructor
+    takes the same arguments as model_class, so the values go through the same validation and conversion.
+    """
+    __slots__ = ('_values', '_audit', '_hash')
+    model_class = None
+    attributes = ()
+
+    @staticmethod
+    def amaas_model_attributes():
+        return AMaaSModel.amaas_model_attributes()
+
+    @staticmethod
+    def frozen_class(model_class):
+        subclasses = list(FrozenModel.__subclasses__())
+        while subclasses:
+            subclass = subclasses.pop()
+            if subclass.model_class is model_class:
+                return subclass
+            subclasses.extend(subclass.__subclasses__())
+        raise TypeError('There is no frozen version of %s' % model_class.__name__)
+
+    @classmethod
+    def freeze(cls, model):
+        frozen = cls.__new__(cls)
+        frozen._set_state(tuple(getattr(model, attribute) for attribute in cls.attributes),
+                          tuple(getattr(model, attribute, None) for attribute in cls.amaas_model_attributes()))
+        return frozen
+
+    def __init__(self, *args, **kwargs):
+        model = self.model_class(*args, **kwargs)
+        self._set_state(tuple(getattr(model, attribute) for attribute in self.attributes),
+                        tuple(getattr(model, attribute, None) for attribute in self.amaas_model_attributes()))
+
+    def _set_state(self, values, audit):
+        object.__setattr__(self, '_values', values)
+        object.__setattr__(self, '_audit', audit)
+        object.__setattr__(self, '_hash', hash((self.__class__.__name__, values)))
+
+    def __getattr__(self, name):
+        # Only called for names which aren't slots
+        if name[0] != '_':
+            if name in self.attributes:
+                return self._values[self.attributes.index(name)]
+            audit_attributes = self.amaas_model_attributes()
+            if name in audit_attributes:
+                return self._audit[audit_attributes.index(name)]
+        raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'%s' object is immutable" % self.__class__.__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError("'%s' object is immutable" % self.__class__.__name__)
+
+    def __reduce__(self):
+        return _restore_frozen, (self.__class__, self._values, self._audit)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenModel):
+            return self.__class__ is other.__class__ and self._hash == other._hash and self._values == other._values
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, FrozenModel):
+            return not self.__eq__(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return self._hash
+
+    def replace(self, **changes):
+        """
+        :param changes: The attributes to change
+        :return: A new frozen model with the changes applied
+        """
+        model_dict = self.to_dict()
+        model_dict.update(changes)
+        return self.__class__(**model_dict)
+
+    def thaw(self):
+        """
+        :return: A mutable model_class version of this model
+        """
+        return self.model_class(**self.to_dict())
+
+    def to_dict(self):
+        model_dict = dict(zip(self.attributes, self._values))
+        model_dict.update(zip(self.amaas_model_attributes(), self._audit))
+        return model_dict
+
+    def to_json(self):
+        return to_json(self.to_dict())
+
+    def __repr__(self):
+        return str(self.to_dict())
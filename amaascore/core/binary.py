@@ -0,0 +1,372 @@
+"""
+A compact, type-tagged binary encoding for AMaaS models, used for caching and passing models between processes.
+
+The format is msgpack-like: every value is a one byte tag followed by its payload.  Integers are zigzag varints,
+Decimals are stored as an exact coefficient and exponent, dates as ordinals and datetimes as ordinal, microseconds and
+UTC offset.  Strings are written once per stream and then referred to by index, which removes most of the overhead of
+the repeated attribute names, identifiers and enum values in a batch of models.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+from dateutil.tz import tzoffset
+import importlib
+import pytz
+import struct
+
+from amaascore.core.amaas_model import AMaaSModel, FrozenModel
+
+MAGIC = b'AMB1'
+
+NONE, TRUE, FALSE, INT, FLOAT, STRING, STRING_REF, BYTES, LIST, TUPLE, SET, FROZENSET, DICT, DECIMAL, \
+    DECIMAL_SPECIAL, DATE, DATETIME, TIMEDELTA, MODEL, FROZEN_MODEL = range(20)
+
+NAIVE, OFFSET = 0, 1
+DOUBLE = struct.Struct('>d')
+
+# This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
+try:
+    text_type = unicode
+    integer_types = (int, long)
+except NameError:
+    text_type = str
+    integer_types = (int,)
+
+
+class BinaryEncoder(object):
+    """
+    Encodes values into a bytearray.  The string table lives for the lifetime of the encoder, so one encoder should be
+    used per stream.
+    """
+
+    def __init__(self):
+        self.strings = {}
+
+    def encode(self, value, out=None):
+        out = bytearray() if out is None else out
+        self._encode(value, out)
+        return out
+
+    def _varint(self, value, out):
+        while value > 0x7f:
+            out.append((value & 0x7f) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def _zigzag(self, value, out):
+        self._varint(value << 1 if value >= 0 else ((-value) << 1) - 1, out)
+
+    def _string(self, value, out):
+        index = self.strings.get(value)
+        if index is None:
+            self.strings[value] = len(self.strings)
+            encoded = value.encode('utf-8')
+            out.append(STRING)
+            self._varint(len(encoded), out)
+            out.extend(encoded)
+        else:
+            out.append(STRING_REF)
+            self._varint(index, out)
+
+    def _encode(self, value, out):
+        if value is None:
+            out.append(NONE)
+        elif value is True:
+            out.append(TRUE)
+        elif value is False:
+            out.append(FALSE)
+        elif isinstance(value, text_type):
+            self._string(value, out)
+        elif isinstance(value, integer_types):
+            out.append(INT)
+            self._zigzag(value, out)
+        elif isinstance(value, Decimal):
+            self._decimal(value, out)
+        elif isinstance(value, datetime.datetime):
+            self._datetime(value, out)
+        elif isinstance(value, datetime.date):
+            out.append(DATE)
+            self._varint(value.toordinal(), out)
+        elif isinstance(value, float):
+            out.append(FLOAT)
+            out.extend(DOUBLE.pack(value))
+        elif isinstance(value, dict):
+            out.append(DICT)
+            self._varint(len(value), out)
+            for key, item in value.items():
+                self._encode(key, out)
+                self._encode(item, out)
+        elif isinstance(value, AMaaSModel):
+            out.append(MODEL)
+            clazz = value.__class__
+            self._string('%s:%s' % (clazz.__module__, clazz.__name__), out)
+            self._encode(value.__dict__, out)
+        elif isinstance(value, FrozenModel):
+            out.append(FROZEN_MODEL)
+            clazz = value.__class__
+            self._string('%s:%s' % (clazz.__module__, clazz.__name__), out)
+            self._encode(value._values, out)
+            self._encode(value._audit, out)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            out.append(LIST if isinstance(value, list) else TUPLE if isinstance(value, tuple) else
+                       FROZENSET if isinstance(value, frozenset) else SET)
+            self._varint(len(value), out)
+            for item in value:
+                self._encode(item, out)
+        elif isinstance(value, bytes):
+            out.append(BYTES)
+            self._varint(len(value), out)
+            out.extend(value)
+        elif isinstance(value, datetime.timedelta):
+            out.append(TIMEDELTA)
+            self._zigzag(value.days, out)
+            self._varint(value.seconds, out)
+            self._varint(value.microseconds, out)
+        else:
+            raise TypeError("Cannot encode value '%s': Unknown type '%s'" % (value, type(value)))
+
+    def _decimal(self, value, out):
+        sign, digits, exponent = value.as_tuple()
+        if not isinstance(exponent, integer_types):
+            # NaN, sNaN and Infinity
+            out.append(DECIMAL_SPECIAL)
+            self._string(text_type(value), out)
+            return
+        coefficient = int(''.join(map(str, digits))) if digits else 0
+        out.append(DECIMAL)
+        # The sign is kept separately from the coefficient so that -0 survives the round trip
+        self._varint((coefficient << 1) | sign, out)
+        self._zigzag(exponent, out)
+
+    def _datetime(self, value, out):
+        out.append(DATETIME)
+        self._varint(value.toordinal(), out)
+        self._varint(((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond, out)
+        offset = value.utcoffset()
+        if offset is None:
+            out.append(NAIVE)
+        else:
+            out.append(OFFSET)
+            self._zigzag(offset.days * 86400 + offset.seconds, out)
+
+
+class BinaryDecoder(object):
+    """
+    Decodes values produced by BinaryEncoder.  As with the encoder, use one decoder per stream.
+    """
+
+    def __init__(self):
+        self.strings = []
+        self.classes = {}
+
+    def decode(self, data):
+        data = bytearray(data)
+        value, position = self._decode(data, 0)
+        return value
+
+    def _varint(self, data, position):
+        byte = data[position]
+        if byte < 0x80:
+            return byte, position + 1
+        result = shift = 0
+        while True:
+            byte = data[position]
+            position += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result, position
+            shift += 7
+
+    def _zigzag(self, data, position):
+        value, position = self._varint(data, position)
+        return (value >> 1) ^ -(value & 1), position
+
+    def _class(self, name):
+        clazz = self.classes.get(name)
+        if clazz is None:
+            module_name, class_name = name.split(':')
+            if not module_name.startswith('amaascore.'):
+                raise ValueError('Cannot decode model class: %s' % name)
+            clazz = getattr(importlib.import_module(module_name), class_name)
+            if not issubclass(clazz, (AMaaSModel, FrozenModel)):
+                raise ValueError('Cannot decode model class: %s' % name)
+            self.classes[name] = clazz
+        return clazz
+
+    def _decode(self, data, position):
+        tag = data[position]
+        position += 1
+        if tag == STRING_REF:
+            index, position = self._varint(data, position)
+            return self.strings[index], position
+        if tag == STRING:
+            length, position = self._varint(data, position)
+            value = bytes(data[position:position + length]).decode('utf-8')
+            self.strings.append(value)
+            return value, position + length
+        if tag == NONE:
+            return None, position
+        if tag == TRUE:
+            return True, position
+        if tag == FALSE:
+            return False, position
+        if tag == INT:
+            return self._zigzag(data, position)
+        if tag == DECIMAL:
+            coefficient, position = self._varint(data, position)
+            exponent, position = self._zigzag(data, position)
+            value = Decimal('%s%de%d' % ('-' if coefficient & 1 else '', coefficient >> 1, exponent))
+            return value, position
+        if tag == DICT:
+            length, position = self._varint(data, position)
+            value = {}
+            for _ in range(length):
+                key, position = self._decode(data, position)
+                value[key], position = self._decode(data, position)
+            return value, position
+        if tag == MODEL:
+            name, position = self._decode(data, position)
+            clazz = self._class(name)
+            state, position = self._decode(data, position)
+            # Bypass the constructor, in the same way as pickle.  The decoded model starts with no changes.
+            model = clazz.__new__(clazz)
+            model.__setstate__(state)
+            return model, position
+        if tag == FROZEN_MODEL:
+            name, position = self._decode(data, position)
+            clazz = self._class(name)
+            values, position = self._decode(data, position)
+            audit, position = self._decode(data, position)
+            frozen = clazz.__new__(clazz)
+            frozen._set_state(values, audit)
+            return frozen, position
+        if tag == DATE:
+            ordinal, position = self._varint(data, position)
+            return datetime.date.fromordinal(ordinal), position
+        if tag == DATETIME:
+            return self._datetime(data, position)
+        if tag in (LIST, TUPLE, SET, FROZENSET):
+            length, position = self._varint(data, position)
+            items = []
+            for _ in range(length):
+                item, position = self._decode(data, position)
+                items.append(item)
+            collection = {LIST: list, TUPLE: tuple, SET: set, FROZENSET: frozenset}[tag]
+            return items if tag == LIST else collection(items), position
+        if tag == FLOAT:
+            return DOUBLE.unpack_from(bytes(data[position:position + 8]))[0], position + 8
+        if tag == DECIMAL_SPECIAL:
+            value, position = self._decode(data, position)
+            return Decimal(value), position
+        if tag == BYTES:
+            length, position = self._varint(data, position)
+            return bytes(data[position:position + length]), position + length
+        if tag == TIMEDELTA:
+            days, position = self._zigzag(data, position)
+            seconds, position = self._varint(data, position)
+            microseconds, position = self._varint(data, position)
+            return datetime.timedelta(days=days, seconds=seconds, microseconds=microseconds), position
+        raise ValueError('Invalid binary data - unknown tag %s at position %s' % (tag, position - 1))
+
+    def _datetime(self, data, position):
+        ordinal, position = self._varint(data, position)
+        microseconds, position = self._varint(data, position)
+        timezone_type = data[position]
+        position += 1
+        tzinfo = None
+        if timezone_type == OFFSET:
+            offset, position = self._zigzag(data, position)
+            tzinfo = pytz.utc if offset == 0 else tzoffset(None, offset)
+        seconds, microsecond = divmod(microseconds, 1000000)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        value = datetime.datetime.combine(datetime.date.fromordinal(ordinal),
+                                          datetime.time(hour, minute, second, microsecond))
+        return value.replace(tzinfo=tzinfo), position
+
+
+def dumps(value):
+    """
+    :param value: A model, or any combination of lists, dicts etc containing models and basic types
+    :return: bytes
+    """
+    return bytes(BinaryEncoder().encode(value))
+
+
+def loads(data):
+    return BinaryDecoder().decode(data)
+
+
+class BinaryWriter(object):
+    """
+    Writes a stream of length-prefixed records.  Strings are shared across the records in the stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.encoder = BinaryEncoder()
+        self.stream.write(MAGIC)
+
+    def write(self, value):
+        record = self.encoder.encode(value)
+        header = bytearray()
+        self.encoder._varint(len(record), header)
+        self.stream.write(bytes(header + record))
+
+    def write_all(self, values):
+        for value in values:
+            self.write(value)
+
+
+class BinaryReader(object):
+    """
+    Reads the records written by BinaryWriter, one at a time.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.decoder = BinaryDecoder()
+        if self.stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError('Invalid binary stream')
+
+    def _length(self):
+        result = shift = 0
+        while True:
+            byte = self.stream.read(1)
+            if not byte:
+                if shift:
+                    raise ValueError('Truncated binary stream')
+                return None
+            byte = ord(byte)
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read(self):
+        """
+        :return: The next record, or raises EOFError at the end of the stream
+        """
+        length = self._length()
+        if length is None:
+            raise EOFError
+        record = self.stream.read(length)
+        if len(record) != length:
+            raise ValueError('Truncated binary stream')
+        return self.decoder.decode(record)
+
+    def __iter__(self):
+        while True:
+            try:
+                yield self.read()
+            except EOFError:
+                return
+
+
+def dump_stream(values, stream):
+    BinaryWriter(stream).write_all(values)
+
+
+def load_stream(stream):
+    return iter(BinaryReader(stream))
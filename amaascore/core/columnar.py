@@ -0,0 +1,149 @@
+"""
+Column-oriented export of model lists - e.g. Positions, EODPrices, FXRates and Transactions - for analytics.
+Columns are built in a single pass per attribute rather than row by row, and can be built straight from the JSON
+returned by the AMaaS services without hydrating the models first.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+
+from amaascore.core.amaas_model import AMaaSModel, FrozenModel
+
+
+def _public_name(key):
+    return key[1:] if key[0] == '_' else key
+
+
+def _default_attributes(first, child_names):
+    excluded = set(child_names) | set(first.non_interface_attributes())
+    return [_public_name(key) for key in first.__dict__ if _public_name(key) not in excluded]
+
+
+def _child_fields(child):
+    if isinstance(child, (AMaaSModel, FrozenModel)):
+        excluded = child.amaas_model_attributes()
+        return [key for key in child.to_dict() if key not in excluded]
+    return [key for key in child if key not in AMaaSModel.amaas_model_attributes()]
+
+
+def _child_value(child, field):
+    return getattr(child, field) if isinstance(child, (AMaaSModel, FrozenModel)) else child.get(field)
+
+
+def _flatten_children(rows, collection_name, get_collection, columns):
+    """
+    Add a column per child type and child attribute, e.g. charges.Commission.charge_value.  Types which hold a set
+    of children (e.g. links) produce a list of values per row.
+    """
+    collections = [get_collection(row) or {} for row in rows]
+    layout = OrderedDict()
+    for collection in collections:
+        for child_type, child in collection.items():
+            if child_type in layout:
+                continue
+            # An empty set of links (e.g. after remove_link) is treated the same as no links
+            sample = next(iter(child), None) if isinstance(child, (set, frozenset, list)) else child
+            if sample is not None:
+                layout[child_type] = _child_fields(sample)
+    for child_type, fields in sorted(layout.items()):
+        for field in fields:
+            column = []
+            for collection in collections:
+                child = collection.get(child_type)
+                is_set = isinstance(child, (set, frozenset, list))
+                if child is None or (is_set and not child):
+                    column.append(None)
+                elif is_set:
+                    column.append([_child_value(item, field) for item in child])
+                else:
+                    column.append(_child_value(child, field))
+            columns['%s.%s.%s' % (collection_name, child_type, field)] = column
+
+
+def to_columns(models, attributes=None, children=None):
+    """
+    Convert a list of models to a dict of columns.  Values keep their model types (Decimal, date etc).
+
+    :param models: A list of AMaaSModel objects of the same type
+    :param attributes: The attributes to export.  Defaults to every attribute of the first model except for the child
+    collections.
+    :param children: Child collections (e.g. ['charges', 'references']) to flatten into additional columns
+    :return: An OrderedDict of column name to list of values
+    """
+    children = children or []
+    columns = OrderedDict()
+    if not models:
+        for attribute in attributes or []:
+            columns[attribute] = []
+        return columns
+    first = models[0]
+    child_names = list(first.children().keys()) if hasattr(first, 'children') else []
+    attributes = attributes or _default_attributes(first, child_names)
+    for attribute in attributes:
+        columns[attribute] = [getattr(model, attribute, None) for model in models]
+    for collection_name in children:
+        _flatten_children(models, collection_name, lambda model: getattr(model, collection_name, None), columns)
+    return columns
+
+
+def json_to_columns(json_objects, attributes=None, children=None, converters=None):
+    """
+    Convert a list of JSON objects (e.g. straight from a response) to a dict of columns, without creating models.
+
+    :param json_objects: A list of dicts
+    :param attributes: The attributes to export.  Defaults to the keys of the first object except for nested objects.
+    :param children: Child collections (e.g. ['charges', 'references']) to flatten into additional columns
+    :param converters: An optional dict of column name to a callable used to type the values - e.g.
+    {'quantity': Decimal, 'transaction_date': parse_date}.  None values are not converted.
+    :return: An OrderedDict of column name to list of values
+    """
+    children = children or []
+    converters = converters or {}
+    columns = OrderedDict()
+    if attributes is None:
+        attributes = [key for key, value in json_objects[0].items() if not isinstance(value, dict)] \
+            if json_objects else []
+    for attribute in attributes:
+        columns[attribute] = [json_object.get(attribute) for json_object in json_objects]
+    for collection_name in children:
+        _flatten_children(json_objects, collection_name, lambda json_object: json_object.get(collection_name),
+                          columns)
+    for column_name, converter in converters.items():
+        if column_name in columns:
+            columns[column_name] = [None if value is None else converter(value) for value in columns[column_name]]
+    return columns
+
+
+def _as_columns(data, attributes, children):
+    if isinstance(data, dict):
+        return data
+    return to_columns(data, attributes=attributes, children=children)
+
+
+def to_dataframe(data, attributes=None, children=None):
+    """
+    Requires pandas.
+    :param data: Either a list of models or the output of to_columns / json_to_columns
+    :return: A pandas.DataFrame
+    """
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError('pandas is required for to_dataframe')
+    columns = _as_columns(data, attributes, children)
+    return pandas.DataFrame(columns, columns=list(columns.keys()))
+
+
+def to_arrow(data, attributes=None, children=None):
+    """
+    Requires pyarrow.  Decimals and dates map onto the native Arrow decimal and date types.
+    :param data: Either a list of models or the output of to_columns / json_to_columns
+    :return: A pyarrow.Table
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('pyarrow is required for to_arrow')
+    columns = _as_columns(data, attributes, children)
+    return pyarrow.Table.from_arrays([pyarrow.array(values) for values in columns.values()],
+                                     names=list(columns.keys()))
@@ -0,0 +1,84 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from dateutil.parser import parse
+from dateutil.tz import tzoffset, tzutc
+import re
+
+# Canonical ISO-8601 as produced by date.isoformat() / datetime.isoformat() (and therefore by json_handler).
+ISO_REGEX = re.compile(r'^(\d{4})-(\d{2})-(\d{2})'
+                       r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?'
+                       r'(Z|[+-]\d{2}:?\d{2})?)?$')
+
+# A batch of objects usually only contains a handful of distinct dates, so the caches stay small.  They are simply
+# cleared if they ever reach this size (e.g. for a day of intraday timestamps).
+CACHE_SIZE = 10000
+
+_date_cache = {}
+_datetime_cache = {}
+UTC = tzutc()
+
+
+def _parse_iso(value):
+    """
+    Parse a canonical ISO-8601 string without going through dateutil.
+    :param value: The string to parse
+    :return: A datetime.datetime, or None if the string is not in the canonical format
+    """
+    match = ISO_REGEX.match(value)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    microsecond = int(fraction.ljust(6, '0')) if fraction else 0
+    tzinfo = None
+    if offset:
+        if offset == 'Z':
+            tzinfo = UTC
+        else:
+            sign = -1 if offset[0] == '-' else 1
+            offset = offset[1:].replace(':', '')
+            seconds = sign * (int(offset[:2]) * 3600 + int(offset[2:]) * 60)
+            # Mirror dateutil, which returns tzutc() for a zero offset
+            tzinfo = UTC if seconds == 0 else tzoffset(None, seconds)
+    try:
+        return datetime.datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0),
+                                 int(second or 0), microsecond, tzinfo)
+    except ValueError:
+        # e.g. 2017-02-30 - let dateutil raise its usual error
+        return None
+
+
+def parse_datetime(value):
+    """
+    Convert a string to a datetime.  Canonical ISO-8601 strings use a fast dedicated parser, anything else falls back
+    to dateutil.  Results are memoized since the same timestamps are repeated across a batch.
+    :param value: The string to parse
+    :return: A datetime.datetime
+    """
+    result = _datetime_cache.get(value)
+    if result is None:
+        result = _parse_iso(value) or parse(value)
+        if len(_datetime_cache) >= CACHE_SIZE:
+            _datetime_cache.clear()
+        _datetime_cache[value] = result
+    return result
+
+
+def parse_date(value):
+    """
+    Convert a string to a date.  See parse_datetime.
+    :param value: The string to parse
+    :return: A datetime.date
+    """
+    result = _date_cache.get(value)
+    if result is None:
+        result = parse_datetime(value).date()
+        if len(_date_cache) >= CACHE_SIZE:
+            _date_cache.clear()
+        _date_cache[value] = result
+    return result
+
+
+def clear_caches():
+    _date_cache.clear()
+    _datetime_cache.clear()
@@ -0,0 +1,57 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from amaascore.core.amaas_model import canonical, to_json
+
+
+def _excluded_attributes(model):
+    return set(model.amaas_model_attributes()) | set(model.non_interface_attributes())
+
+
+def minimal_updates(model, original=None):
+    """
+    Turns the changes tracked on a model into the updates for a partial amend.  The audit attributes (version etc) are
+    maintained by AMaaS and are never sent.
+    :param model: An AMaaSModel marked clean when it was retrieved from AMaaS, and then modified
+    :param original: The version in AMaaS, which the model is compared against (see diff) if it has never been marked
+    clean
+    :return: A dict of attribute name to JSON value, empty if nothing has changed
+    """
+    dirty_attributes = model.dirty_attributes()
+    if dirty_attributes is None:
+        if original is None:
+            raise ValueError('%s has not been marked clean, so the original version is needed to find the changes' %
+                             model.__class__.__name__)
+        return diff(original, model)
+    dirty_attributes -= _excluded_attributes(model)
+    if not dirty_attributes:
+        return {}
+    changed = {}
+    for key, value in model.__dict__.items():
+        attribute = key[1:] if key[0] == '_' else key
+        if attribute in dirty_attributes:
+            changed[attribute] = value
+    # Removed attributes are sent as None, in the same way as diff
+    changed.update({attribute: None for attribute in dirty_attributes if attribute not in changed})
+    return to_json(changed)
+
+
+def diff(original, modified):
+    """
+    Compares two versions of the same model without relying on change tracking, e.g. a locally built model against
+    the version retrieved from AMaaS.  Children are compared without their audit attributes and sets regardless of
+    order (see canonical).
+    :param original: The existing version of the model
+    :param modified: The new version of the model
+    :return: A dict of attribute name to JSON value for the attributes which differ (None if removed)
+    """
+    excluded = _excluded_attributes(modified)
+    original_dict = original.to_dict()
+    modified_dict = modified.to_dict()
+    changed = {}
+    for attribute in set(original_dict.keys()) | set(modified_dict.keys()):
+        if attribute in excluded:
+            continue
+        value = modified_dict.get(attribute)
+        if canonical(value) != canonical(original_dict.get(attribute)):
+            changed[attribute] = value
+    return to_json(changed) if changed else {}
@@ -0,0 +1,31 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import os
+
+
+def replace_file(source, destination):
+    """
+    Move source over destination, atomically where the platform allows it.
+    """
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+        return
+    # Python 2 - rename is an atomic replace on POSIX, but fails on Windows if the destination exists
+    if os.name == 'nt' and os.path.exists(destination):
+        os.remove(destination)
+    os.rename(source, destination)
+
+
+def save_json(filename, data):
+    """
+    Write data as JSON to a temporary file and then move it over filename, so that a failure part way through leaves
+    the existing file in place.
+    :param filename:
+    :param data:
+    :return:
+    """
+    temporary_filename = filename + '.tmp'
+    with open(temporary_filename, 'w') as f:
+        json.dump(data, f, sort_keys=True)
+    replace_file(temporary_filename, filename)
@@ -10,6 +10,7 @@ from warrant.aws_srp import AWSSRP
 
 from amaascore.config import COGNITO_REGION, COGNITO_CLIENT_ID, COGNITO_POOL, ENDPOINTS, LOCAL_ENDPOINT,\
     NON_PROD_URL, PROD_URL, ENVIRONMENT, API_VERSION
+from amaascore.core.json_codec import encode
 from amaascore.exceptions import AMaaSException
 
 
@@ -54,17 +55,29 @@ class AMaaSSession(object):
             self.logger.error(e.response.get('Error'))
             self.last_authenticated = None
 
+    @staticmethod
+    def encode_json(kwargs):
+        """ Encode any json body with the configured codec rather than letting requests use the stdlib """
+        if kwargs.get('json') is not None:
+            kwargs['data'] = encode(kwargs.pop('json'))
+            headers = dict(kwargs.get('headers') or {})
+            headers['Content-Type'] = 'application/json'
+            kwargs['headers'] = headers
+        return kwargs
+
     def put(self, url, data=None, **kwargs):
         # Add a refresh
         if self.last_authenticated and not self.needs_refresh():
-            return self.session.put(url=url, data=data, **kwargs)
+            kwargs = self.encode_json(dict(kwargs, data=data))
+            return self.session.put(url=url, **kwargs)
         else:
             raise AMaaSException('Not Authenticated')
 
     def post(self, url, data=None, **kwargs):
         # Add a refresh
         if self.last_authenticated and not self.needs_refresh():
-            return self.session.post(url=url, data=data, **kwargs)
+            kwargs = self.encode_json(dict(kwargs, data=data))
+            return self.session.post(url=url, **kwargs)
         else:
             raise AMaaSException('Not Authenticated')
 
@@ -85,7 +98,8 @@ class AMaaSSession(object):
     def patch(self, url, data=None, **kwargs):
         # Add a refresh
         if self.last_authenticated and not self.needs_refresh():
-            return self.session.patch(url=url, data=data, **kwargs)
+            kwargs = self.encode_json(dict(kwargs, data=data))
+            return self.session.patch(url=url, **kwargs)
         else:
             raise AMaaSException('Not Authenticated')
 
@@ -0,0 +1,77 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+
+# This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
+type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
+
+# Identifier and enum attributes whose values repeat across a bulk result (e.g. every transaction for an asset
+# manager carries the same asset_manager_id, a handful of book IDs, currencies, actions and statuses).  Values which
+# are close to unique, such as transaction_id, asset_id and party_id, are deliberately excluded since sharing them
+# saves nothing and only grows the pool.
+INTERNED_ATTRIBUTES = {'account_type', 'active', 'asset_book_id', 'asset_class', 'asset_manager_id',
+                       'asset_manager_status', 'asset_manager_type', 'asset_status', 'asset_type', 'book_id',
+                       'book_status', 'book_type', 'business_unit', 'corporate_action_status',
+                       'corporate_action_type', 'counterparty_book_id', 'country_id', 'created_by', 'currency',
+                       'dividend_asset_id', 'item_class', 'item_level', 'item_source', 'item_status', 'item_type',
+                       'owner_id', 'party_class', 'party_status', 'party_type', 'rate_type', 'relationship_status',
+                       'relationship_type', 'settlement_currency', 'timezone', 'transaction_action',
+                       'transaction_currency', 'transaction_status', 'transaction_type', 'updated_by', 'venue_id'}
+# The pool is cleared when it reaches this many strings, so that it cannot grow without bound in a long running process
+MAX_POOL_SIZE = 10000
+
+
+class StringPool(object):
+    """
+    Shares identical strings between the objects hydrated from JSON or CSV.  Unlike the builtin intern, the pool is
+    bounded - once it holds max_size strings it is cleared, and sharing starts again from the next value.  Keys are
+    not pooled, as the JSON decoders and csv.DictReader already share them across a bulk result.
+    """
+
+    def __init__(self, attributes=None, max_size=MAX_POOL_SIZE):
+        self.attributes = INTERNED_ATTRIBUTES if attributes is None else attributes
+        self.max_size = max_size
+        self.strings = {}
+
+    def intern(self, value):
+        strings = self.strings
+        pooled = strings.get(value)
+        if pooled is None:
+            if len(strings) >= self.max_size:
+                strings.clear()
+            pooled = strings[value] = value
+        return pooled
+
+    def intern_json(self, json_object):
+        """
+        Replaces the values of the identifier and enum attributes in json_object (and any nested objects) with shared
+        strings.  The object is updated in place rather than copied.
+        :param json_object: A dict, list or value as decoded from JSON or read from a CSV
+        :return: json_object
+        """
+        if isinstance(json_object, dict):
+            attributes = self.attributes
+            for key, value in json_object.items():
+                if isinstance(value, type_check):
+                    if key in attributes:
+                        json_object[key] = self.intern(value)
+                elif isinstance(value, (dict, list)):
+                    self.intern_json(value)
+        elif isinstance(json_object, list):
+            for item in json_object:
+                self.intern_json(item)
+        return json_object
+
+    def clear(self):
+        self.strings.clear()
+
+    def __len__(self):
+        return len(self.strings)
+
+
+# Shared by all of the json_to_* hydrators and CSV loaders
+STRING_POOL = StringPool()
+
+
+def intern_json(json_object):
+    return STRING_POOL.intern_json(json_object)
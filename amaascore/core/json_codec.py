@@ -0,0 +1,114 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import re
+
+from amaascore.core.amaas_model import json_handler
+
+
+class JSONCodec(object):
+    """
+    Encodes request bodies and decodes response bodies.  This is the standard library implementation - faster backends
+    override encode / decode but must produce the same JSON (Decimals, dates and sets are handled by json_handler).
+    """
+
+    name = 'json'
+
+    def encode(self, obj):
+        """
+        :param obj: The object to encode
+        :return: UTF-8 encoded bytes
+        """
+        return json.dumps(obj, ensure_ascii=False, default=json_handler, separators=(',', ':')).encode('utf-8')
+
+    def decode(self, data):
+        """
+        :param data: UTF-8 encoded bytes (e.g. response.content) or a string
+        :return: The decoded object
+        """
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+# A run of digits too long to be certain of fitting in 64 bits.  This may also match inside strings or fractions, which
+# only costs a fallback to the standard library.
+WIDE_NUMBER = re.compile(r'\d{19,}')
+WIDE_NUMBER_BYTES = re.compile(br'\d{19,}')
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Uses orjson (https://github.com/ijl/orjson) if it is installed.  Dates are passed through to json_handler so that
+    the output is identical to the standard library codec.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self.orjson = orjson
+        self.options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj):
+        try:
+            return self.orjson.dumps(obj, default=json_handler, option=self.options)
+        except TypeError:
+            # orjson is stricter than json in a few places (e.g. integers larger than 64 bits)
+            return super(OrjsonCodec, self).encode(obj)
+
+    def decode(self, data):
+        wide_number = WIDE_NUMBER_BYTES if isinstance(data, bytes) else WIDE_NUMBER
+        if wide_number.search(data) is not None:
+            # orjson silently turns integers wider than 64 bits into floats
+            return super(OrjsonCodec, self).decode(data)
+        try:
+            return self.orjson.loads(data)
+        except self.orjson.JSONDecodeError:
+            # orjson is stricter than json in a few places (e.g. NaN and Infinity)
+            return super(OrjsonCodec, self).decode(data)
+
+
+CODECS = {'json': JSONCodec, 'orjson': OrjsonCodec}
+# Backends are tried in this order when no codec has been explicitly set
+PREFERRED_CODECS = ['orjson', 'json']
+
+_codec = None
+
+
+def register_codec(codec_class):
+    CODECS[codec_class.name] = codec_class
+
+
+def set_codec(codec):
+    """
+    Set the codec used for all requests and responses.
+    :param codec: A codec name (see CODECS), a JSONCodec instance or None to revert to the fastest available backend
+    :return: The codec now in use
+    """
+    global _codec
+    if codec is None or isinstance(codec, JSONCodec):
+        _codec = codec
+    else:
+        _codec = CODECS[codec]()
+    return get_codec()
+
+
+def get_codec():
+    global _codec
+    if _codec is None:
+        for name in PREFERRED_CODECS:
+            try:
+                _codec = CODECS[name]()
+                break
+            except ImportError:
+                continue
+    return _codec
+
+
+def encode(obj):
+    return get_codec().encode(obj)
+
+
+def decode(data):
+    return get_codec().decode(data)
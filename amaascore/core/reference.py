@@ -1,6 +1,6 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, FrozenModel
 
 
 class Reference(AMaaSModel):
@@ -9,3 +9,8 @@ class Reference(AMaaSModel):
         self.reference_value = reference_value
         self.active = active
         super(Reference, self).__init__(*args, **kwargs)
+
+
+class FrozenReference(FrozenModel):
+    model_class = Reference
+    attributes = ('reference_value', 'active')
@@ -4,6 +4,7 @@ import logging
 
 from amaascore.config import ENVIRONMENT
 from amaascore.core.interface import Interface
+from amaascore.core.json_codec import decode
 from amaascore.corporate_actions.utils import json_to_corporate_action
 
 
@@ -22,7 +23,7 @@ class CorporateActionsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Created Corporate Action - Asset Manager: %s - Corporate Action ID: %s',
                              corporate_action.asset_manager_id, corporate_action.corporate_action_id)
-            corporate_action = json_to_corporate_action(response.json())
+            corporate_action = json_to_corporate_action(decode(response.content))
             return corporate_action
         else:
             self.logger.error(response.text)
@@ -37,7 +38,7 @@ class CorporateActionsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Amended Corporate Action - Asset Manager: %s - Corporate Action ID: %s',
                              corporate_action.asset_manager_id, corporate_action.corporate_action_id)
-            corporate_action = json_to_corporate_action(response.json())
+            corporate_action = json_to_corporate_action(decode(response.content))
             return corporate_action
         else:
             self.logger.error(response.text)
@@ -53,7 +54,7 @@ class CorporateActionsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Retrieved Corporate Action - Asset Manager: %s - Corporate Action ID: %s',
                              asset_manager_id, corporate_action_id)
-            return json_to_corporate_action(response.json())
+            return json_to_corporate_action(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -67,7 +68,7 @@ class CorporateActionsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Cancelled Corporate Action - Asset Manager: %s - Corporate Action ID: %s',
                              asset_manager_id, corporate_action_id)
-            return json_to_corporate_action(response.json())
+            return json_to_corporate_action(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -83,7 +84,7 @@ class CorporateActionsInterface(Interface):
         url = self.endpoint + '/corporate-actions'
         response = self.session.get(url, params=search_params)
         if response.ok:
-            corp_actions = [json_to_corporate_action(json_corp_action) for json_corp_action in response.json()]
+            corp_actions = [json_to_corporate_action(json_corp_action) for json_corp_action in decode(response.content)]
             self.logger.info('Returned %s Corporate Actions.', len(corp_actions))
             return corp_actions
         else:
@@ -95,7 +96,7 @@ class CorporateActionsInterface(Interface):
         url = '%s/corporate-actions/%s' % (self.endpoint, asset_manager_id)
         response = self.session.get(url)
         if response.ok:
-            corp_actions = [json_to_corporate_action(json_corp_action) for json_corp_action in response.json()]
+            corp_actions = [json_to_corporate_action(json_corp_action) for json_corp_action in decode(response.content)]
             self.logger.info('Returned %s Corporate Actions.', len(corp_actions))
             return corp_actions
         else:
@@ -110,7 +111,7 @@ class CorporateActionsInterface(Interface):
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
         if response.ok:
-            count = response.json().get('count', 'Unknown')
+            count = decode(response.content).get('count', 'Unknown')
             self.logger.info('Deleted %s Corporate Actions.', count)
             return count
         else:
@@ -3,6 +3,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import csv
 import inspect
 
+from amaascore.core.interning import intern_json
+
 #  All possible class names must be inserted into the globals collection.
 #  If there is a better way of doing this, please suggest!
 from amaascore.corporate_actions.corporate_action import CorporateAction
@@ -11,6 +13,7 @@ from amaascore.corporate_actions.split import Split
 
 
 def json_to_corporate_action(json_corporate_action):
+    json_corporate_action = intern_json(json_corporate_action)
     # Iterate through the corp action children, converting the various JSON attributes into the relevant class type
     for (collection_name, clazz) in CorporateAction.children().items():
         children = json_corporate_action.pop(collection_name, {})
@@ -10,3 +10,9 @@ class TransactionNeedsSaving(Exception):
     def __init__(self):
         message = "Transaction needs to be saved to AMaaS Core for the functionality to be valid"
         super(TransactionNeedsSaving, self).__init__(message)
+
+
+class MissingFXRate(AMaaSException):
+    def __init__(self, from_currency, to_currency):
+        message = "No FX rate, direct or via the pivot currency, from %s to %s" % (from_currency, to_currency)
+        super(MissingFXRate, self).__init__(message)
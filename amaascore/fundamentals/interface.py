@@ -1,10 +1,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from dateutil.parser import parse
 import logging
 
 from amaascore.config import ENVIRONMENT
+from amaascore.core.date_utils import parse_date
 from amaascore.core.interface import Interface
+from amaascore.core.json_codec import decode
 
 
 class FundamentalsInterface(Interface):
@@ -23,7 +24,7 @@ class FundamentalsInterface(Interface):
         response = self.session.get(url, params=params)
         if response.ok:
             self.logger.info('Successfully retrieved country(s)')
-            return response.json()
+            return decode(response.content)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -39,7 +40,7 @@ class FundamentalsInterface(Interface):
         response = self.session.get(url, params=params)
         if response.ok:
             self.logger.info('Successfully retrieved holidays')
-            return response.json()
+            return decode(response.content)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -55,8 +56,8 @@ class FundamentalsInterface(Interface):
         response = self.session.get(url, params=params)
         if response.ok:
             self.logger.info('Successfully calculated business date')
-            business_date = response.json().get('business_date')
-            business_date = parse(business_date).date()
+            business_date = decode(response.content).get('business_date')
+            business_date = parse_date(business_date)
             return business_date
         else:
             self.logger.error(response.text)
@@ -69,7 +70,7 @@ class FundamentalsInterface(Interface):
         response = self.session.get(url, params=params)
         if response.ok:
             self.logger.info('Successfully got information about date')
-            return response.json()
+            return decode(response.content)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
\ No newline at end of file
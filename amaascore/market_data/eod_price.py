@@ -1,11 +1,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 
 from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.date_utils import parse_date
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -56,6 +56,6 @@ class EODPrice(AMaaSModel):
         """
         if business_date is not None:
             if isinstance(business_date, type_check):
-                self._business_date = parse(business_date).date()
+                self._business_date = parse_date(business_date)
             else:
                 self._business_date = business_date
@@ -0,0 +1,248 @@
+"""
+Currency conversion from FXRates.  Following ForeignExchange, the asset_id of an FX rate is the base currency followed
+by the counter currency (e.g. USDJPY), and the rate is the amount of the counter currency for one unit of the base.
+CrossRates converts exact Decimal amounts one at a time, and FXMatrix converts large batches of float amounts.  The
+FXRateCache keeps both per business date and rate type.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from array import array
+from decimal import Decimal
+import sys
+
+from amaascore.exceptions import MissingFXRate
+
+type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
+
+ONE = Decimal(1)
+
+
+def pair_currencies(asset_id):
+    """
+    :param asset_id: An FX asset_id - e.g. USDJPY
+    :return: (base currency, counter currency)
+    """
+    return asset_id[0:3], asset_id[3:6]
+
+
+class CrossRates(object):
+    """
+    The conversion rates between every pair of currencies for a single set of FX rates - e.g. one business date.
+    Pairs without a direct rate (or its inverse) are triangulated via the pivot currency.
+    """
+
+    def __init__(self, fx_rates, pivot='USD', rate_type=None):
+        """
+        :param fx_rates: A list of FXRates.  Inactive rates are ignored, and where there is more than one rate for a
+        pair the latest rate_timestamp wins.
+        :param pivot: The currency to triangulate through
+        :param rate_type: Optionally only use rates of this type - e.g. 'EOD'
+        """
+        self.pivot = pivot
+        self.rate_type = rate_type
+        self.direct = {}
+        timestamps = {}
+        for fx_rate in fx_rates:
+            if not fx_rate.active or fx_rate.rate is None or (rate_type and fx_rate.rate_type != rate_type):
+                continue
+            pair = pair_currencies(fx_rate.asset_id)
+            timestamp = fx_rate.rate_timestamp
+            if pair not in timestamps or timestamps[pair] is None or (timestamp is not None and
+                                                                       timestamp >= timestamps[pair]):
+                self.direct[pair] = fx_rate.rate
+                timestamps[pair] = timestamp
+        self._rates = {}
+
+    def currencies(self):
+        return sorted({currency for pair in self.direct for currency in pair})
+
+    def _direct(self, from_currency, to_currency):
+        if from_currency == to_currency:
+            return ONE
+        rate = self.direct.get((from_currency, to_currency))
+        if rate is not None:
+            return rate
+        rate = self.direct.get((to_currency, from_currency))
+        if rate:
+            return ONE / rate
+        return None
+
+    def get(self, from_currency, to_currency, default=None):
+        """
+        :return: The amount of to_currency for one unit of from_currency, or default if there is no rate
+        """
+        pair = (from_currency, to_currency)
+        if pair not in self._rates:
+            rate = self._direct(from_currency, to_currency)
+            if rate is None:
+                from_pivot = self._direct(from_currency, self.pivot)
+                pivot_to = self._direct(self.pivot, to_currency)
+                if from_pivot is not None and pivot_to is not None:
+                    rate = from_pivot * pivot_to
+            self._rates[pair] = rate
+        rate = self._rates[pair]
+        return default if rate is None else rate
+
+    def rate(self, from_currency, to_currency):
+        """
+        :return: The amount of to_currency for one unit of from_currency
+        :raises MissingFXRate: If there is no direct rate and no rates via the pivot
+        """
+        rate = self.get(from_currency, to_currency)
+        if rate is None:
+            raise MissingFXRate(from_currency, to_currency)
+        return rate
+
+    def convert(self, amount, from_currency, to_currency):
+        return amount * self.rate(from_currency, to_currency)
+
+
+class FXMatrix(object):
+    """
+    A dense matrix of the float conversion rates between every pair of currencies in a set of CrossRates, for
+    converting large numbers of amounts at once.  Row i, column j is the amount of currency j for one unit of
+    currency i, and NaN where there is no rate.
+    """
+
+    def __init__(self, cross_rates, currencies=None):
+        """
+        :param cross_rates: CrossRates
+        :param currencies: The currencies of the matrix - defaults to every currency with a rate
+        """
+        self.currencies = list(currencies or cross_rates.currencies())
+        self.index = {currency: index for index, currency in enumerate(self.currencies)}
+        nan = float('nan')
+        self.rates = array(str('d'))
+        for from_currency in self.currencies:
+            for to_currency in self.currencies:
+                rate = cross_rates.get(from_currency, to_currency)
+                self.rates.append(float(rate) if rate is not None else nan)
+
+    def rate(self, from_currency, to_currency):
+        """
+        :return: The rate, or NaN if either currency is not in the matrix or there is no rate
+        """
+        from_index = self.index.get(from_currency)
+        to_index = self.index.get(to_currency)
+        if from_index is None or to_index is None:
+            return float('nan')
+        return self.rates[from_index * len(self.currencies) + to_index]
+
+    def column(self, to_currency):
+        """
+        :return: A dict of from currency to the rate into to_currency
+        """
+        return {from_currency: self.rate(from_currency, to_currency) for from_currency in self.currencies}
+
+    def convert(self, amounts, from_currencies, to_currency):
+        """
+        :param amounts: A sequence of amounts
+        :param from_currencies: The currency of each amount (any iterable), or a single currency for all of them
+        :param to_currency:
+        :return: An array of the converted amounts, NaN where there is no rate
+        """
+        if isinstance(from_currencies, type_check):
+            rate = self.rate(from_currencies, to_currency)
+            return array(str('d'), [amount * rate for amount in amounts])
+        rates = self.column(to_currency)
+        nan = float('nan')
+        return array(str('d'), [amount * rates.get(currency, nan)
+                                for amount, currency in zip(amounts, from_currencies)])
+
+
+class FXRateCache(object):
+    """
+    The FX rates per business date and rate type, with the CrossRates and FXMatrix built from them the first time each
+    is needed.  A date which has no rates is retrieved from the MarketDataInterface once, keeping every rate type.
+    Rates can also be added directly, without an interface, in which case adding more rates for a date and rate type
+    rebuilds its CrossRates and FXMatrix.
+    """
+
+    def __init__(self, interface=None, asset_manager_id=None, pivot='USD', rate_type='EOD', fx_rates=None):
+        """
+        :param interface: A MarketDataInterface to retrieve the rates for dates which have not been added
+        :param asset_manager_id: The asset manager whose rates are retrieved
+        :param pivot: The currency to triangulate through
+        :param rate_type: The rate type for lookups which do not give one.  Defaults to EOD, so that a later intraday
+        rate does not replace the EOD rate - None uses the latest rate of any type.
+        :param fx_rates: A list of FXRates, for any business dates and rate types
+        """
+        self.interface = interface
+        self.asset_manager_id = asset_manager_id
+        self.pivot = pivot
+        self.rate_type = rate_type
+        # (business_date, rate_type) -> list of FXRates
+        self.fx_rates = {}
+        self.business_dates = set()
+        self.cross_rates_by_key = {}
+        self.matrices = {}
+        self.add_rates(fx_rates or [])
+
+    def _add(self, business_date, fx_rate):
+        key = (business_date, fx_rate.rate_type)
+        self.fx_rates.setdefault(key, []).append(fx_rate)
+        self.business_dates.add(business_date)
+        for cached in (self.cross_rates_by_key, self.matrices):
+            cached.pop(key, None)
+            cached.pop((business_date, None), None)
+
+    def add_rates(self, fx_rates):
+        """
+        :param fx_rates: FXRates, each stored under its own business_date
+        """
+        for fx_rate in fx_rates:
+            self._add(fx_rate.business_date, fx_rate)
+
+    def add(self, business_date, fx_rates):
+        """
+        :param business_date:
+        :param fx_rates: FXRates to use for the business date, whatever their own business_date
+        :return: The CrossRates for the business date
+        """
+        for fx_rate in fx_rates:
+            self._add(business_date, fx_rate)
+        return self.cross_rates(business_date)
+
+    def _rates(self, business_date, rate_type):
+        if business_date not in self.business_dates and self.interface is not None:
+            self.add_rates(self.interface.retrieve_fx_rates(asset_manager_id=self.asset_manager_id,
+                                                            business_date=business_date))
+        if rate_type is None:
+            fx_rates = [fx_rate for key, rates in self.fx_rates.items() if key[0] == business_date for fx_rate in rates]
+        else:
+            fx_rates = self.fx_rates.get((business_date, rate_type))
+        if not fx_rates:
+            raise ValueError('No %s FX rates for %s' % (rate_type or 'FX', business_date))
+        return fx_rates
+
+    def cross_rates(self, business_date, rate_type=None):
+        """
+        :param business_date:
+        :param rate_type: Defaults to the cache's rate type
+        :return: The CrossRates for the business date and rate type
+        :raises ValueError: If there are no rates of the type for the date, even after trying the interface
+        """
+        rate_type = rate_type or self.rate_type
+        key = (business_date, rate_type)
+        cross_rates = self.cross_rates_by_key.get(key)
+        if cross_rates is None:
+            cross_rates = self.cross_rates_by_key[key] = CrossRates(self._rates(business_date, rate_type),
+                                                                    pivot=self.pivot, rate_type=rate_type)
+        return cross_rates
+
+    def matrix(self, business_date, rate_type=None):
+        """
+        :return: The FXMatrix for the business date and rate type - see cross_rates
+        """
+        rate_type = rate_type or self.rate_type
+        key = (business_date, rate_type)
+        matrix = self.matrices.get(key)
+        if matrix is None:
+            matrix = self.matrices[key] = FXMatrix(self.cross_rates(business_date, rate_type))
+        return matrix
+
+    def convert(self, amounts, from_currencies, to_currency, business_date, rate_type=None):
+        """
+        See FXMatrix.convert.
+        """
+        return self.matrix(business_date, rate_type).convert(amounts, from_currencies, to_currency)
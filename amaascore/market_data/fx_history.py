@@ -0,0 +1,111 @@
+"""
+As-of lookups over intraday FX rates.  The rates for each pair and rate type are kept sorted by rate_timestamp, so the
+rate in force at any time is found by bisection.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+import pytz
+
+from amaascore.market_data.fx import ONE, pair_currencies, type_check
+
+EPOCH = datetime(1970, 1, 1, tzinfo=pytz.utc)
+
+
+def timestamp_seconds(timestamp):
+    """
+    :param timestamp: A datetime - naive datetimes (e.g. Transaction.execution_time) are treated as UTC
+    :return: The number of seconds since the epoch
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=pytz.utc)
+    return (timestamp - EPOCH).total_seconds()
+
+
+class FXRateHistory(object):
+    """
+    Per (asset_id, rate_type), the rate timestamps as seconds since the epoch in an array of doubles and the Decimal
+    rates in a parallel list.  A pair which is only held the other way round (e.g. JPYUSD for USDJPY) is answered
+    with the inverse rate.
+    """
+
+    def __init__(self, fx_rates=None):
+        # (asset_id, rate_type) -> (timestamps, rates)
+        self.series = {}
+        for fx_rate in fx_rates or []:
+            self.add(fx_rate)
+
+    def add(self, fx_rate):
+        """
+        :param fx_rate: An FXRate.  Inactive rates and rates without a rate_timestamp are ignored, and a rate with the
+        same timestamp as an existing one replaces it.
+        :return: True if the rate was added
+        """
+        # FXRate only sets rate_timestamp if it is given one
+        rate_timestamp = getattr(fx_rate, 'rate_timestamp', None)
+        if not fx_rate.active or fx_rate.rate is None or rate_timestamp is None:
+            return False
+        timestamps, rates = self.series.setdefault((fx_rate.asset_id, fx_rate.rate_type), (array(str('d')), []))
+        seconds = timestamp_seconds(rate_timestamp)
+        index = bisect_right(timestamps, seconds)
+        if index and timestamps[index - 1] == seconds:
+            rates[index - 1] = fx_rate.rate
+        else:
+            timestamps.insert(index, seconds)
+            rates.insert(index, fx_rate.rate)
+        return True
+
+    def add_rates(self, fx_rates):
+        for fx_rate in fx_rates:
+            self.add(fx_rate)
+
+    def _series(self, asset_id, rate_type):
+        # The series and whether its rates need to be inverted
+        series = self.series.get((asset_id, rate_type))
+        if series is not None:
+            return series, False
+        base, counter = pair_currencies(asset_id)
+        series = self.series.get((counter + base, rate_type))
+        return series, True
+
+    def rate_as_of(self, asset_id, timestamp, rate_type='Intraday'):
+        """
+        :param asset_id: The FX asset_id - e.g. USDJPY
+        :param timestamp: A datetime
+        :param rate_type:
+        :return: The latest rate at or before the timestamp, or None if there is none
+        """
+        return self.rates_as_of(asset_id, [timestamp], rate_type)[0]
+
+    def rates_as_of(self, asset_ids, timestamps, rate_type='Intraday'):
+        """
+        Look up many rates in one call - e.g. to price a batch of executions by execution_time.
+        :param asset_ids: An FX asset_id for all of the timestamps, or a list with one per timestamp
+        :param timestamps: A list of datetimes
+        :param rate_type:
+        :return: A list of the rate in force at each timestamp, None where there is no earlier rate (or the rate is zero
+        and has to be inverted, as in CrossRates)
+        """
+        if isinstance(asset_ids, type_check):
+            asset_ids = [asset_ids] * len(timestamps)
+        lookups = {}
+        results = []
+        for asset_id, timestamp in zip(asset_ids, timestamps):
+            lookup = lookups.get(asset_id)
+            if lookup is None:
+                lookup = lookups[asset_id] = self._series(asset_id, rate_type)
+            series, inverse = lookup
+            if series is None:
+                results.append(None)
+                continue
+            index = bisect_right(series[0], timestamp_seconds(timestamp))
+            if not index:
+                results.append(None)
+            else:
+                rate = series[1][index - 1]
+                if inverse:
+                    rate = ONE / rate if rate else None
+                results.append(rate)
+        return results
@@ -1,12 +1,12 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date, datetime
-from dateutil.parser import parse
 from decimal import Decimal
 import pytz
 import sys
 
 from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.date_utils import parse_date, parse_datetime
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -62,7 +62,7 @@ class FXRate(AMaaSModel):
         """
         if business_date is not None:
             if isinstance(business_date, type_check):
-                self._business_date = parse(business_date).date()
+                self._business_date = parse_date(business_date)
             else:
                 self._business_date= business_date
 
@@ -79,7 +79,7 @@ class FXRate(AMaaSModel):
         """
         if rate_timestamp is not None:
             if isinstance(rate_timestamp, (str, type_check)):
-                rate_timestamp = parse(rate_timestamp).replace(tzinfo=pytz.utc)
+                rate_timestamp = parse_datetime(rate_timestamp).replace(tzinfo=pytz.utc)
             if type(rate_timestamp) == date:
                 rate_timestamp = datetime.combine(rate_timestamp, datetime.min.time()).replace(tzinfo=pytz.utc)
             if not rate_timestamp.tzinfo:
@@ -1,11 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 import logging
 
 from amaascore.config import ENVIRONMENT
-from amaascore.core.amaas_model import json_handler
 from amaascore.core.interface import Interface
+from amaascore.core.json_codec import decode
 from amaascore.market_data.utils import json_to_eod_price, json_to_fx_rate
 
 
@@ -31,7 +30,7 @@ class MarketDataInterface(Interface):
         eod_prices_json = [eod_price.to_interface() for eod_price in eod_prices]
         response = self.session.post(url, params=params, json=eod_prices_json)
         if response.ok:
-            eod_prices = [json_to_eod_price(eod_price) for eod_price in response.json()]
+            eod_prices = [json_to_eod_price(eod_price) for eod_price in decode(response.content)]
             return eod_prices
         else:
             self.logger.error(response.text)
@@ -43,7 +42,7 @@ class MarketDataInterface(Interface):
         params = {'asset_ids': ','.join(asset_ids)} if asset_ids else {}
         response = self.session.get(url=url, params=params)
         if response.ok:
-            eod_prices = [json_to_eod_price(eod_price) for eod_price in response.json()]
+            eod_prices = [json_to_eod_price(eod_price) for eod_price in decode(response.content)]
             self.logger.info('Returned %s EOD Prices.', len(eod_prices))
             return eod_prices
         else:
@@ -53,11 +52,10 @@ class MarketDataInterface(Interface):
     def roll_prices(self, asset_manager_id, previous_date, asset_ids, update_existing_prices=False):
         url = '%s/roll-prices/%s' % (self.endpoint, asset_manager_id)
         params = {'update_existing_prices': update_existing_prices}
-        json_body = json.loads(json.dumps({'previous_date': previous_date,
-                                           'asset_ids': ','.join(asset_ids)}, default=json_handler))
+        json_body = {'previous_date': previous_date, 'asset_ids': ','.join(asset_ids)}
         response = self.session.post(url=url, params=params, json=json_body)
         if response.ok:
-            prices = [json_to_eod_price(price) for price in response.json()]
+            prices = [json_to_eod_price(price) for price in decode(response.content)]
             self.logger.info('Rolled %s Prices.', len(prices))
             return prices
         else:
@@ -79,7 +77,7 @@ class MarketDataInterface(Interface):
         fx_rates_json = [fx_rate.to_interface() for fx_rate in fx_rates]
         response = self.session.post(url, params=params, json=fx_rates_json)
         if response.ok:
-            fx_rates = [json_to_fx_rate(fx_rate) for fx_rate in response.json()]
+            fx_rates = [json_to_fx_rate(fx_rate) for fx_rate in decode(response.content)]
             return fx_rates
         else:
             self.logger.error(response.text)
@@ -91,7 +89,7 @@ class MarketDataInterface(Interface):
         params = {'asset_ids': ','.join(asset_ids)} if asset_ids else {}
         response = self.session.get(url=url, params=params)
         if response.ok:
-            fx_rates = [json_to_fx_rate(fx_rate) for fx_rate in response.json()]
+            fx_rates = [json_to_fx_rate(fx_rate) for fx_rate in decode(response.content)]
             self.logger.info('Returned %s FX Rates.', len(fx_rates))
             return fx_rates
         else:
@@ -106,11 +104,11 @@ class MarketDataInterface(Interface):
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
         if response.ok:
-            eod_price_count = response.json().get('eod_price_count', 'Unknown')
+            eod_price_count = decode(response.content).get('eod_price_count', 'Unknown')
             self.logger.info('Deleted %s EOD Prices.', eod_price_count)
-            fx_rate_count = response.json().get('fx_rate_count', 'Unknown')
+            fx_rate_count = decode(response.content).get('fx_rate_count', 'Unknown')
             self.logger.info('Deleted %s FX Rates.', fx_rate_count)
-            return response.json()
+            return decode(response.content)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
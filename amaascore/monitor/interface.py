@@ -4,6 +4,7 @@ import logging
 
 from amaascore.config import ENVIRONMENT
 from amaascore.core.interface import Interface
+from amaascore.core.json_codec import decode
 from amaascore.monitor.utils import json_to_item
 
 
@@ -17,7 +18,7 @@ class MonitorInterface(Interface):
         url = '%s/items/%s' % (self.endpoint, item.asset_manager_id)
         response = self.session.post(url, json=item.to_interface())
         if response.ok:
-            item = json_to_item(response.json())
+            item = json_to_item(decode(response.content))
             return item
         else:
             self.logger.error(response.text)
@@ -27,7 +28,7 @@ class MonitorInterface(Interface):
         url = '%s/items/%s/%s' % (self.endpoint, asset_manager_id, item_id)
         response = self.session.patch(url)
         if response.ok:
-            item = json_to_item(response.json())
+            item = json_to_item(decode(response.content))
             return item
         else:
             self.logger.error(response.text)
@@ -37,7 +38,7 @@ class MonitorInterface(Interface):
         url = '%s/items/%s/%s' % (self.endpoint, asset_manager_id, item_id)
         response = self.session.get(url)
         if response.ok:
-            return json_to_item(response.json())
+            return json_to_item(decode(response.content))
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -62,7 +63,7 @@ class MonitorInterface(Interface):
         url = self.endpoint + '/items'
         response = self.session.get(url, params=search_params)
         if response.ok:
-            items = [json_to_item(json_item) for json_item in response.json()]
+            items = [json_to_item(json_item) for json_item in decode(response.content)]
             self.logger.info('Returned %s Items.', len(items))
             return items
         else:
@@ -74,7 +75,7 @@ class MonitorInterface(Interface):
         url = '%s/items/%s' % (self.endpoint, asset_manager_id)
         response = self.session.get(url)
         if response.ok:
-            items = [json_to_item(json_item) for json_item in response.json()]
+            items = [json_to_item(json_item) for json_item in decode(response.content)]
             self.logger.info('Returned %s Items.', len(items))
             return items
         else:
@@ -89,7 +90,7 @@ class MonitorInterface(Interface):
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
         if response.ok:
-            count = response.json().get('count', 'Unknown')
+            count = decode(response.content).get('count', 'Unknown')
             self.logger.info('Deleted %s Items.', count)
             return count
         else:
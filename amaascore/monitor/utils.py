@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.interning import intern_json
 from amaascore.monitor.item import Item
 
 
 def json_to_item(json_item):
+    json_item = intern_json(json_item)
     item = Item(**json_item)
     return item
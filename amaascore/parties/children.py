@@ -3,7 +3,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import re
 
 from amaascore.error_messages import ERROR_LOOKUP
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, FrozenModel
 
 
 class Address(AMaaSModel):
@@ -95,4 +95,29 @@ class Comment(AMaaSModel):
     def __init__(self, comment_value, active=True, *args, **kwargs):
         self.comment_value = comment_value
         self.active = active
-        super(Comment, self).__init__(*args, **kwargs)
\ No newline at end of file
+        super(Comment, self).__init__(*args, **kwargs)
+
+
+class FrozenAddress(FrozenModel):
+    model_class = Address
+    attributes = ('line_one', 'line_two', 'city', 'region', 'postal_code', 'country_id', 'address_primary', 'active')
+
+
+class FrozenEmail(FrozenModel):
+    model_class = Email
+    attributes = ('email', 'email_primary', 'active')
+
+
+class FrozenLink(FrozenModel):
+    model_class = Link
+    attributes = ('linked_party_id', 'active')
+
+
+class FrozenReference(FrozenModel):
+    model_class = Reference
+    attributes = ('reference_value', 'active')
+
+
+class FrozenComment(FrozenModel):
+    model_class = Comment
+    attributes = ('comment_value', 'active')
@@ -1,8 +1,8 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from dateutil.parser import parse
 import sys
 
+from amaascore.core.date_utils import parse_date
 from amaascore.parties.party import Party
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
@@ -40,4 +40,4 @@ class Individual(Party):
         :return:
         """
         if value:
-            self._date_of_birth = parse(value).date() if isinstance(value, type_check) else value
+            self._date_of_birth = parse_date(value) if isinstance(value, type_check) else value
@@ -1,11 +1,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 import logging
 
 from amaascore.config import ENVIRONMENT
-from amaascore.core.amaas_model import json_handler
+from amaascore.core.diff import minimal_updates
 from amaascore.core.interface import Interface
+from amaascore.core.json_codec import decode
 from amaascore.parties.utils import json_to_party
 
 
@@ -20,18 +20,25 @@ class PartiesInterface(Interface):
         url = '%s/parties/%s' % (self.endpoint, party.asset_manager_id)
         response = self.session.post(url, json=party.to_interface())
         if response.ok:
-            party = json_to_party(response.json())
+            party = json_to_party(decode(response.content))
             return party
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def amend(self, party):
+    def amend(self, party, minimal=False):
+        """
+        :param party: The amended party
+        :param minimal: Only send the attributes which have changed since the party was retrieved, as a partial amend
+        :return:
+        """
+        if minimal:
+            return self.amend_minimal(party)
         self.logger.info('Amend Party - Asset Manager: %s - Party ID: %s', party.asset_manager_id, party.party_id)
         url = '%s/parties/%s/%s' % (self.endpoint, party.asset_manager_id, party.party_id)
         response = self.session.put(url, json=party.to_interface())
         if response.ok:
-            party = json_to_party(response.json())
+            party = json_to_party(decode(response.content))
             return party
         else:
             self.logger.error(response.text)
@@ -41,15 +48,27 @@ class PartiesInterface(Interface):
         self.logger.info('Partial Amend Asset - Asset Manager: %s - Party ID: %s', asset_manager_id,
                          party_id)
         url = '%s/parties/%s/%s' % (self.endpoint, asset_manager_id, party_id)
-        # Setting handler ourselves so we can be sure Decimals work
-        response = self.session.patch(url, data=json.dumps(updates, default=json_handler), headers=self.json_header)
+        # The session encodes the body with the json codec, so Decimals and dates are handled
+        response = self.session.patch(url, json=updates)
         if response.ok:
-            party = json_to_party(response.json())
+            party = json_to_party(decode(response.content))
             return party
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
+    def amend_minimal(self, party):
+        # Without a clean state to compare against, compare against the version in AMaaS
+        original = None
+        if not party.tracks_changes():
+            original = self.retrieve(asset_manager_id=party.asset_manager_id, party_id=party.party_id)
+        updates = minimal_updates(party, original)
+        if not updates:
+            self.logger.info('No changes to Party - Asset Manager: %s - Party ID: %s', party.asset_manager_id,
+                             party.party_id)
+            return party
+        return self.partial(asset_manager_id=party.asset_manager_id, party_id=party.party_id, updates=updates)
+
     def retrieve(self, asset_manager_id, party_id, version=None):
         self.logger.info('Retrieve Party - Asset Manager: %s - Party ID: %s', asset_manager_id, party_id)
         url = '%s/parties/%s/%s' % (self.endpoint, asset_manager_id, party_id)
@@ -57,7 +76,10 @@ class PartiesInterface(Interface):
             url += '?version=%d' % int(version)
         response = self.session.get(url)
         if response.ok:
-            return json_to_party(response.json())
+            party = json_to_party(decode(response.content))
+            # Changes made from here can be sent with amend(minimal=True)
+            party.mark_clean()
+            return party
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -84,19 +106,25 @@ class PartiesInterface(Interface):
         url = self.endpoint + '/parties'
         response = self.session.get(url, params=search_params)
         if response.ok:
-            parties = [json_to_party(json_party) for json_party in response.json()]
+            parties = [json_to_party(json_party) for json_party in decode(response.content)]
             self.logger.info('Returned %s Parties.', len(parties))
             return parties
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def parties_by_asset_manager(self, asset_manager_id):
+    def parties_by_asset_manager(self, asset_manager_id, updated_since=None):
+        """
+        :param asset_manager_id:
+        :param updated_since: Optionally, only return the parties updated since this time (an ISO 8601 string)
+        :return:
+        """
         self.logger.info('Retrieve Parties by Asset Manager: %s', asset_manager_id)
         url = '%s/parties/%s' % (self.endpoint, asset_manager_id)
-        response = self.session.get(url)
+        params = {'updated_since': updated_since} if updated_since else {}
+        response = self.session.get(url, params=params)
         if response.ok:
-            parties = [json_to_party(json_party) for json_party in response.json()]
+            parties = [json_to_party(json_party) for json_party in decode(response.content)]
             self.logger.info('Returned %s Parties.', len(parties))
             return parties
         else:
@@ -111,7 +139,7 @@ class PartiesInterface(Interface):
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
         if response.ok:
-            count = response.json().get('count', 'Unknown')
+            count = decode(response.content).get('count', 'Unknown')
             self.logger.info('Deleted %s Parties.', count)
             return count
         else:
@@ -1,7 +1,5 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import copy
-
 from amaascore.error_messages import ERROR_LOOKUP
 from amaascore.core.amaas_model import AMaaSModel
 from amaascore.core.comment import Comment
@@ -39,7 +37,8 @@ class Party(AMaaSModel):
         super(Party, self).__init__(*args, **kwargs)
 
     def upsert_address(self, address_type, address):
-        addresses = copy.deepcopy(self.addresses)
+        # Copy on write so that the existing addresses are untouched if the new set fails validation
+        addresses = self.addresses.copy()
         addresses.update({address_type: address})
         self.addresses = addresses
 
@@ -60,7 +59,7 @@ class Party(AMaaSModel):
         self._addresses = addresses
 
     def upsert_email(self, email_type, email):
-        emails = copy.deepcopy(self.emails)
+        emails = self.emails.copy()
         emails.update({email_type: email})
         self.emails = emails
 
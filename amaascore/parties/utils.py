@@ -2,6 +2,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import inspect
 
+from amaascore.core.interning import intern_json
+
 #  All possible class names must be inserted into the globals collection.
 #  If there is a better way of doing this, please suggest!
 from amaascore.parties.broker import Broker
@@ -16,6 +18,7 @@ from amaascore.parties.sub_fund import SubFund
 
 
 def json_to_party(json_to_convert):
+    json_to_convert = intern_json(json_to_convert)
     # Iterate through the party children, converting the various JSON attributes into the relevant class type
     for (collection_name, clazz) in Party.children().items():
         children = json_to_convert.pop(collection_name, {})
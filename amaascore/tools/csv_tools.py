@@ -2,6 +2,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import csv
 
+from amaascore.core.interning import intern_json
+
 
 def csv_filename_to_objects(filename, json_handler):
     with open(filename, 'r') as f:
@@ -13,7 +15,8 @@ def csv_stream_to_objects(stream, json_handler, params=dict()):
     reader = csv.DictReader(stream)
     objects = []
     for row in reader:
-        objects.append(json_handler(row, params))
+        # Rows typically repeat the same handful of IDs and enum values - DictReader already shares the column names
+        objects.append(json_handler(intern_json(row), params))
     return objects
 
 
@@ -0,0 +1,111 @@
+"""
+Skip-if-unchanged uploads for reference data (assets, parties, books etc).  The content digest of everything sent to
+AMaaS is kept in a local store, so a daily reload only sends the objects which are new or have changed since the last
+run.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import logging
+import os
+
+from amaascore.core.file_utils import save_json
+
+
+class DigestStore(object):
+    """
+    The content digests of the uploaded objects, per asset manager and namespace (e.g. asset_id), optionally persisted
+    to a JSON file.
+    """
+
+    def __init__(self, filename=None):
+        """
+        :param filename: The JSON file to load from and save to.  If None, the digests are only held in memory.
+        """
+        self.filename = filename
+        self.digests = {}
+        if filename and os.path.exists(filename):
+            with open(filename, 'r') as f:
+                self.digests = json.load(f)
+
+    def _digests(self, asset_manager_id, namespace):
+        return self.digests.setdefault(str(asset_manager_id), {}).setdefault(namespace, {})
+
+    def get(self, asset_manager_id, namespace, key):
+        return self.digests.get(str(asset_manager_id), {}).get(namespace, {}).get(str(key))
+
+    def set(self, asset_manager_id, namespace, key, digest):
+        self._digests(asset_manager_id, namespace)[str(key)] = digest
+
+    def remove(self, asset_manager_id, namespace, key):
+        self._digests(asset_manager_id, namespace).pop(str(key), None)
+
+    def clear(self, asset_manager_id, namespace=None):
+        if namespace is None:
+            self.digests.pop(str(asset_manager_id), None)
+        else:
+            self.digests.get(str(asset_manager_id), {}).pop(namespace, None)
+
+    def save(self):
+        if self.filename:
+            save_json(self.filename, self.digests)
+
+
+class DigestUploader(object):
+    """
+    Sends objects through an interface's new/amend only when their content digest differs from the stored one.
+    """
+
+    def __init__(self, interface, store, id_attribute, namespace=None, logger=None):
+        """
+        :param interface: The interface to upload with - e.g. an AssetsInterface
+        :param store: A DigestStore
+        :param id_attribute: The attribute which identifies the object within the asset manager - e.g. asset_id
+        :param namespace: The namespace for the digests in the store.  Defaults to id_attribute.
+        :param logger:
+        """
+        self.interface = interface
+        self.store = store
+        self.id_attribute = id_attribute
+        self.namespace = namespace or id_attribute
+        self.logger = logger or logging.getLogger(__name__)
+
+    def seed(self, models):
+        """
+        Record the digests of objects which already exist in AMaaS without sending them - e.g. the results of
+        assets_by_asset_manager before the first upload, so that unchanged objects are not re-sent.
+        :param models: The objects as currently stored in AMaaS
+        :return:
+        """
+        for model in models:
+            self.store.set(model.asset_manager_id, self.namespace, getattr(model, self.id_attribute),
+                           model.content_digest())
+        self.store.save()
+
+    def upload(self, models):
+        """
+        :param models: The objects to upload
+        :return: A dict of 'new', 'amended' and 'unchanged' to the lists of the object IDs in each case
+        """
+        results = {'new': [], 'amended': [], 'unchanged': []}
+        try:
+            for model in models:
+                key = getattr(model, self.id_attribute)
+                digest = model.content_digest()
+                stored_digest = self.store.get(model.asset_manager_id, self.namespace, key)
+                if stored_digest == digest:
+                    results['unchanged'].append(key)
+                    continue
+                if stored_digest is None:
+                    self.interface.new(model)
+                    results['new'].append(key)
+                else:
+                    self.interface.amend(model)
+                    results['amended'].append(key)
+                self.store.set(model.asset_manager_id, self.namespace, key, digest)
+        finally:
+            # Keep the digests of everything that was sent, even if a later object fails
+            self.store.save()
+        self.logger.info('Upload complete - New: %s - Amended: %s - Unchanged: %s', len(results['new']),
+                         len(results['amended']), len(results['unchanged']))
+        return results
@@ -74,7 +74,8 @@ def generate_transaction(asset_manager_id=None, asset_book_id=None, counterparty
     transaction.charges.update(charges)
     transaction.codes.update(codes)
     transaction.comments.update(comments)
-    transaction.links.update(links)
+    for link_type, link_set in links.items():
+        transaction.upsert_link_set(link_type, link_set)
     transaction.parties.update(parties)
     transaction.rates.update(rates)
     transaction.references.update(references)
@@ -86,6 +87,8 @@ def generate_cash_transaction(asset_manager_id=None, asset_book_id=None, counter
                               transaction_action=None, transaction_type=None,
                               transaction_status=None):
     transaction_type = transaction_type or random.choice(list(CASH_TRANSACTION_TYPES))
+    # The asset of a cash transaction is its currency
+    asset_id = asset_id or random.choice(['SGD', 'USD'])
     common = generate_common(asset_manager_id=asset_manager_id, asset_book_id=asset_book_id,
                              counterparty_book_id=counterparty_book_id, asset_id=asset_id, quantity=quantity,
                              transaction_date=transaction_date, transaction_id=transaction_id,
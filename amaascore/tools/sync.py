@@ -0,0 +1,154 @@
+"""
+Incremental sync of local replicas of transactions, assets, parties and books.  The latest updated_time seen for each
+entity type and asset manager is kept as a watermark, so each sync only fetches the records which have changed since
+the previous one rather than re-downloading everything.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import logging
+import os
+import sys
+
+from amaascore.core.date_utils import parse_datetime
+from amaascore.core.file_utils import save_json
+
+type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
+
+# The *_by_asset_manager method and ID attribute for each entity type
+ENTITY_TYPES = {
+    'transactions': ('transactions_by_asset_manager', 'transaction_id'),
+    'assets': ('assets_by_asset_manager', 'asset_id'),
+    'parties': ('parties_by_asset_manager', 'party_id'),
+    'books': ('books_by_asset_manager', 'book_id'),
+}
+
+
+def _as_datetime(value):
+    return parse_datetime(value) if isinstance(value, type_check) else value
+
+
+class WatermarkStore(object):
+    """
+    The highest updated_time seen per entity type and asset manager, optionally persisted to a JSON file.
+    """
+
+    def __init__(self, filename=None):
+        """
+        :param filename: The JSON file to load from and save to.  If None, the watermarks are only held in memory.
+        """
+        self.filename = filename
+        self.watermarks = {}
+        if filename and os.path.exists(filename):
+            with open(filename, 'r') as f:
+                self.watermarks = json.load(f)
+
+    def get(self, entity_type, asset_manager_id):
+        """
+        :return: A dict of updated_time (ISO 8601 string), or None if the entity type has never been synced
+        """
+        return self.watermarks.get(entity_type, {}).get(str(asset_manager_id))
+
+    def set(self, entity_type, asset_manager_id, updated_time):
+        self.watermarks.setdefault(entity_type, {})[str(asset_manager_id)] = {'updated_time': updated_time}
+
+    def clear(self, entity_type, asset_manager_id):
+        self.watermarks.get(entity_type, {}).pop(str(asset_manager_id), None)
+
+    def save(self):
+        if self.filename:
+            save_json(self.filename, self.watermarks)
+
+
+class Replica(object):
+    """
+    A local copy of one entity type, keeping the latest version of each record.  A TransactionStore can be used
+    instead for transactions, to get its search indexes.
+    """
+
+    def __init__(self, id_attribute):
+        self.id_attribute = id_attribute
+        self.models = {}
+
+    def __len__(self):
+        return len(self.models)
+
+    def get(self, asset_manager_id, model_id):
+        return self.models.get((asset_manager_id, model_id))
+
+    def add(self, model):
+        """
+        :param model:
+        :return: True if the model was stored, False if a later version is already in the replica.  As with
+        TransactionStore.add, the same version replaces the stored copy.
+        """
+        key = (model.asset_manager_id, getattr(model, self.id_attribute))
+        existing = self.models.get(key)
+        if existing is not None and model.version < existing.version:
+            return False
+        self.models[key] = model
+        return True
+
+
+class SyncManager(object):
+    """
+    Keeps replicas up to date from the *_by_asset_manager calls, passing the watermark as updated_since.
+    """
+
+    def __init__(self, interfaces, watermarks=None, replicas=None, logger=None):
+        """
+        :param interfaces: A dict of entity type (e.g. 'transactions') to its interface
+        :param watermarks: A WatermarkStore.  Defaults to an in-memory store.
+        :param replicas: Optionally, a dict of entity type to the replica to merge into (anything with get and add
+        methods, where add respects versions).  Defaults to a Replica per entity type.
+        :param logger:
+        """
+        for entity_type in interfaces:
+            if entity_type not in ENTITY_TYPES:
+                raise ValueError('Invalid entity type: %s' % entity_type)
+        self.interfaces = interfaces
+        self.watermarks = watermarks or WatermarkStore()
+        self.replicas = replicas or {}
+        for entity_type in interfaces:
+            if entity_type not in self.replicas:
+                self.replicas[entity_type] = Replica(ENTITY_TYPES[entity_type][1])
+        self.logger = logger or logging.getLogger(__name__)
+
+    def sync(self, entity_type, asset_manager_id):
+        """
+        Fetch the records changed since the last sync and merge them into the replica.
+        :param entity_type: 'transactions', 'assets', 'parties' or 'books'
+        :param asset_manager_id:
+        :return: The records which were new or newer than the replica's copy
+        """
+        method_name, id_attribute = ENTITY_TYPES[entity_type]
+        fetch = getattr(self.interfaces[entity_type], method_name)
+        watermark = self.watermarks.get(entity_type, asset_manager_id)
+        if watermark:
+            models = fetch(asset_manager_id, updated_since=watermark['updated_time'])
+        else:
+            models = fetch(asset_manager_id)
+        replica = self.replicas[entity_type]
+        updated_time = _as_datetime(watermark['updated_time']) if watermark else None
+        changed = []
+        for model in models:
+            existing = replica.get(model.asset_manager_id, getattr(model, id_attribute))
+            # Records at the watermark time are fetched again by the next sync, so only a new version counts as a change
+            if replica.add(model) and (existing is None or existing.version != model.version):
+                changed.append(model)
+            model_updated_time = _as_datetime(model.updated_time)
+            if model_updated_time is not None and (updated_time is None or model_updated_time > updated_time):
+                updated_time = model_updated_time
+        if updated_time is not None:
+            self.watermarks.set(entity_type, asset_manager_id, updated_time.isoformat())
+            self.watermarks.save()
+        self.logger.info('Synced %s - Asset Manager: %s - Fetched: %s - Changed: %s', entity_type, asset_manager_id,
+                         len(models), len(changed))
+        return changed
+
+    def sync_all(self, asset_manager_id):
+        """
+        :param asset_manager_id:
+        :return: A dict of entity type to the changed records
+        """
+        return {entity_type: self.sync(entity_type, asset_manager_id) for entity_type in self.interfaces}
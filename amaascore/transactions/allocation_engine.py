@@ -0,0 +1,170 @@
+"""
+Client-side allocation of block transactions.  The child quantities (and the pro-rata share of each charge) are
+calculated column by column for the whole fan-out, rounded deterministically to the lot size, and validated before
+being sent to TransactionsInterface.allocate_transaction.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal, ROUND_FLOOR
+
+ALLOCATION_TYPES = {'asset_manager', 'counterparty'}
+
+
+def _largest_remainder(total_units, weights):
+    """
+    Split an integer number of units in proportion to the weights.  Each share is rounded down, and the units left
+    over go to the largest remainders, with ties going to the earlier entries so the result is deterministic.
+    """
+    weight_total = sum(weights)
+    if weight_total <= 0:
+        raise ValueError('The allocation weights must sum to more than zero')
+    exact = [total_units * weight / weight_total for weight in weights]
+    units = [int(share.to_integral_value(rounding=ROUND_FLOOR)) for share in exact]
+    left_over = total_units - sum(units)
+    by_remainder = sorted(range(len(exact)), key=lambda index: (units[index] - exact[index], index))
+    for index in by_remainder[:left_over]:
+        units[index] += 1
+    return units
+
+
+def allocate_quantities(total, weights, lot_size=Decimal(1)):
+    """
+    :param total: The quantity to split - e.g. the block transaction's quantity
+    :param weights: The relative size of each allocation
+    :param lot_size: Every allocation is a whole number of lots
+    :return: A list of Decimal quantities which sum exactly to the total
+    """
+    total, lot_size = Decimal(total), Decimal(lot_size)
+    weights = [Decimal(weight) for weight in weights]
+    if any(weight < 0 for weight in weights):
+        raise ValueError('The allocation weights cannot be negative')
+    lots = total / lot_size
+    if lots != lots.to_integral_value():
+        raise ValueError('Quantity %s is not a whole number of lots of %s' % (total, lot_size))
+    return [lot_size * units for units in _largest_remainder(int(lots), weights)]
+
+
+def prorate(amount, quantities, precision=Decimal('0.01')):
+    """
+    :param amount: The amount to split - e.g. a charge on the block transaction
+    :param quantities: The allocated quantities
+    :param precision: The smallest unit of the amount
+    :return: A list of Decimal amounts in proportion to the quantities which sum exactly to the amount
+    """
+    amount, precision = Decimal(amount), Decimal(precision)
+    sign = -1 if amount < 0 else 1
+    units = (abs(amount) / precision).to_integral_value(rounding=ROUND_FLOOR)
+    # Any amount below the precision is kept on the largest allocation (the first of equals) so that nothing is lost
+    residual = abs(amount) - units * precision
+    shares = [precision * share for share in _largest_remainder(int(units), quantities)]
+    if shares:
+        shares[max(range(len(quantities)), key=lambda index: (quantities[index], -index))] += residual
+    return [sign * share for share in shares]
+
+
+class Allocation(object):
+    """
+    The proposed allocations of a block transaction, held as columns - one entry per child in each list.
+    """
+
+    def __init__(self, transaction, book_ids, quantities, charges, transaction_ids=None, lot_size=Decimal(1)):
+        """
+        :param transaction: The block Transaction
+        :param book_ids: The book for each allocation
+        :param quantities: The quantity for each allocation
+        :param charges: A dict of charge type to the list of the charge value for each allocation
+        :param transaction_ids: Optionally, the transaction_id for each allocation
+        :param lot_size:
+        """
+        self.transaction = transaction
+        self.book_ids = book_ids
+        self.quantities = quantities
+        self.charges = charges
+        self.transaction_ids = transaction_ids
+        self.lot_size = Decimal(lot_size)
+
+    def __len__(self):
+        return len(self.book_ids)
+
+    def validate(self):
+        """
+        Check that the allocations add back up to the block transaction.
+        :return:
+        """
+        if len(set(self.book_ids)) != len(self.book_ids):
+            raise ValueError('Duplicate book in allocations for transaction %s' % self.transaction.transaction_id)
+        if len(self.quantities) != len(self.book_ids):
+            raise ValueError('Expected %s quantities but found %s' % (len(self.book_ids), len(self.quantities)))
+        if self.transaction_ids is not None and len(self.transaction_ids) != len(self.book_ids):
+            raise ValueError('Expected %s transaction IDs but found %s' % (len(self.book_ids),
+                                                                           len(self.transaction_ids)))
+        for quantity in self.quantities:
+            if quantity < 0 or quantity % self.lot_size:
+                raise ValueError('Invalid allocation quantity %s for lot size %s' % (quantity, self.lot_size))
+        if sum(self.quantities) != self.transaction.quantity:
+            raise ValueError('Allocated quantity %s does not match transaction quantity %s' %
+                             (sum(self.quantities), self.transaction.quantity))
+        for charge_type, values in self.charges.items():
+            if sum(values) != self.transaction.charges[charge_type].charge_value:
+                raise ValueError('Allocated %s charges do not match the transaction' % charge_type)
+
+    def allocation_dicts(self):
+        """
+        :return: The allocations in the format expected by TransactionsInterface.allocate_transaction, each with its
+        share of the block transaction's charges
+        """
+        allocation_dicts = [{'book_id': book_id, 'quantity': quantity, 'charges': {}}
+                            for book_id, quantity in zip(self.book_ids, self.quantities)]
+        for charge_type, values in self.charges.items():
+            charge = self.transaction.charges[charge_type]
+            for allocation_dict, value in zip(allocation_dicts, values):
+                allocation_dict['charges'][charge_type] = {'charge_value': value, 'currency': charge.currency,
+                                                           'net_affecting': charge.net_affecting}
+        if self.transaction_ids is not None:
+            for allocation_dict, transaction_id in zip(allocation_dicts, self.transaction_ids):
+                allocation_dict['transaction_id'] = transaction_id
+        return allocation_dicts
+
+    def submit(self, interface, allocation_type='asset_manager'):
+        """
+        Validate the allocations, then send them to AMaaS.
+        :param interface: A TransactionsInterface
+        :param allocation_type: 'asset_manager' or 'counterparty'
+        :return: The allocated transactions
+        """
+        if allocation_type not in ALLOCATION_TYPES:
+            raise ValueError('Invalid allocation type: %s' % allocation_type)
+        self.validate()
+        return interface.allocate_transaction(asset_manager_id=self.transaction.asset_manager_id,
+                                              transaction_id=self.transaction.transaction_id,
+                                              allocation_type=allocation_type,
+                                              allocation_dicts=self.allocation_dicts())
+
+
+def allocate(transaction, book_ids, weights=None, quantities=None, lot_size=Decimal(1),
+             charge_precision=Decimal('0.01'), transaction_ids=None):
+    """
+    Split a block transaction across books, either by weight or by explicit quantities.
+    :param transaction: The block Transaction
+    :param book_ids: The book for each allocation
+    :param weights: The relative size of each allocation - e.g. the sub-account NAVs
+    :param quantities: Explicit quantities for each allocation, instead of weights
+    :param lot_size: Every allocation is a whole number of lots
+    :param charge_precision: The smallest unit of the allocated charges
+    :param transaction_ids: Optionally, the transaction_id for each allocation
+    :return: An Allocation
+    """
+    if (weights is None) == (quantities is None):
+        raise ValueError('Specify exactly one of weights or quantities')
+    if weights is not None:
+        if len(weights) != len(book_ids):
+            raise ValueError('Expected %s weights but found %s' % (len(book_ids), len(weights)))
+        quantities = allocate_quantities(transaction.quantity, weights, lot_size=lot_size)
+    else:
+        quantities = [Decimal(quantity) for quantity in quantities]
+    charges = {charge_type: prorate(charge.charge_value, quantities, precision=charge_precision)
+               for charge_type, charge in transaction.charges.items()}
+    allocation = Allocation(transaction=transaction, book_ids=list(book_ids), quantities=quantities, charges=charges,
+                            transaction_ids=transaction_ids, lot_size=lot_size)
+    allocation.validate()
+    return allocation
@@ -0,0 +1,147 @@
+"""
+Projected cash ladders.  Settlement cash from trades, cash transactions (cashflows, coupons, dividends and payments)
+and open dividend corporate actions is aggregated into date buckets per asset manager, book and currency.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+import datetime
+
+from amaascore.transactions.enums import CASH_TRANSACTION_TYPES
+from amaascore.transactions.position_engine import INACTIVE_STATUSES, TRANSACTION_ACTION_SIGNS, ZERO, settlement_cash
+
+
+def transaction_cash_flow(transaction):
+    """
+    :param transaction: A Transaction or CashTransaction
+    :return: (currency, amount) - the cash received (positive) or paid (negative) on the settlement date
+    """
+    if transaction.transaction_type in CASH_TRANSACTION_TYPES:
+        # The asset is the currency, and the quantity is the amount of cash
+        return transaction.asset_id, TRANSACTION_ACTION_SIGNS[transaction.transaction_action] * transaction.quantity
+    # The charges are paid either way - for a sale this is the net_settlement
+    return transaction.settlement_currency, settlement_cash(transaction) - transaction.charges_net_effect()
+
+
+class CashLadder(object):
+    """
+    Each ladder is a list of Decimal amounts per bucket of bucket_days days from start_date, grown as later flows
+    arrive.  Flows before start_date go in the first bucket.  Each transaction's contribution is remembered, so an
+    amended or cancelled transaction replaces its previous flow.
+    """
+
+    def __init__(self, start_date, bucket_days=1):
+        """
+        :param start_date: The date of the first bucket
+        :param bucket_days: The number of days in each bucket - e.g. 7 for a weekly ladder
+        """
+        if bucket_days < 1:
+            raise ValueError('bucket_days must be at least 1')
+        self.start_date = start_date
+        self.bucket_days = bucket_days
+        # (asset_manager_id, book_id, currency) -> list of amounts per bucket
+        self.ladders = {}
+        # source -> (version, list of (ladder key, bucket, amount))
+        self.contributions = {}
+
+    def bucket(self, date):
+        return max((date - self.start_date).days // self.bucket_days, 0)
+
+    def bucket_date(self, bucket):
+        return self.start_date + datetime.timedelta(days=bucket * self.bucket_days)
+
+    def _add(self, key, bucket, amount):
+        ladder = self.ladders.get(key)
+        if ladder is None:
+            ladder = self.ladders[key] = []
+        if len(ladder) <= bucket:
+            ladder.extend([ZERO] * (bucket + 1 - len(ladder)))
+        ladder[bucket] += amount
+
+    def _replace(self, source, version, flows):
+        previous = self.contributions.get(source)
+        if previous is not None:
+            if version < previous[0]:
+                return False
+            for key, bucket, amount in previous[1]:
+                self._add(key, bucket, -amount)
+        for key, bucket, amount in flows:
+            self._add(key, bucket, amount)
+        self.contributions[source] = (version, flows)
+        return True
+
+    def add_transaction(self, transaction):
+        """
+        :param transaction: A new or updated Transaction or CashTransaction
+        :return: True if the ladder was updated, False if a later version has already been added
+        """
+        flows = []
+        if transaction.transaction_status not in INACTIVE_STATUSES:
+            currency, amount = transaction_cash_flow(transaction)
+            flows.append(((transaction.asset_manager_id, transaction.asset_book_id, currency),
+                          self.bucket(transaction.settlement_date), amount))
+        return self._replace(('transaction', transaction.asset_manager_id, transaction.transaction_id),
+                             transaction.version, flows)
+
+    def add_transactions(self, transactions):
+        for transaction in transactions:
+            self.add_transaction(transaction)
+
+    def add_dividend(self, dividend, positions):
+        """
+        Project the payment of an open dividend to each book holding the asset on the record date.
+        :param dividend: A Dividend corporate action
+        :param positions: The Positions in the dividend's asset as of the record date - e.g. from
+        PositionHistory.positions_as_of(dividend.record_date, asset_ids=[dividend.asset_id])
+        :return: True if the ladder was updated, False if a later version has already been added
+        """
+        flows = []
+        if dividend.corporate_action_status == 'Open' and dividend.dividend_rate:
+            bucket = self.bucket(dividend.settlement_date)
+            for position in positions:
+                if position.asset_id == dividend.asset_id and position.asset_manager_id == dividend.asset_manager_id:
+                    flows.append(((position.asset_manager_id, position.book_id, dividend.dividend_asset_id), bucket,
+                                  position.quantity * dividend.dividend_rate))
+        return self._replace(('dividend', dividend.asset_manager_id, dividend.corporate_action_id),
+                             dividend.version, flows)
+
+    def dates(self):
+        length = max([len(ladder) for ladder in self.ladders.values()] or [0])
+        return [self.bucket_date(bucket) for bucket in range(length)]
+
+    def ladder(self, asset_manager_id=None, book_ids=None, currencies=None, cumulative=False):
+        """
+        :param asset_manager_id: Optionally restrict to a single asset manager
+        :param book_ids: Optionally restrict to a list of books
+        :param currencies: Optionally restrict to a list of currencies
+        :param cumulative: Return the running cash balance rather than the flows in each bucket
+        :return: An OrderedDict of (asset_manager_id, book_id, currency) to the amount in each bucket, all padded to
+        the same length as dates()
+        """
+        length = len(self.dates())
+        ladders = OrderedDict()
+        for key in sorted(self.ladders, key=lambda key: tuple(str(part) for part in key)):
+            if ((asset_manager_id is not None and key[0] != asset_manager_id) or
+                    (book_ids and key[1] not in book_ids) or (currencies and key[2] not in currencies)):
+                continue
+            amounts = self.ladders[key] + [ZERO] * (length - len(self.ladders[key]))
+            if cumulative:
+                total = ZERO
+                for bucket, amount in enumerate(amounts):
+                    total += amount
+                    amounts[bucket] = total
+            ladders[key] = amounts
+        return ladders
+
+    def currency_ladder(self, asset_manager_id=None, cumulative=False):
+        """
+        :return: An OrderedDict of currency to the amount in each bucket, across all books
+        """
+        totals = OrderedDict()
+        for key, amounts in self.ladder(asset_manager_id=asset_manager_id, cumulative=cumulative).items():
+            currency_amounts = totals.get(key[2])
+            if currency_amounts is None:
+                totals[key[2]] = list(amounts)
+            else:
+                totals[key[2]] = [total + amount for total, amount in zip(currency_amounts, amounts)]
+        return totals
@@ -2,7 +2,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from decimal import Decimal
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, FrozenModel
 
 
 class Charge(AMaaSModel):
@@ -87,3 +87,131 @@ class Reference(AMaaSModel):
         self.reference_value = reference_value
         super(Reference, self).__init__(*args, **kwargs)
 
+
+class FrozenCharge(FrozenModel):
+    model_class = Charge
+    attributes = ('charge_value', 'currency', 'net_affecting')
+
+
+class FrozenCode(FrozenModel):
+    model_class = Code
+    attributes = ('code_value',)
+
+
+class FrozenComment(FrozenModel):
+    model_class = Comment
+    attributes = ('comment_value',)
+
+
+class FrozenLink(FrozenModel):
+    model_class = Link
+    attributes = ('linked_transaction_id',)
+
+
+class FrozenParty(FrozenModel):
+    model_class = Party
+    attributes = ('party_id',)
+
+
+class FrozenRate(FrozenModel):
+    model_class = Rate
+    attributes = ('rate_value',)
+
+
+class FrozenReference(FrozenModel):
+    model_class = Reference
+    attributes = ('reference_value',)
+
+
+class LinkSet(set):
+    """
+    A set of Links (or FrozenLinks) of a single link type, indexed by linked_transaction_id so that netting and
+    allocation parents with thousands of links can look up, add and remove links in constant time.  It behaves as a
+    normal set otherwise.
+    """
+    __slots__ = ('_index',)
+
+    def __init__(self, links=()):
+        super(LinkSet, self).__init__(links)
+        self._reindex()
+
+    def _reindex(self):
+        self._index = {}
+        for link in self:
+            self._index.setdefault(link.linked_transaction_id, []).append(link)
+
+    def _unindex(self, link):
+        links = self._index.get(link.linked_transaction_id, [])
+        links[:] = [indexed for indexed in links if indexed != link]
+        if not links:
+            self._index.pop(link.linked_transaction_id, None)
+
+    def get(self, linked_transaction_id):
+        """
+        :param linked_transaction_id:
+        :return: The link to linked_transaction_id, or None if there isn't one
+        """
+        links = self._index.get(linked_transaction_id)
+        return links[0] if links else None
+
+    def linked_transaction_ids(self):
+        return self._index.keys()
+
+    def add(self, link):
+        if link not in self:
+            super(LinkSet, self).add(link)
+            self._index.setdefault(link.linked_transaction_id, []).append(link)
+
+    def remove(self, link):
+        super(LinkSet, self).remove(link)
+        self._unindex(link)
+
+    def discard(self, link):
+        if link in self:
+            self.remove(link)
+
+    def pop(self):
+        link = super(LinkSet, self).pop()
+        self._unindex(link)
+        return link
+
+    def clear(self):
+        super(LinkSet, self).clear()
+        self._index = {}
+
+    def copy(self):
+        return LinkSet(self)
+
+    def update(self, *others):
+        for other in others:
+            for link in other:
+                self.add(link)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    # The less common in-place operations rebuild the index
+    def intersection_update(self, *others):
+        super(LinkSet, self).intersection_update(*others)
+        self._reindex()
+
+    def difference_update(self, *others):
+        super(LinkSet, self).difference_update(*others)
+        self._reindex()
+
+    def symmetric_difference_update(self, other):
+        super(LinkSet, self).symmetric_difference_update(other)
+        self._reindex()
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
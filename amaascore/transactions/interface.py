@@ -1,11 +1,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
-import json
 
 from amaascore.config import ENVIRONMENT
-from amaascore.core.amaas_model import json_handler
+from amaascore.core.diff import minimal_updates
 from amaascore.core.interface import Interface
+from amaascore.core.json_codec import decode
 from amaascore.transactions.utils import json_to_transaction, json_to_position
 
 
@@ -22,19 +22,27 @@ class TransactionsInterface(Interface):
         url = '%s/transactions/%s' % (self.endpoint, transaction.asset_manager_id)
         response = self.session.post(url, json=transaction.to_interface())
         if response.ok:
-            transaction = json_to_transaction(response.json())
+            transaction = json_to_transaction(decode(response.content))
             return transaction
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def amend(self, transaction):
+    def amend(self, transaction, minimal=False):
+        """
+        :param transaction: The amended transaction
+        :param minimal: Only send the attributes which have changed since the transaction was retrieved, as a partial
+                        amend
+        :return:
+        """
+        if minimal:
+            return self.amend_minimal(transaction)
         self.logger.info('Amend Transaction - Asset Manager: %s - Transaction ID: %s', transaction.asset_manager_id,
                          transaction.transaction_id)
         url = '%s/transactions/%s/%s' % (self.endpoint, transaction.asset_manager_id, transaction.transaction_id)
         response = self.session.put(url, json=transaction.to_interface())
         if response.ok:
-            transaction = json_to_transaction(response.json())
+            transaction = json_to_transaction(decode(response.content))
             return transaction
         else:
             self.logger.error(response.text)
@@ -44,14 +52,28 @@ class TransactionsInterface(Interface):
         self.logger.info('Partial Amend Transaction - Asset Manager: %s - Transaction ID: %s', asset_manager_id,
                          transaction_id)
         url = '%s/transactions/%s/%s' % (self.endpoint, asset_manager_id, transaction_id)
-        response = self.session.patch(url, data=json.dumps(updates, default=json_handler), headers=self.json_header)
+        response = self.session.patch(url, json=updates)
         if response.ok:
-            transaction = json_to_transaction(response.json())
+            transaction = json_to_transaction(decode(response.content))
             return transaction
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
+    def amend_minimal(self, transaction):
+        # Without a clean state to compare against, compare against the version in AMaaS
+        original = None
+        if not transaction.tracks_changes():
+            original = self.retrieve(asset_manager_id=transaction.asset_manager_id,
+                                     transaction_id=transaction.transaction_id)
+        updates = minimal_updates(transaction, original)
+        if not updates:
+            self.logger.info('No changes to Transaction - Asset Manager: %s - Transaction ID: %s',
+                             transaction.asset_manager_id, transaction.transaction_id)
+            return transaction
+        return self.partial(asset_manager_id=transaction.asset_manager_id, transaction_id=transaction.transaction_id,
+                            updates=updates)
+
     def retrieve(self, asset_manager_id, transaction_id, version=None):
         self.logger.info('Retrieve Transaction - Asset Manager: %s - Transaction ID: %s', asset_manager_id,
                          transaction_id)
@@ -60,17 +82,26 @@ class TransactionsInterface(Interface):
             url += '?version=%d' % int(version)
         response = self.session.get(url)
         if response.ok:
-            return json_to_transaction(response.json())
+            transaction = json_to_transaction(decode(response.content))
+            # Changes made from here can be sent with amend(minimal=True)
+            transaction.mark_clean()
+            return transaction
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def transactions_by_asset_manager(self, asset_manager_id):
+    def transactions_by_asset_manager(self, asset_manager_id, updated_since=None):
+        """
+        :param asset_manager_id:
+        :param updated_since: Optionally, only return the transactions updated since this time (an ISO 8601 string)
+        :return:
+        """
         self.logger.info('Retrieve Transactions by Asset Manager: %s', asset_manager_id)
         url = '%s/transactions/%s' % (self.endpoint, asset_manager_id)
-        response = self.session.get(url)
+        params = {'updated_since': updated_since} if updated_since else {}
+        response = self.session.get(url, params=params)
         if response.ok:
-            transactions = [json_to_transaction(json_transaction) for json_transaction in response.json()]
+            transactions = [json_to_transaction(json_transaction) for json_transaction in decode(response.content)]
             self.logger.info('Returned %s Transactions.', len(transactions))
             return transactions
         else:
@@ -133,7 +164,7 @@ class TransactionsInterface(Interface):
         url = self.endpoint + '/transactions'
         response = self.session.get(url, params=search_params)
         if response.ok:
-            transactions = [json_to_transaction(json_transaction) for json_transaction in response.json()]
+            transactions = [json_to_transaction(json_transaction) for json_transaction in decode(response.content)]
             self.logger.info('Returned %s Transactions.', len(transactions))
             return transactions
         else:
@@ -160,7 +191,7 @@ class TransactionsInterface(Interface):
             search_params['position_date'] = position_date
         response = self.session.get(url, params=search_params)
         if response.ok:
-            positions = [json_to_position(json_position) for json_position in response.json()]
+            positions = [json_to_position(json_position) for json_position in decode(response.content)]
             self.logger.info('Returned %s Positions.', len(positions))
             return positions
         else:
@@ -173,7 +204,7 @@ class TransactionsInterface(Interface):
         url = '%s/positions/%s/%s' % (self.endpoint, asset_manager_id, book_id)
         response = self.session.get(url)
         if response.ok:
-            positions = [json_to_position(json_position) for json_position in response.json()]
+            positions = [json_to_position(json_position) for json_position in decode(response.content)]
             self.logger.info('Returned %s Positions.', len(positions))
             return positions
         else:
@@ -186,7 +217,7 @@ class TransactionsInterface(Interface):
         params = {'book_ids': ','.join(book_ids)} if book_ids else {}
         response = self.session.get(url, params=params)
         if response.ok:
-            positions = [json_to_position(json_position) for json_position in response.json()]
+            positions = [json_to_position(json_position) for json_position in decode(response.content)]
             self.logger.info('Returned %s Positions.', len(positions))
             return positions
         else:
@@ -206,10 +237,9 @@ class TransactionsInterface(Interface):
                          transaction_id)
         url = '%s/allocations/%s/%s' % (self.endpoint, asset_manager_id, transaction_id)
         params = {'allocation_type': allocation_type}
-        response = self.session.post(url, params=params, data=json.dumps(allocation_dicts, default=json_handler),
-                                     headers=self.json_header)
+        response = self.session.post(url, params=params, json=allocation_dicts)
         if response.ok:
-            allocations = [json_to_transaction(json_allocation) for json_allocation in response.json()]
+            allocations = [json_to_transaction(json_allocation) for json_allocation in decode(response.content)]
             allocation_ids = [allocation.transaction_id for allocation in allocations]
             self.logger.info('%s Allocations Created - Transactions: %s', len(allocations), allocation_ids)
             return allocations
@@ -229,7 +259,7 @@ class TransactionsInterface(Interface):
         url = '%s/allocations/%s/%s' % (self.endpoint, asset_manager_id, transaction_id)
         response = self.session.get(url)
         if response.ok:
-            allocations = [json_to_transaction(json_allocation) for json_allocation in response.json()]
+            allocations = [json_to_transaction(json_allocation) for json_allocation in decode(response.content)]
             self.logger.info('Returned %s Allocations.', len(allocations))
             return allocations
         else:
@@ -250,7 +280,7 @@ class TransactionsInterface(Interface):
         params = {'netting_type': netting_type}
         response = self.session.post(url, params=params, json=transaction_ids)
         if response.ok:
-            net_transaction = json_to_transaction(response.json())
+            net_transaction = json_to_transaction(decode(response.content))
             self.logger.info('Net Created - Transaction: %s', net_transaction.transaction_id)
             return net_transaction
         else:
@@ -270,7 +300,7 @@ class TransactionsInterface(Interface):
         url = '%s/netting/%s/%s' % (self.endpoint, asset_manager_id, transaction_id)
         response = self.session.get(url)
         if response.ok:
-            net_transaction_id, netting_set_json = next(iter(response.json().items()))
+            net_transaction_id, netting_set_json = next(iter(decode(response.content).items()))
             netting_set = [json_to_transaction(net_transaction) for net_transaction in netting_set_json]
             self.logger.info('Returned %s Transactions in Netting Set.', len(netting_set))
             return net_transaction_id, netting_set
@@ -288,7 +318,7 @@ class TransactionsInterface(Interface):
         url = self.endpoint + '/assets'
         response = self.session.post(url, json=transaction_asset_json)
         if response.ok:
-            return response.json()
+            return decode(response.content)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -303,7 +333,7 @@ class TransactionsInterface(Interface):
         url = self.endpoint + '/books'
         response = self.session.post(url, json=transaction_book_json)
         if response.ok:
-            return response.json()
+            return decode(response.content)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -328,9 +358,9 @@ class TransactionsInterface(Interface):
         url = '%s/book_transfer/%s' % (self.endpoint, asset_manager_id)
         body = {'asset_id': asset_id, 'source_book_id': source_book_id, 'target_book_id': target_book_id,
                 'wash_book_id': wash_book_id, 'quantity': quantity, 'price': price, 'currency': currency}
-        response = self.session.post(url, data=json.dumps(body, default=json_handler), headers=self.json_header)
+        response = self.session.post(url, json=body)
         if response.ok:
-            deliver_json, receive_json = response.json()
+            deliver_json, receive_json = decode(response.content)
             return json_to_transaction(deliver_json), json_to_transaction(receive_json),
         else:
             self.logger.error(response.text)
@@ -352,11 +382,11 @@ class TransactionsInterface(Interface):
         params = {'asset_manager_ids': ','.join(book_ids)} if book_ids else {}
         response = self.session.delete(url, params=params)
         if response.ok:
-            tran_count = response.json().get('transaction_count', 'Unknown')
+            tran_count = decode(response.content).get('transaction_count', 'Unknown')
             self.logger.info('Deleted %s Transactions.', tran_count)
-            pos_count = response.json().get('position_count', 'Unknown')
+            pos_count = decode(response.content).get('position_count', 'Unknown')
             self.logger.info('Deleted %s Positions.', pos_count)
-            return response.json()
+            return decode(response.content)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
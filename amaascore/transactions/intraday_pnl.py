@@ -0,0 +1,123 @@
+"""
+Intraday P&L driven by quote ticks.  Each asset is indexed to the positions which hold it, so a tick only revalues
+those positions and adjusts their books' totals, rather than revaluing everything.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import time
+
+
+class IntradayPnL(object):
+    """
+    P&L per position is quantity * (mid - reference price), where the reference price is typically the previous
+    close (for today's P&L) or the average cost (for total unrealized P&L), plus any realized P&L.  Book totals are
+    kept up to date on every tick, and a snapshot of them is passed to on_snapshot at most once per snapshot_interval.
+    """
+
+    def __init__(self, snapshot_interval=1.0, on_snapshot=None, clock=time.time):
+        """
+        :param snapshot_interval: The minimum number of seconds between snapshots
+        :param on_snapshot: Called with each snapshot - a dict of (asset_manager_id, book_id) to P&L
+        :param clock: Returns the current time in seconds - injectable for testing
+        """
+        self.snapshot_interval = snapshot_interval
+        self.on_snapshot = on_snapshot
+        self.clock = clock
+        # (asset_manager_id, book_id, asset_id) -> [quantity, reference price, realized, P&L]
+        self.positions = {}
+        # (asset_manager_id, asset_id) -> position keys
+        self.asset_positions = {}
+        self.book_pnl = {}
+        self.mids = {}
+        self.ticks = 0
+        self.started = clock()
+        self.last_snapshot_time = None
+        self.last_snapshot = None
+
+    def set_position(self, asset_manager_id, book_id, asset_id, quantity, reference_price, realized=0):
+        """
+        Add or replace a position.  It is valued at the latest mid for the asset if there is one, otherwise at the
+        reference price until the next tick.
+        """
+        key = (asset_manager_id, book_id, asset_id)
+        book_key = (asset_manager_id, book_id)
+        previous = self.positions.get(key)
+        if previous is not None:
+            self.book_pnl[book_key] -= previous[3]
+        else:
+            self.asset_positions.setdefault((asset_manager_id, asset_id), []).append(key)
+        position = [float(quantity), float(reference_price), float(realized), 0.0]
+        position[3] = self._value(position, self.mids.get((asset_manager_id, asset_id), position[1]))
+        self.positions[key] = position
+        self.book_pnl[book_key] = self.book_pnl.get(book_key, 0.0) + position[3]
+
+    def load_positions(self, positions, reference_prices):
+        """
+        :param positions: A list of Positions - e.g. from position_search or a PositionEngine
+        :param reference_prices: A dict of asset_id to reference price - e.g. the previous EOD prices
+        :return:
+        """
+        for position in positions:
+            self.set_position(position.asset_manager_id, position.book_id, position.asset_id, position.quantity,
+                              reference_prices[position.asset_id])
+
+    def load_pnl_engine(self, pnl_engine, asset_manager_id=None):
+        """
+        Take the open lots from a PnLEngine, valued against their average cost and including the realized P&L.
+        """
+        for key in list(pnl_engine.trades):
+            if asset_manager_id is not None and key[0] != asset_manager_id:
+                continue
+            lot_book = pnl_engine.lot_book(*key)
+            if lot_book is not None:
+                self.set_position(key[0], key[1], key[2], lot_book.quantity, lot_book.average_cost(),
+                                  realized=lot_book.realized)
+
+    @staticmethod
+    def _value(position, mid):
+        return position[0] * (mid - position[1]) + position[2]
+
+    def on_quote(self, quote):
+        """
+        :param quote: A Quote - quotes without both a bid and an ask are ignored
+        :return: The snapshot if one was emitted, otherwise None
+        """
+        bid, ask = getattr(quote, 'bid', None), getattr(quote, 'ask', None)
+        if bid is None or ask is None:
+            return None
+        self.ticks += 1
+        asset_key = (quote.asset_manager_id, quote.asset_id)
+        mid = float(quote.mid())
+        self.mids[asset_key] = mid
+        for key in self.asset_positions.get(asset_key, ()):
+            position = self.positions[key]
+            value = self._value(position, mid)
+            self.book_pnl[key[:2]] += value - position[3]
+            position[3] = value
+        now = self.clock()
+        if self.last_snapshot_time is None or now - self.last_snapshot_time >= self.snapshot_interval:
+            return self.snapshot(now)
+        return None
+
+    def snapshot(self, now=None):
+        """
+        Emit a snapshot of the book P&L now, regardless of the throttle.
+        :return: A dict of (asset_manager_id, book_id) to P&L
+        """
+        self.last_snapshot_time = self.clock() if now is None else now
+        self.last_snapshot = dict(self.book_pnl)
+        if self.on_snapshot is not None:
+            self.on_snapshot(self.last_snapshot)
+        return self.last_snapshot
+
+    def position_pnl(self, asset_manager_id, book_id, asset_id):
+        position = self.positions.get((asset_manager_id, book_id, asset_id))
+        return position[3] if position is not None else 0.0
+
+    def metrics(self):
+        """
+        :return: A dict of ticks, elapsed seconds and ticks_per_second since the component was created
+        """
+        elapsed = self.clock() - self.started
+        return {'ticks': self.ticks, 'elapsed': elapsed,
+                'ticks_per_second': self.ticks / elapsed if elapsed > 0 else 0.0}
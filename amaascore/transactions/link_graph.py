@@ -0,0 +1,141 @@
+"""
+A graph of the links between transactions - e.g. a Net transaction's NettingSet links, or the links between a block
+and its allocations - with indexes in both directions, so related transactions can be found locally rather than with
+retrieve_netting_set or retrieve_transaction_allocations calls.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import deque
+
+
+def _linked_transaction_ids(link_set):
+    if isinstance(link_set, (set, frozenset)):
+        return {link.linked_transaction_id for link in link_set}
+    return {link_set.linked_transaction_id} if link_set is not None else set()
+
+
+class LinkGraph(object):
+    """
+    Transactions are identified by (asset_manager_id, transaction_id) and links only join transactions of the same
+    asset manager.  A link from a transaction to the transaction it references is an outgoing edge, so the
+    descendants of a Net transaction are the transactions in its netting set.
+    """
+
+    def __init__(self, transactions=None):
+        # node -> {link_type: set of nodes}
+        self.outgoing = {}
+        self.incoming = {}
+        for transaction in transactions or []:
+            self.add(transaction)
+
+    def add(self, transaction):
+        """
+        Add a transaction's links, replacing any links from a previous version of the transaction.
+        :param transaction:
+        :return:
+        """
+        node = (transaction.asset_manager_id, transaction.transaction_id)
+        self._remove_outgoing(node)
+        for link_type, link_set in transaction.links.items():
+            for linked_transaction_id in _linked_transaction_ids(link_set):
+                linked_node = (transaction.asset_manager_id, linked_transaction_id)
+                self.outgoing.setdefault(node, {}).setdefault(link_type, set()).add(linked_node)
+                self.incoming.setdefault(linked_node, {}).setdefault(link_type, set()).add(node)
+
+    def add_all(self, transactions):
+        for transaction in transactions:
+            self.add(transaction)
+
+    def remove(self, asset_manager_id, transaction_id):
+        """
+        Remove the links from a transaction.  Links to it from other transactions remain until those are updated.
+        """
+        self._remove_outgoing((asset_manager_id, transaction_id))
+
+    def _remove_outgoing(self, node):
+        for link_type, linked_nodes in self.outgoing.pop(node, {}).items():
+            for linked_node in linked_nodes:
+                incoming = self.incoming[linked_node]
+                incoming[link_type].discard(node)
+                if not incoming[link_type]:
+                    del incoming[link_type]
+                if not incoming:
+                    del self.incoming[linked_node]
+
+    @staticmethod
+    def _neighbours(index, node, link_types):
+        edges = index.get(node)
+        if not edges:
+            return set()
+        if link_types is None:
+            return set().union(*edges.values())
+        return set().union(*[edges[link_type] for link_type in link_types if link_type in edges])
+
+    def linked(self, asset_manager_id, transaction_id, link_types=None):
+        """
+        :return: The transaction_ids which the transaction links to
+        """
+        return {linked_transaction_id for _, linked_transaction_id in
+                self._neighbours(self.outgoing, (asset_manager_id, transaction_id), link_types)}
+
+    def linked_from(self, asset_manager_id, transaction_id, link_types=None):
+        """
+        :return: The transaction_ids of the transactions which link to the transaction
+        """
+        return {linked_transaction_id for _, linked_transaction_id in
+                self._neighbours(self.incoming, (asset_manager_id, transaction_id), link_types)}
+
+    def _traverse(self, node, indexes, link_types):
+        seen = {node}
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for index in indexes:
+                for neighbour in self._neighbours(index, current, link_types):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        queue.append(neighbour)
+        seen.discard(node)
+        return {transaction_id for _, transaction_id in seen}
+
+    def descendants(self, asset_manager_id, transaction_id, link_types=None):
+        """
+        :param asset_manager_id:
+        :param transaction_id:
+        :param link_types: Optionally, only follow these link types - e.g. ['NettingSet']
+        :return: The transaction_ids reachable by following links from the transaction
+        """
+        return self._traverse((asset_manager_id, transaction_id), [self.outgoing], link_types)
+
+    def ancestors(self, asset_manager_id, transaction_id, link_types=None):
+        """
+        :return: The transaction_ids of the transactions which link to the transaction, directly or indirectly
+        """
+        return self._traverse((asset_manager_id, transaction_id), [self.incoming], link_types)
+
+    def component(self, asset_manager_id, transaction_id, link_types=None):
+        """
+        Every transaction connected to the transaction in either direction - e.g. everything affected if it is
+        cancelled.
+        :return: A set of transaction_ids, not including the transaction itself
+        """
+        return self._traverse((asset_manager_id, transaction_id), [self.outgoing, self.incoming], link_types)
+
+    def components(self, asset_manager_id=None, link_types=None):
+        """
+        :param asset_manager_id: Optionally restrict to a single asset manager
+        :param link_types: Optionally, only follow these link types
+        :return: A list of (asset_manager_id, set of transaction_ids) for each group of linked transactions
+        """
+        seen = set()
+        components = []
+        for node in list(self.outgoing) + list(self.incoming):
+            if node in seen or (asset_manager_id is not None and node[0] != asset_manager_id):
+                continue
+            transaction_ids = self._traverse(node, [self.outgoing, self.incoming], link_types)
+            if not transaction_ids:
+                continue
+            transaction_ids.add(node[1])
+            seen.update((node[0], transaction_id) for transaction_id in transaction_ids)
+            components.append((node[0], transaction_ids))
+        return components
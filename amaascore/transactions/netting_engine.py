@@ -0,0 +1,181 @@
+"""
+Client-side netting.  Transactions are grouped by netting key - asset manager, book, asset, settlement date and
+settlement currency - so that the resulting Net transactions can be previewed before anything is sent to
+TransactionsInterface.net_transactions.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+
+from amaascore.transactions.children import Charge, Link
+from amaascore.transactions.position_engine import INACTIVE_STATUSES, TRANSACTION_ACTION_SIGNS, ZERO, settlement_cash
+from amaascore.transactions.transaction import Transaction
+
+NETTING_KEY_ATTRIBUTES = ['asset_manager_id', 'asset_book_id', 'asset_id', 'settlement_date', 'settlement_currency']
+NETTING_SET_LINK_TYPE = 'NettingSet'
+
+
+def netting_key(transaction):
+    return (transaction.asset_manager_id, transaction.asset_book_id, transaction.asset_id,
+            transaction.settlement_date, transaction.settlement_currency)
+
+
+class NettingSet(object):
+    """
+    The transactions which share a netting key, with running totals of their signed quantity, settlement amounts and
+    charges.  Settlement amounts are cash received (positive) or paid (negative) by the asset book, as in the cash
+    ladder and postings, so a Buy and a Sell of the same size net to zero.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.transactions = []
+        self.net_quantity = ZERO
+        self.gross_settlement = ZERO
+        self.charges_net_effect = ZERO
+        self.net_settlement = ZERO
+        # charge_type -> Charge totalled across the set
+        self.charges = OrderedDict()
+
+    def add(self, transaction):
+        """
+        :param transaction:
+        :raises ValueError: If a charge has a different currency or net_affecting flag from the charges of the same type
+        already in the set, as the Net transaction can only have one charge of each type
+        """
+        for charge_type, charge in transaction.charges.items():
+            total = self.charges.get(charge_type)
+            if total is not None and (total.currency, total.net_affecting) != (charge.currency, charge.net_affecting):
+                raise ValueError('Transaction %s has a %s charge with a different currency or net_affecting to the '
+                                 'netting set' % (transaction.transaction_id, charge_type))
+        gross_settlement = settlement_cash(transaction)
+        charges_net_effect = transaction.charges_net_effect()
+        self.transactions.append(transaction)
+        self.net_quantity += TRANSACTION_ACTION_SIGNS[transaction.transaction_action] * transaction.quantity
+        self.gross_settlement += gross_settlement
+        self.charges_net_effect += charges_net_effect
+        self.net_settlement += gross_settlement - charges_net_effect
+        for charge_type in sorted(transaction.charges):
+            charge = transaction.charges[charge_type]
+            total = self.charges.get(charge_type)
+            if total is None:
+                self.charges[charge_type] = Charge(charge_value=charge.charge_value, currency=charge.currency,
+                                                   net_affecting=charge.net_affecting)
+            else:
+                total.charge_value += charge.charge_value
+
+    @property
+    def transaction_ids(self):
+        return [transaction.transaction_id for transaction in self.transactions]
+
+    @property
+    def net_action(self):
+        return 'Sell' if self.net_quantity < 0 else 'Buy'
+
+    @property
+    def net_price(self):
+        """
+        :return: The average price of the net quantity, or zero if the set nets to flat
+        """
+        if not self.net_quantity:
+            return ZERO
+        return abs(self.gross_settlement / self.net_quantity)
+
+    def to_transaction(self, transaction_id=None):
+        """
+        The Net transaction the set would produce.  This is a proposal only - the server creates the actual Net
+        transaction when the set is submitted.
+        :param transaction_id:
+        :return: A Transaction of type Net with the set's total charges and a NettingSet link to each transaction in
+        the set.  Its gross and net settlement are the same cash amounts as the set's.
+        """
+        first = self.transactions[0]
+        asset_manager_id, asset_book_id, asset_id, settlement_date, settlement_currency = self.key
+        links = {NETTING_SET_LINK_TYPE: {Link(linked_transaction_id=linked_transaction_id)
+                                         for linked_transaction_id in self.transaction_ids}}
+        net = Transaction(asset_manager_id=asset_manager_id, asset_book_id=asset_book_id,
+                          counterparty_book_id=first.counterparty_book_id, transaction_action=self.net_action,
+                          asset_id=asset_id, quantity=abs(self.net_quantity),
+                          transaction_date=max(transaction.transaction_date for transaction in self.transactions),
+                          settlement_date=settlement_date, price=self.net_price,
+                          transaction_currency=first.transaction_currency, settlement_currency=settlement_currency,
+                          transaction_type='Net', transaction_id=transaction_id, links=links,
+                          charges={charge_type: Charge(charge_value=charge.charge_value, currency=charge.currency,
+                                                       net_affecting=charge.net_affecting)
+                                   for charge_type, charge in self.charges.items()})
+        # Set explicitly, as net_price * quantity may not be exact
+        net.gross_settlement = -TRANSACTION_ACTION_SIGNS[self.net_action] * self.gross_settlement
+        return net
+
+
+class NettingEngine(object):
+    """
+    Groups candidate transactions into netting sets.  Cancelled, netted etc transactions and existing Net transactions
+    are not eligible and are skipped.
+    """
+
+    def __init__(self, transactions=None):
+        self.netting_sets = OrderedDict()
+        self.skipped = []
+        self.add_all(transactions or [])
+
+    def add(self, transaction):
+        """
+        :param transaction:
+        :return: The NettingSet the transaction was added to, or None if it is not eligible for netting
+        :raises ValueError: See NettingSet.add
+        """
+        if transaction.transaction_status in INACTIVE_STATUSES or transaction.transaction_type == 'Net':
+            self.skipped.append(transaction)
+            return None
+        key = netting_key(transaction)
+        netting_set = self.netting_sets.get(key)
+        if netting_set is None:
+            netting_set = self.netting_sets[key] = NettingSet(key)
+        netting_set.add(transaction)
+        return netting_set
+
+    def add_all(self, transactions):
+        for transaction in transactions:
+            self.add(transaction)
+
+    def sets(self, min_size=2):
+        """
+        :param min_size: The smallest number of transactions worth netting
+        :return: A list of NettingSets
+        """
+        return [netting_set for netting_set in self.netting_sets.values()
+                if len(netting_set.transactions) >= min_size]
+
+    def proposed_transactions(self, min_size=2):
+        return [netting_set.to_transaction() for netting_set in self.sets(min_size=min_size)]
+
+    def preview(self, min_size=2):
+        """
+        A column-oriented report of the netting sets, in the same layout as amaascore.core.columnar.to_columns, so it
+        can be passed to to_dataframe etc.
+        :param min_size: The smallest number of transactions worth netting
+        :return: An OrderedDict of column name to list of values, one row per netting set
+        """
+        netting_sets = self.sets(min_size=min_size)
+        columns = OrderedDict()
+        for index, attribute in enumerate(NETTING_KEY_ATTRIBUTES):
+            columns[attribute] = [netting_set.key[index] for netting_set in netting_sets]
+        columns['transaction_count'] = [len(netting_set.transactions) for netting_set in netting_sets]
+        for attribute in ['net_action', 'net_quantity', 'net_price', 'gross_settlement', 'charges_net_effect',
+                          'net_settlement', 'transaction_ids']:
+            columns[attribute] = [getattr(netting_set, attribute) for netting_set in netting_sets]
+        return columns
+
+    def submit(self, interface, min_size=2, netting_type='Net'):
+        """
+        Send each netting set to AMaaS.
+        :param interface: A TransactionsInterface
+        :param min_size: The smallest number of transactions worth netting
+        :param netting_type:
+        :return: A list of the Net transactions created by the server
+        """
+        return [interface.net_transactions(asset_manager_id=netting_set.key[0],
+                                           transaction_ids=netting_set.transaction_ids,
+                                           netting_type=netting_type)
+                for netting_set in self.sets(min_size=min_size)]
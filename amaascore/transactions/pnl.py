@@ -0,0 +1,241 @@
+"""
+Lot-based P&L.  Trades build tax lots per asset manager, book and asset, which are closed FIFO, LIFO or at average
+cost, giving realized P&L as trades close lots and unrealized P&L when the open lots are valued with EOD prices.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from array import array
+from datetime import datetime
+from operator import itemgetter
+import pytz
+
+from amaascore.transactions.enums import CASH_TRANSACTION_TYPES
+from amaascore.transactions.position_engine import INACTIVE_STATUSES, TRANSACTION_ACTION_SIGNS, position_key
+
+LOT_METHODS = {'FIFO', 'LIFO', 'AVCO'}
+
+
+class LotBook(object):
+    """
+    The open lots of a single position, held in parallel arrays of doubles rather than as objects so that millions of
+    lots stay compact.  All open lots have the same sign - long lots are positive and short lots negative.  Lots
+    before start have been fully closed (FIFO) and are compacted away periodically.
+    """
+    __slots__ = ('method', 'quantities', 'prices', 'start', 'realized')
+
+    def __init__(self, method='FIFO'):
+        self.method = method
+        self.quantities = array(str('d'))
+        self.prices = array(str('d'))
+        self.start = 0
+        self.realized = 0.0
+
+    def __len__(self):
+        return len(self.quantities) - self.start
+
+    @property
+    def quantity(self):
+        return sum(self.quantities[self.start:])
+
+    @property
+    def cost(self):
+        return sum(quantity * price for quantity, price in zip(self.quantities[self.start:], self.prices[self.start:]))
+
+    def average_cost(self):
+        quantity = self.quantity
+        return self.cost / quantity if quantity else 0.0
+
+    def trade(self, quantity, price):
+        """
+        :param quantity: The signed quantity - positive to buy, negative to sell
+        :param price:
+        :return: The P&L realized by the trade
+        """
+        realized = 0.0
+        quantities = self.quantities
+        if len(quantities) > self.start and (quantities[self.start] > 0) != (quantity > 0):
+            quantity, realized = self._close(quantity, price)
+        if quantity:
+            self._open(quantity, price)
+        self.realized += realized
+        return realized
+
+    def _open(self, quantity, price):
+        start = self.start
+        if self.method == 'AVCO' and len(self.quantities) > start:
+            # A single lot at the average cost of everything open
+            total = self.quantities[start] + quantity
+            self.prices[start] = (self.quantities[start] * self.prices[start] + quantity * price) / total
+            self.quantities[start] = total
+        else:
+            self.quantities.append(quantity)
+            self.prices.append(price)
+
+    def _close(self, quantity, price):
+        quantities, prices = self.quantities, self.prices
+        lifo = self.method == 'LIFO'
+        realized = 0.0
+        while quantity and len(quantities) > self.start:
+            index = len(quantities) - 1 if lifo else self.start
+            lot_quantity = quantities[index]
+            # Close as much of the lot as the trade allows, keeping the lot's sign
+            closed = -quantity if abs(quantity) < abs(lot_quantity) else lot_quantity
+            realized += closed * (price - prices[index])
+            quantity += closed
+            if closed == lot_quantity:
+                if lifo:
+                    quantities.pop()
+                    prices.pop()
+                else:
+                    self.start += 1
+            else:
+                quantities[index] = lot_quantity - closed
+        if self.start:
+            self._compact()
+        return quantity, realized
+
+    def _compact(self):
+        # Drop the closed lots once they are more than half of the storage
+        if self.start * 2 >= len(self.quantities):
+            del self.quantities[:self.start]
+            del self.prices[:self.start]
+            self.start = 0
+
+    def unrealized(self, price):
+        return sum(quantity * (price - cost)
+                   for quantity, cost in zip(self.quantities[self.start:], self.prices[self.start:]))
+
+
+def _trade_order(transaction):
+    # Naive execution times are UTC, and trades without one go after the trades on the same date which have one
+    execution_time = transaction.execution_time
+    if execution_time is not None and execution_time.tzinfo is not None:
+        execution_time = execution_time.astimezone(pytz.utc).replace(tzinfo=None)
+    return (transaction.transaction_date, execution_time is None, execution_time or datetime.min,
+            transaction.transaction_id)
+
+
+def _trade_record(transaction):
+    # Only what a rebuild needs rather than the whole Transaction - (trade order, signed quantity, price, active,
+    # version)
+    return (_trade_order(transaction),
+            TRANSACTION_ACTION_SIGNS[transaction.transaction_action] * float(transaction.quantity),
+            float(transaction.price), transaction.transaction_status not in INACTIVE_STATUSES, transaction.version)
+
+
+class PnLEngine(object):
+    """
+    Builds lots from trades per asset manager, book and asset.  Trades after the latest one already applied to a
+    position are applied incrementally; amendments, cancellations and back-dated trades mark the position for a
+    rebuild, which happens the next time it is needed.  Quantities, prices and P&L are floats - see LotBook.
+    Charges are not included in the cost of the lots.  Each trade is kept as a small tuple for rebuilds, not as the
+    Transaction.
+    """
+
+    def __init__(self, method='FIFO'):
+        """
+        :param method: 'FIFO', 'LIFO' or 'AVCO' (average cost)
+        """
+        if method not in LOT_METHODS:
+            raise ValueError('Invalid lot method: %s' % method)
+        self.method = method
+        # position key -> {transaction_id: trade record}
+        self.trades = {}
+        # (asset_manager_id, transaction_id) -> position key, in case an amendment moves the trade to another book
+        self.transaction_keys = {}
+        self.lot_books = {}
+        self._last_trade = {}
+        self._stale = set()
+
+    def apply(self, transaction):
+        """
+        :param transaction: A new or updated transaction
+        :return: True if the transaction was applied, False if it does not affect P&L or is an old version
+        """
+        if transaction.transaction_type in CASH_TRANSACTION_TYPES:
+            return False
+        key = position_key(transaction)
+        transaction_key = (transaction.asset_manager_id, transaction.transaction_id)
+        previous_key = self.transaction_keys.get(transaction_key, key)
+        existing = self.trades.get(previous_key, {}).get(transaction.transaction_id)
+        if existing is not None and transaction.version < existing[4]:
+            return False
+        if previous_key != key:
+            del self.trades[previous_key][transaction.transaction_id]
+            self._stale.add(previous_key)
+        self.transaction_keys[transaction_key] = key
+        trades = self.trades.setdefault(key, {})
+        existing = trades.get(transaction.transaction_id)
+        trade = trades[transaction.transaction_id] = _trade_record(transaction)
+        last_trade = self._last_trade.get(key)
+        if existing is None and key not in self._stale and (last_trade is None or trade[0] > last_trade):
+            self._trade(key, trade)
+        else:
+            self._stale.add(key)
+        return True
+
+    def apply_all(self, transactions):
+        for transaction in sorted(transactions, key=_trade_order):
+            self.apply(transaction)
+
+    def _trade(self, key, trade):
+        trade_order, quantity, price, active, _ = trade
+        self._last_trade[key] = trade_order
+        if not active:
+            return
+        lot_book = self.lot_books.get(key)
+        if lot_book is None:
+            lot_book = self.lot_books[key] = LotBook(self.method)
+        lot_book.trade(quantity, price)
+
+    def _rebuild(self, key):
+        self.lot_books.pop(key, None)
+        self._last_trade.pop(key, None)
+        for trade in sorted(self.trades[key].values(), key=itemgetter(0)):
+            self._trade(key, trade)
+
+    def lot_book(self, asset_manager_id, book_id, asset_id):
+        key = (asset_manager_id, book_id, asset_id)
+        if key in self._stale:
+            self._rebuild(key)
+            self._stale.discard(key)
+        return self.lot_books.get(key)
+
+    def asset_ids(self, asset_manager_id=None):
+        return sorted({key[2] for key in self.trades if asset_manager_id is None or key[0] == asset_manager_id})
+
+    def retrieve_prices(self, interface, asset_manager_id, business_date):
+        """
+        :param interface: A MarketDataInterface
+        :param asset_manager_id:
+        :param business_date:
+        :return: A dict of asset_id to EOD price for the assets held by the asset manager
+        """
+        eod_prices = interface.retrieve_eod_prices(asset_manager_id=asset_manager_id, business_date=business_date,
+                                                   asset_ids=self.asset_ids(asset_manager_id))
+        return {eod_price.asset_id: eod_price.price for eod_price in eod_prices}
+
+    def pnl(self, prices, asset_manager_id=None, book_ids=None):
+        """
+        :param prices: A dict of asset_id to price, or a list of EODPrices
+        :param asset_manager_id: Optionally restrict to a single asset manager
+        :param book_ids: Optionally restrict to a list of books
+        :return: A list of dicts of asset_manager_id, book_id, asset_id, quantity, average_cost, price, realized and
+        unrealized per position.  The price and unrealized P&L are None if there is no price for the asset.
+        """
+        if not isinstance(prices, dict):
+            prices = {eod_price.asset_id: eod_price.price for eod_price in prices}
+        results = []
+        for key in sorted(self.trades, key=lambda key: tuple(str(part) for part in key)):
+            if (asset_manager_id is not None and key[0] != asset_manager_id) or (book_ids and key[1] not in book_ids):
+                continue
+            lot_book = self.lot_book(*key)
+            if lot_book is None:
+                continue
+            price = prices.get(key[2])
+            price = float(price) if price is not None else None
+            results.append({'asset_manager_id': key[0], 'book_id': key[1], 'asset_id': key[2],
+                            'quantity': lot_book.quantity, 'average_cost': lot_book.average_cost(), 'price': price,
+                            'realized': lot_book.realized,
+                            'unrealized': lot_book.unrealized(price) if price is not None else None})
+        return results
@@ -0,0 +1,174 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+
+from amaascore.transactions.enums import TRANSACTION_CANCEL_STATUSES
+from amaascore.transactions.position import Position
+
+ACCOUNTING_TYPES = {'Transaction Date', 'Settlement Date'}
+# The direction in which each action moves the position in the asset book
+TRANSACTION_ACTION_SIGNS = {'Buy': 1, 'Receive': 1, 'Acquire': 1, 'Subscription': 1,
+                            'Sell': -1, 'Short Sell': -1, 'Deliver': -1, 'Remove': -1, 'Redemption': -1}
+# Transactions in these statuses have been replaced by other transactions, so no longer contribute to positions
+INACTIVE_STATUSES = TRANSACTION_CANCEL_STATUSES | {'Superseded'}
+ZERO = Decimal(0)
+
+
+def position_key(transaction):
+    return transaction.asset_manager_id, transaction.asset_book_id, transaction.asset_id
+
+
+def signed_quantity(transaction):
+    """
+    :param transaction:
+    :return: The change to the asset book's position from the transaction - zero if it has been cancelled etc
+    """
+    if transaction.transaction_status in INACTIVE_STATUSES:
+        return ZERO
+    return transaction.quantity * TRANSACTION_ACTION_SIGNS[transaction.transaction_action]
+
+
+def settlement_cash(transaction):
+    """
+    :param transaction:
+    :return: The gross settlement received (positive) or paid (negative) by the asset book - buying pays it and selling
+    receives it
+    """
+    return -TRANSACTION_ACTION_SIGNS[transaction.transaction_action] * transaction.gross_settlement
+
+
+def accounting_date(transaction, accounting_type):
+    return transaction.transaction_date if accounting_type == 'Transaction Date' else transaction.settlement_date
+
+
+class PositionEngine(object):
+    """
+    Keeps positions by asset manager, book and asset up to date from a stream of transactions, without going back to
+    the server.  Each transaction contributes its signed quantity to its asset book's position.  When a later version
+    of a transaction arrives (e.g. amended or cancelled), its previous contribution is replaced, so the same
+    transaction can be applied any number of times.  Older versions are ignored.
+    """
+
+    def __init__(self, accounting_type='Transaction Date', position_date=None):
+        """
+        :param accounting_type: 'Transaction Date' or 'Settlement Date' - which date a transaction counts from
+        :param position_date: Only count transactions up to and including this date.  Later transactions are held as
+        pending until the engine is advanced.  If None, every transaction counts.
+        """
+        if accounting_type not in ACCOUNTING_TYPES:
+            raise ValueError('Invalid accounting type: %s' % accounting_type)
+        self.accounting_type = accounting_type
+        self.position_date = position_date
+        self.quantities = {}
+        # (asset_manager_id, transaction_id) -> (version, position key, quantity, accounting date, pending)
+        self.contributions = {}
+
+    def _is_pending(self, date):
+        return self.position_date is not None and date is not None and date > self.position_date
+
+    def _add(self, key, quantity):
+        if not quantity:
+            return
+        total = self.quantities.get(key, ZERO) + quantity
+        if total:
+            self.quantities[key] = total
+        else:
+            self.quantities.pop(key, None)
+
+    def apply(self, transaction):
+        """
+        :param transaction: A new or updated transaction
+        :return: True if the transaction was applied, False if a later version has already been applied
+        """
+        transaction_key = (transaction.asset_manager_id, transaction.transaction_id)
+        previous = self.contributions.get(transaction_key)
+        if previous is not None:
+            if transaction.version < previous[0]:
+                return False
+            if not previous[4]:
+                self._add(previous[1], -previous[2])
+        date = accounting_date(transaction, self.accounting_type)
+        quantity = signed_quantity(transaction)
+        pending = self._is_pending(date)
+        key = position_key(transaction)
+        self.contributions[transaction_key] = (transaction.version, key, quantity, date, pending)
+        if not pending:
+            self._add(key, quantity)
+        return True
+
+    def apply_all(self, transactions):
+        for transaction in transactions:
+            self.apply(transaction)
+
+    def remove(self, asset_manager_id, transaction_id):
+        previous = self.contributions.pop((asset_manager_id, transaction_id), None)
+        if previous is not None and not previous[4]:
+            self._add(previous[1], -previous[2])
+
+    def advance(self, position_date):
+        """
+        Move the position date forward (or back), bringing the transactions up to the new date into the positions.
+        :param position_date:
+        :return:
+        """
+        self.position_date = position_date
+        for transaction_key, (version, key, quantity, date, pending) in list(self.contributions.items()):
+            now_pending = self._is_pending(date)
+            if now_pending != pending:
+                self._add(key, -quantity if now_pending else quantity)
+                self.contributions[transaction_key] = (version, key, quantity, date, now_pending)
+
+    def quantity(self, asset_manager_id, book_id, asset_id):
+        return self.quantities.get((asset_manager_id, book_id, asset_id), ZERO)
+
+    def pending_quantity(self, asset_manager_id, book_id, asset_id):
+        """
+        :return: The total of the transactions after the position date - e.g. trades which have not yet settled
+        """
+        key = (asset_manager_id, book_id, asset_id)
+        return sum((quantity for _, position, quantity, _, pending in self.contributions.values()
+                    if pending and position == key), ZERO)
+
+    def positions(self, asset_manager_id=None, book_ids=None, asset_ids=None):
+        """
+        :param asset_manager_id: Optionally restrict to a single asset manager
+        :param book_ids: Optionally restrict to a list of books
+        :param asset_ids: Optionally restrict to a list of assets
+        :return: A list of Positions, excluding flat positions
+        """
+        book_ids = set(book_ids) if book_ids else None
+        asset_ids = set(asset_ids) if asset_ids else None
+        positions = []
+        for (position_asset_manager_id, book_id, asset_id), quantity in self.quantities.items():
+            if asset_manager_id is not None and position_asset_manager_id != asset_manager_id:
+                continue
+            if (book_ids and book_id not in book_ids) or (asset_ids and asset_id not in asset_ids):
+                continue
+            positions.append(Position(asset_manager_id=position_asset_manager_id, book_id=book_id,
+                                      asset_id=asset_id, quantity=quantity))
+        return positions
+
+    def reconcile(self, positions, tolerance=ZERO):
+        """
+        Compare the engine against positions from the server - e.g. the results of position_search for the same
+        accounting type and position date.  Flat positions are treated the same as missing ones.
+        :param positions: A list of Positions
+        :param tolerance: The largest difference which is not reported
+        :return: A list of breaks, each a dict of asset_manager_id, book_id, asset_id, quantity (the engine's),
+        server_quantity and difference
+        """
+        server_quantities = {}
+        for position in positions:
+            key = (position.asset_manager_id, position.book_id, position.asset_id)
+            server_quantities[key] = server_quantities.get(key, ZERO) + position.quantity
+        asset_manager_ids = {key[0] for key in server_quantities}
+        keys = set(server_quantities) | {key for key in self.quantities if key[0] in asset_manager_ids}
+        breaks = []
+        for key in sorted(keys, key=lambda key: tuple(str(part) for part in key)):
+            quantity = self.quantities.get(key, ZERO)
+            server_quantity = server_quantities.get(key, ZERO)
+            if abs(quantity - server_quantity) > tolerance:
+                breaks.append({'asset_manager_id': key[0], 'book_id': key[1], 'asset_id': key[2],
+                               'quantity': quantity, 'server_quantity': server_quantity,
+                               'difference': quantity - server_quantity})
+        return breaks
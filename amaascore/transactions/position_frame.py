@@ -0,0 +1,172 @@
+"""
+An array-backed container for large numbers of positions.  The asset manager, book and asset of each position are
+stored as integer codes into shared lookup tables, so that grouping and joining work on the distinct values rather
+than on every Position object.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from array import array
+from collections import OrderedDict
+from decimal import Decimal
+
+from amaascore.transactions.position import Position
+
+POSITION_ATTRIBUTES = ['asset_manager_id', 'book_id', 'asset_id']
+# Attributes which come from the Asset rather than the Position
+ASSET_ATTRIBUTES = ['asset_class', 'currency', 'country_id']
+
+
+class CodeTable(object):
+    """
+    Maps each distinct value to a small integer code, in the order the values are first seen.
+    """
+
+    def __init__(self, values=None):
+        self.values = []
+        self.codes = {}
+        for value in values or []:
+            self.code(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class PositionFrame(object):
+    """
+    Parallel columns of asset manager, book and asset codes and quantities.  Quantities are Decimals by default, or
+    doubles (exact=False) which are smaller and faster to aggregate.
+    """
+
+    def __init__(self, exact=True, code_tables=None):
+        """
+        :param exact: Hold the quantities as Decimals rather than floats
+        :param code_tables: A dict of attribute to CodeTable, to share the codes with another frame
+        """
+        self.exact = exact
+        self.code_tables = code_tables or {attribute: CodeTable() for attribute in POSITION_ATTRIBUTES}
+        self.codes = {attribute: array(str('l')) for attribute in POSITION_ATTRIBUTES}
+        self.quantities = [] if exact else array(str('d'))
+
+    @classmethod
+    def from_positions(cls, positions, exact=True, code_tables=None):
+        frame = cls(exact=exact, code_tables=code_tables)
+        frame.extend(positions)
+        return frame
+
+    def __len__(self):
+        return len(self.quantities)
+
+    def append(self, asset_manager_id, book_id, asset_id, quantity):
+        for attribute, value in zip(POSITION_ATTRIBUTES, (asset_manager_id, book_id, asset_id)):
+            self.codes[attribute].append(self.code_tables[attribute].code(value))
+        self.quantities.append(Decimal(quantity) if self.exact else float(quantity))
+
+    def extend(self, positions):
+        for position in positions:
+            self.append(position.asset_manager_id, position.book_id, position.asset_id, position.quantity)
+
+    def column(self, attribute):
+        """
+        :return: The decoded values of a position attribute for every row
+        """
+        values = self.code_tables[attribute].values
+        return [values[code] for code in self.codes[attribute]]
+
+    def to_positions(self):
+        return [Position(asset_manager_id=asset_manager_id, book_id=book_id, asset_id=asset_id, quantity=quantity)
+                for asset_manager_id, book_id, asset_id, quantity
+                in zip(self.column('asset_manager_id'), self.column('book_id'), self.column('asset_id'),
+                       self.quantities)]
+
+    def select(self, asset_manager_id=None, book_ids=None, asset_ids=None):
+        """
+        :return: A new frame of the matching rows, sharing this frame's code tables
+        """
+        allowed = {}
+        for attribute, values in [('asset_manager_id', None if asset_manager_id is None else [asset_manager_id]),
+                                  ('book_id', book_ids), ('asset_id', asset_ids)]:
+            if values:
+                codes = self.code_tables[attribute].codes
+                allowed[attribute] = {codes[value] for value in values if value in codes}
+        frame = PositionFrame(exact=self.exact, code_tables=self.code_tables)
+        for row in range(len(self)):
+            if all(self.codes[attribute][row] in codes for attribute, codes in allowed.items()):
+                for attribute in POSITION_ATTRIBUTES:
+                    frame.codes[attribute].append(self.codes[attribute][row])
+                frame.quantities.append(self.quantities[row])
+        return frame
+
+    def _key_lookups(self, by, assets):
+        # For each grouping attribute, the row codes and a lookup from code to the value of the attribute
+        lookups = []
+        for attribute in by:
+            if attribute in POSITION_ATTRIBUTES:
+                lookups.append((self.codes[attribute], self.code_tables[attribute].values))
+            elif attribute in ASSET_ATTRIBUTES:
+                if assets is None:
+                    raise ValueError('Grouping by %s requires the assets' % attribute)
+                # Look up each distinct asset once rather than once per row
+                lookups.append((self.codes['asset_id'],
+                                [getattr(assets.get(asset_id), attribute, None)
+                                 for asset_id in self.code_tables['asset_id'].values]))
+            else:
+                raise ValueError('Cannot group by %s' % attribute)
+        return lookups
+
+    def group_by(self, by, assets=None, values=None):
+        """
+        :param by: An attribute or list of attributes - asset_manager_id, book_id, asset_id, asset_class, currency or
+        country_id
+        :param assets: A dict of asset_id to Asset, required to group by asset_class, currency or country_id.  Assets
+        which are missing are grouped under None.
+        :param values: The column to total, aligned with the rows - e.g. from market_values.  Defaults to the
+        quantities.  None and NaN values are skipped.
+        :return: An OrderedDict of group (a value, or a tuple of values when by is a list) to total, in the order the
+        groups are first seen
+        """
+        single = not isinstance(by, (list, tuple))
+        lookups = self._key_lookups([by] if single else by, assets)
+        values = self.quantities if values is None else values
+        # Group on the combined integer codes and only decode each group once
+        totals = OrderedDict()
+        code_rows = zip(*[codes for codes, _ in lookups]) if lookups else []
+        for row_codes, value in zip(code_rows, values):
+            if value is None or value != value:
+                continue
+            totals[row_codes] = totals.get(row_codes, 0) + value
+        groups = OrderedDict()
+        for row_codes, total in totals.items():
+            key = tuple(lookup[code] for code, (_, lookup) in zip(row_codes, lookups))
+            key = key[0] if single else key
+            groups[key] = groups.get(key, 0) + total
+        return groups
+
+    def join(self, values_by_asset_id, default=None):
+        """
+        Join a per asset value (e.g. a price) onto the rows.
+        :param values_by_asset_id: A dict of asset_id to value
+        :return: A list of the value for each row, or default where the asset has no value
+        """
+        lookup = [values_by_asset_id.get(asset_id, default) for asset_id in self.code_tables['asset_id'].values]
+        return [lookup[code] for code in self.codes['asset_id']]
+
+    def market_values(self, prices):
+        """
+        :param prices: A dict of asset_id to price, or a list of EODPrices
+        :return: The quantity * price of each row, None (or NaN for float frames) where there is no price
+        """
+        if not isinstance(prices, dict):
+            prices = {eod_price.asset_id: eod_price.price for eod_price in prices}
+        if self.exact:
+            return [quantity * price if price is not None else None
+                    for quantity, price in zip(self.quantities, self.join(prices))]
+        prices = {asset_id: float(price) for asset_id, price in prices.items()}
+        return array(str('d'), [quantity * price for quantity, price
+                                in zip(self.quantities, self.join(prices, default=float('nan')))])
@@ -0,0 +1,180 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from bisect import bisect_left, bisect_right, insort
+import datetime
+
+from amaascore.transactions.position import Position
+from amaascore.transactions.position_engine import ACCOUNTING_TYPES, ZERO, accounting_date, position_key, \
+    signed_quantity
+
+
+class PositionHistory(object):
+    """
+    Positions over time, built locally from transactions.  The net change to each position is kept per date, together
+    with a full snapshot of the positions every checkpoint_interval dates, so the positions as of any date are the
+    nearest earlier checkpoint plus a short replay of the changes since.  Like the PositionEngine, later versions of a
+    transaction replace the earlier ones.
+    """
+
+    def __init__(self, accounting_type='Transaction Date', checkpoint_interval=30):
+        """
+        :param accounting_type: 'Transaction Date' or 'Settlement Date' - which date a transaction counts from
+        :param checkpoint_interval: The number of dates with changes between each checkpoint
+        """
+        if accounting_type not in ACCOUNTING_TYPES:
+            raise ValueError('Invalid accounting type: %s' % accounting_type)
+        if checkpoint_interval < 1:
+            raise ValueError('checkpoint_interval must be at least 1')
+        self.accounting_type = accounting_type
+        self.checkpoint_interval = checkpoint_interval
+        # date -> {position key: change in quantity}, with the dates kept sorted for range lookups
+        self.deltas = {}
+        self.dates = []
+        # (asset_manager_id, transaction_id) -> (version, position key, quantity, accounting date)
+        self.contributions = {}
+        # date -> {position key: quantity} as at the end of that date
+        self.checkpoints = {}
+        self.checkpoint_dates = []
+        self._stale_from = None
+
+    def _add_delta(self, date, key, quantity):
+        if not quantity:
+            return
+        if date not in self.deltas:
+            self.deltas[date] = {}
+            insort(self.dates, date)
+        deltas = self.deltas[date]
+        total = deltas.get(key, ZERO) + quantity
+        if total:
+            deltas[key] = total
+        else:
+            deltas.pop(key, None)
+        # Any checkpoint on or after this date no longer reflects the history
+        if self._stale_from is None or date < self._stale_from:
+            self._stale_from = date
+
+    def apply(self, transaction):
+        """
+        :param transaction: A new or updated transaction
+        :return: True if the transaction was applied, False if a later version has already been applied
+        """
+        transaction_key = (transaction.asset_manager_id, transaction.transaction_id)
+        previous = self.contributions.get(transaction_key)
+        if previous is not None:
+            if transaction.version < previous[0]:
+                return False
+            self._add_delta(previous[3], previous[1], -previous[2])
+        date = accounting_date(transaction, self.accounting_type)
+        key = position_key(transaction)
+        quantity = signed_quantity(transaction)
+        self.contributions[transaction_key] = (transaction.version, key, quantity, date)
+        self._add_delta(date, key, quantity)
+        return True
+
+    def apply_all(self, transactions):
+        for transaction in transactions:
+            self.apply(transaction)
+
+    def remove(self, asset_manager_id, transaction_id):
+        previous = self.contributions.pop((asset_manager_id, transaction_id), None)
+        if previous is not None:
+            self._add_delta(previous[3], previous[1], -previous[2])
+
+    def _refresh_checkpoints(self):
+        if self._stale_from is None:
+            return
+        index = bisect_left(self.checkpoint_dates, self._stale_from)
+        for checkpoint_date in self.checkpoint_dates[index:]:
+            del self.checkpoints[checkpoint_date]
+        del self.checkpoint_dates[index:]
+        if self.checkpoint_dates:
+            start = self.checkpoint_dates[-1]
+            quantities = dict(self.checkpoints[start])
+            date_index = bisect_right(self.dates, start)
+        else:
+            quantities = {}
+            date_index = 0
+        for count, date in enumerate(self.dates[date_index:], 1):
+            self._replay(quantities, date)
+            if count % self.checkpoint_interval == 0:
+                self.checkpoints[date] = dict(quantities)
+                self.checkpoint_dates.append(date)
+        self._stale_from = None
+
+    def _replay(self, quantities, date):
+        for key, quantity in self.deltas[date].items():
+            total = quantities.get(key, ZERO) + quantity
+            if total:
+                quantities[key] = total
+            else:
+                quantities.pop(key, None)
+
+    def _quantities_as_of(self, position_date):
+        self._refresh_checkpoints()
+        index = bisect_right(self.checkpoint_dates, position_date)
+        if index:
+            checkpoint_date = self.checkpoint_dates[index - 1]
+            quantities = dict(self.checkpoints[checkpoint_date])
+            start = bisect_right(self.dates, checkpoint_date)
+        else:
+            quantities = {}
+            start = 0
+        for date in self.dates[start:bisect_right(self.dates, position_date)]:
+            self._replay(quantities, date)
+        return quantities
+
+    def quantity_as_of(self, asset_manager_id, book_id, asset_id, position_date):
+        return self._quantities_as_of(position_date).get((asset_manager_id, book_id, asset_id), ZERO)
+
+    def positions_as_of(self, position_date, asset_manager_id=None, book_ids=None, asset_ids=None):
+        """
+        :param position_date: The date to return the positions for, including everything on that date
+        :param asset_manager_id: Optionally restrict to a single asset manager
+        :param book_ids: Optionally restrict to a list of books
+        :param asset_ids: Optionally restrict to a list of assets
+        :return: A list of Positions, excluding flat positions
+        """
+        quantities = self._quantities_as_of(position_date)
+        return [_position(key, quantity) for key, quantity in quantities.items()
+                if _matches(key, asset_manager_id, book_ids, asset_ids)]
+
+    def position_series(self, start_date, end_date, asset_manager_id=None, book_ids=None, asset_ids=None):
+        """
+        The daily positions for each book over a range of dates, replaying the history once rather than looking up
+        each date separately.
+        :param start_date: The first date in the series
+        :param end_date: The last date in the series (inclusive)
+        :param asset_manager_id: Optionally restrict to a single asset manager
+        :param book_ids: Optionally restrict to a list of books
+        :param asset_ids: Optionally restrict to a list of assets
+        :return: A dict of book_id to a list of (date, [Positions]) for every date in the range - books which are flat
+        throughout are not included
+        """
+        quantities = self._quantities_as_of(start_date)
+        series = {}
+        days = (end_date - start_date).days
+        for offset in range(days + 1):
+            date = start_date + datetime.timedelta(days=offset)
+            if offset and date in self.deltas:
+                self._replay(quantities, date)
+            books = {}
+            for key, quantity in quantities.items():
+                if _matches(key, asset_manager_id, book_ids, asset_ids):
+                    books.setdefault(key[1], []).append(_position(key, quantity))
+            for book_id in books:
+                if book_id not in series:
+                    # The book was flat on the earlier dates
+                    series[book_id] = [(start_date + datetime.timedelta(days=earlier), []) for earlier in range(offset)]
+            for book_id, book_series in series.items():
+                book_series.append((date, books.get(book_id, [])))
+        return series
+
+
+def _matches(key, asset_manager_id, book_ids, asset_ids):
+    return ((asset_manager_id is None or key[0] == asset_manager_id) and
+            (not book_ids or key[1] in book_ids) and
+            (not asset_ids or key[2] in asset_ids))
+
+
+def _position(key, quantity):
+    return Position(asset_manager_id=key[0], book_id=key[1], asset_id=key[2], quantity=quantity)
@@ -0,0 +1,96 @@
+"""
+Local double-entry postings.  The ledger entries for a transaction can be derived from the transaction itself, so a
+batch of transactions does not need a round-trip per trade to the server (see Transaction.postings) to see them.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from amaascore.transactions.enums import CASH_TRANSACTION_TYPES
+from amaascore.transactions.position_engine import INACTIVE_STATUSES, TRANSACTION_ACTION_SIGNS, ZERO, settlement_cash
+
+POSTING_TYPES = {'Asset', 'Cash', 'Charge'}
+
+
+def _legs(transaction, posting_type, asset_id, quantity, **extra):
+    # Each leg is posted to the book and offset in the counterparty book, so every leg balances
+    legs = []
+    for book_id, book_quantity in [(transaction.asset_book_id, quantity),
+                                   (transaction.counterparty_book_id, -quantity)]:
+        posting = {'asset_manager_id': transaction.asset_manager_id, 'transaction_id': transaction.transaction_id,
+                   'posting_type': posting_type, 'book_id': book_id, 'asset_id': asset_id,
+                   'quantity': book_quantity, 'settlement_date': transaction.settlement_date}
+        posting.update(extra)
+        legs.append(posting)
+    return legs
+
+
+def transaction_postings(transaction):
+    """
+    The asset leg moves the quantity of the asset, the cash leg the gross settlement in the settlement currency and a
+    charge leg each charge in its own currency, all paid by the book.  Cash transactions only have an asset leg, as
+    their asset is the cash.  Inactive (e.g. cancelled) transactions have no postings.
+    :param transaction: A Transaction or CashTransaction
+    :return: A list of postings, each a dict of asset_manager_id, transaction_id, posting_type, book_id, asset_id,
+    quantity and settlement_date, plus charge_type and net_affecting for charges
+    """
+    if transaction.transaction_status in INACTIVE_STATUSES:
+        return []
+    sign = TRANSACTION_ACTION_SIGNS[transaction.transaction_action]
+    postings = _legs(transaction, 'Asset', transaction.asset_id, sign * transaction.quantity)
+    if transaction.transaction_type in CASH_TRANSACTION_TYPES:
+        return postings
+    postings += _legs(transaction, 'Cash', transaction.settlement_currency, settlement_cash(transaction))
+    for charge_type in sorted(transaction.charges):
+        charge = transaction.charges[charge_type]
+        postings += _legs(transaction, 'Charge', charge.currency, -charge.charge_value, charge_type=charge_type,
+                          net_affecting=charge.net_affecting)
+    return postings
+
+
+def generate_postings(transactions):
+    """
+    :param transactions: A list of transactions
+    :return: A dict of (asset_manager_id, transaction_id) to the list of postings for that transaction
+    """
+    return {(transaction.asset_manager_id, transaction.transaction_id): transaction_postings(transaction)
+            for transaction in transactions}
+
+
+def _posting_attribute(posting, attribute):
+    if isinstance(posting, dict):
+        return posting.get(attribute)
+    return getattr(posting, attribute, None)
+
+
+def posting_balances(postings):
+    """
+    :param postings: A list of postings - either dicts or objects with book_id, asset_id and quantity
+    :return: A dict of (book_id, asset_id) to the total quantity posted
+    """
+    balances = {}
+    for posting in postings:
+        key = (_posting_attribute(posting, 'book_id'), _posting_attribute(posting, 'asset_id'))
+        balances[key] = balances.get(key, ZERO) + _posting_attribute(posting, 'quantity')
+    return balances
+
+
+def compare_postings(postings, server_postings, tolerance=ZERO):
+    """
+    Check locally generated postings against the server's - e.g. Transaction.postings once the transaction has been
+    saved.  The postings are compared by their total quantity per book and asset, so the two do not need to split the
+    legs the same way.
+    :param postings: The local postings
+    :param server_postings: The server postings
+    :param tolerance: The largest difference which is not reported
+    :return: A list of breaks, each a dict of book_id, asset_id, quantity (the local total), server_quantity and
+    difference
+    """
+    balances = posting_balances(postings)
+    server_balances = posting_balances(server_postings)
+    breaks = []
+    for key in sorted(set(balances) | set(server_balances), key=lambda key: tuple(str(part) for part in key)):
+        quantity = balances.get(key, ZERO)
+        server_quantity = server_balances.get(key, ZERO)
+        if abs(quantity - server_quantity) > tolerance:
+            breaks.append({'book_id': key[0], 'asset_id': key[1], 'quantity': quantity,
+                           'server_quantity': server_quantity, 'difference': quantity - server_quantity})
+    return breaks
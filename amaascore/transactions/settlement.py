@@ -0,0 +1,118 @@
+"""
+Batch settlement calculations.  Gross settlement, the net effect of the charges and net settlement are calculated a
+column at a time for a whole list of transactions, along with the total for each charge type and the settlement
+totals per currency.  Exact mode keeps everything in Decimal, as on the Transaction itself, while fast mode uses
+arrays of doubles for large what-if runs where rounding at the cent level is acceptable.  Fast mode is for columns
+which are already floats (e.g. loaded from a file) - converting Decimal columns to floats costs about as much as the
+Decimal arithmetic it saves, so those are best calculated in exact mode.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from array import array
+from collections import OrderedDict
+from decimal import Decimal
+from operator import add, mul, sub
+
+from amaascore.core.columnar import to_columns
+
+SETTLEMENT_ATTRIBUTES = ['quantity', 'price', 'settlement_currency']
+CHARGE_PREFIX = 'charges.'
+CHARGE_VALUE_SUFFIX = '.charge_value'
+NET_AFFECTING_SUFFIX = '.net_affecting'
+
+
+def settlement_columns(transactions):
+    """
+    Only the charge value and net_affecting columns are extracted for each charge type, which is much cheaper than
+    flattening every charge attribute with to_columns.
+    :param transactions: A list of Transactions
+    :return: The columns needed for calculate_settlements
+    """
+    columns = to_columns(transactions, attributes=SETTLEMENT_ATTRIBUTES)
+    charges = [transaction.charges for transaction in transactions]
+    charge_types = OrderedDict.fromkeys(charge_type for collection in charges for charge_type in collection)
+    for charge_type in sorted(charge_types):
+        type_charges = [collection.get(charge_type) for collection in charges]
+        prefix = CHARGE_PREFIX + charge_type
+        columns[prefix + CHARGE_VALUE_SUFFIX] = [None if charge is None else charge.charge_value
+                                                 for charge in type_charges]
+        columns[prefix + NET_AFFECTING_SUFFIX] = [None if charge is None else charge.net_affecting
+                                                  for charge in type_charges]
+    return columns
+
+
+def _charge_types(columns):
+    return [name[len(CHARGE_PREFIX):-len(CHARGE_VALUE_SUFFIX)] for name in columns
+            if name.startswith(CHARGE_PREFIX) and name.endswith(CHARGE_VALUE_SUFFIX)]
+
+
+def _decimal(value):
+    if isinstance(value, float):
+        # Via the shortest repr, so that 0.1 is Decimal('0.1') rather than its binary expansion
+        return Decimal(repr(value))
+    return Decimal(value or 0)
+
+
+def _numbers(values, exact):
+    """ Missing values (e.g. a charge type which a transaction does not have) are treated as zero """
+    if exact:
+        return [value if type(value) is Decimal else _decimal(value) for value in values]
+    if isinstance(values, array):
+        return values
+    try:
+        # Converts a list of numbers in one call, without a Python level loop
+        return array(str('d'), values)
+    except TypeError:
+        return array(str('d'), (float(value or 0) for value in values))
+
+
+def calculate_settlements(data, exact=True):
+    """
+    Note that settlement amounts which have been set explicitly on a Transaction are not used - the amounts are always
+    calculated from the quantity, price and charges.
+
+    :param data: A list of Transactions, or their columns - from settlement_columns, or the equivalent from
+    to_columns / json_to_columns with children=['charges']
+    :param exact: True for Decimal results, False for arrays of floats.  See the module docstring for which is faster.
+    :return: An OrderedDict of gross_settlement, charges_net_effect and net_settlement (a value per transaction),
+    charge_totals (charge type to total) and currency_totals (settlement currency to a dict of gross_settlement and
+    net_settlement totals)
+    """
+    columns = settlement_columns(data) if isinstance(data, list) else data
+    quantities = _numbers(columns['quantity'], exact)
+    prices = _numbers(columns['price'], exact)
+    zero = Decimal(0) if exact else 0.0
+    gross_settlements = list(map(mul, quantities, prices))
+    charges_net_effects = [zero] * len(gross_settlements)
+    charge_totals = OrderedDict()
+    for charge_type in _charge_types(columns):
+        prefix = CHARGE_PREFIX + charge_type
+        values = _numbers(columns[prefix + CHARGE_VALUE_SUFFIX], exact)
+        net_affecting = columns.get(prefix + NET_AFFECTING_SUFFIX)
+        if net_affecting is None:
+            # Charges are net affecting by default
+            charges_net_effects = list(map(add, charges_net_effects, values))
+        else:
+            charges_net_effects = [effect + value if flag else effect
+                                   for effect, value, flag in zip(charges_net_effects, values, net_affecting)]
+        charge_totals[charge_type] = sum(values, zero)
+    net_settlements = list(map(sub, gross_settlements, charges_net_effects))
+    currency_totals = OrderedDict()
+    for currency, gross_settlement, net_settlement in zip(columns['settlement_currency'], gross_settlements,
+                                                          net_settlements):
+        totals = currency_totals.get(currency)
+        if totals is None:
+            totals = currency_totals[currency] = {'gross_settlement': zero, 'net_settlement': zero}
+        totals['gross_settlement'] += gross_settlement
+        totals['net_settlement'] += net_settlement
+    if not exact:
+        gross_settlements = array(str('d'), gross_settlements)
+        charges_net_effects = array(str('d'), charges_net_effects)
+        net_settlements = array(str('d'), net_settlements)
+    results = OrderedDict()
+    results['gross_settlement'] = gross_settlements
+    results['charges_net_effect'] = charges_net_effects
+    results['net_settlement'] = net_settlements
+    results['charge_totals'] = charge_totals
+    results['currency_totals'] = currency_totals
+    return results
@@ -1,8 +1,6 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import copy
 import datetime
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 import uuid
@@ -10,7 +8,8 @@ import uuid
 from amaascore.error_messages import ERROR_LOOKUP
 from amaascore.exceptions import TransactionNeedsSaving
 from amaascore.core.amaas_model import AMaaSModel
-from amaascore.transactions.children import Charge, Code, Comment, Link, Party, Rate, Reference
+from amaascore.core.date_utils import parse_date, parse_datetime
+from amaascore.transactions.children import Charge, Code, Comment, Link, LinkSet, Party, Rate, Reference
 from amaascore.transactions.enums import TRANSACTION_ACTIONS, TRANSACTION_STATUSES, TRANSACTION_TYPES
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
@@ -82,7 +81,8 @@ class Transaction(AMaaSModel):
         self.charges = charges.copy() if charges else {}
         self.codes = codes.copy() if codes else {}
         self.comments = comments.copy() if comments else {}
-        self.links = links.copy() if links else {}
+        self.links = {link_type: LinkSet(link_set) if isinstance(link_set, set) else link_set
+                      for link_type, link_set in links.items()} if links else {}
         self.parties = parties.copy() if parties else {}
         self.rates = rates.copy() if rates else {}
         self.references = references.copy() if references else {}
@@ -156,7 +156,7 @@ class Transaction(AMaaSModel):
         :return:
         """
         if value:
-            self._transaction_date = parse(value).date() if isinstance(value, type_check) else value
+            self._transaction_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def settlement_date(self):
@@ -170,7 +170,7 @@ class Transaction(AMaaSModel):
         :return:
         """
         if value:
-            self._settlement_date = parse(value).date() if isinstance(value, type_check) else value
+            self._settlement_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def execution_time(self):
@@ -184,12 +184,12 @@ class Transaction(AMaaSModel):
         :return:
         """
         if value:
-            self._execution_time = parse(value) if isinstance(value, type_check) else value
+            self._execution_time = parse_datetime(value) if isinstance(value, type_check) else value
 
     @property
     def gross_settlement(self):
         if hasattr(self, '_gross_settlement'):
-            return self.__gross_settlement
+            return self._gross_settlement
         return self.quantity * self.price
 
     @gross_settlement.setter
@@ -337,7 +337,8 @@ class Transaction(AMaaSModel):
     # is a change, e.g. for the case of a @property on the collection.  Since we don't have that case yet for
     # transactions, I have not yet filled out all of these.
     def upsert_code(self, code_type, code):
-        codes = copy.deepcopy(self.codes)
+        # Copy on write - only the dict is copied, the unchanged children are shared with the previous version
+        codes = self.codes.copy()
         codes.update({code_type: code})
         self.codes = codes
 
@@ -352,7 +353,9 @@ class Transaction(AMaaSModel):
         if link_set is None:
             self.links.pop(link_type, None)
             return
-        links = copy.deepcopy(self.links)
+        if isinstance(link_set, set) and not isinstance(link_set, LinkSet):
+            link_set = LinkSet(link_set)
+        links = self.links.copy()
         links.update({link_type: link_set})
         self.links = links
 
@@ -360,8 +363,8 @@ class Transaction(AMaaSModel):
         new_link = Link(linked_transaction_id=linked_transaction_id)
         link_set = self.links.get(link_type)
         if link_set:
-            if not isinstance(link_set, set):
-                link_set = {link_set}
+            if not isinstance(link_set, LinkSet):
+                link_set = LinkSet(link_set if isinstance(link_set, set) else {link_set})
             link_set.add(new_link)
         else:
             link_set = new_link
@@ -371,15 +374,18 @@ class Transaction(AMaaSModel):
         link_set = self.links.get(link_type)
         if not link_set:
             raise KeyError(ERROR_LOOKUP.get('transaction_link_not_found'))
-        if isinstance(link_set, Link):
+        if not isinstance(link_set, (set, frozenset)):
+            # A single Link or FrozenLink
             if link_set.linked_transaction_id == linked_transaction_id:
                 link_set = None
             else:
                 raise KeyError(ERROR_LOOKUP.get('transaction_link_not_found'))
         else:
-            output = [link for link in link_set if link.linked_transaction_id == linked_transaction_id]
-            if output:
-                link_set.remove(output[0])
+            if not isinstance(link_set, LinkSet):
+                link_set = LinkSet(link_set)
+            link = link_set.get(linked_transaction_id)
+            if link is not None:
+                link_set.remove(link)
             else:
                 raise KeyError(ERROR_LOOKUP.get('transaction_link_not_found'))
         self.upsert_link_set(link_type=link_type, link_set=link_set)
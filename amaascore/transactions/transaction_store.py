@@ -0,0 +1,177 @@
+"""
+An in-memory store of transactions with secondary indexes on the same dimensions as TransactionsInterface.search, so
+repeated searches over a loaded set of transactions do not each need a round-trip to AMaaS.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from bisect import bisect_left, bisect_right
+import sys
+
+from amaascore.core.date_utils import parse_date
+from amaascore.transactions.utils import json_to_transaction
+
+type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
+
+
+def _link_ids(transaction):
+    for link in transaction.links.values():
+        if isinstance(link, (set, frozenset)):
+            for item in link:
+                yield item.linked_transaction_id
+        else:
+            yield link.linked_transaction_id
+
+
+# The search parameter for each index, and the values of that dimension for a transaction
+INDEXES = {
+    'asset_manager_ids': lambda transaction: [transaction.asset_manager_id],
+    'transaction_ids': lambda transaction: [transaction.transaction_id],
+    'transaction_statuses': lambda transaction: [transaction.transaction_status],
+    'asset_book_ids': lambda transaction: [transaction.asset_book_id],
+    'counterparty_book_ids': lambda transaction: [transaction.counterparty_book_id],
+    'asset_ids': lambda transaction: [transaction.asset_id],
+    'code_types': lambda transaction: transaction.codes.keys(),
+    'code_values': lambda transaction: [code.code_value for code in transaction.codes.values()],
+    'link_types': lambda transaction: transaction.links.keys(),
+    'linked_transaction_ids': _link_ids,
+    'party_types': lambda transaction: transaction.parties.keys(),
+    'party_ids': lambda transaction: [party.party_id for party in transaction.parties.values()],
+    'reference_types': lambda transaction: transaction.references.keys(),
+    'reference_values': lambda transaction: [reference.reference_value
+                                             for reference in transaction.references.values()],
+    'client_ids': lambda transaction: [getattr(transaction, 'client_id', None)],
+}
+
+
+def _as_date(value):
+    return parse_date(value) if isinstance(value, type_check) else value
+
+
+class TransactionStore(object):
+    """
+    Holds the latest version of each transaction, keyed by asset manager and transaction ID.  Each search dimension has
+    an index of value to the matching keys, and the keys are also kept sorted by transaction date so that date range
+    filters are a bisect rather than a scan.
+    """
+
+    def __init__(self, transactions=None):
+        self.transactions = {}
+        self.indexes = {name: {} for name in INDEXES}
+        self._dates = []
+        self._date_keys = []
+        # The indexed date and values for each key, in case the transaction object is modified after it is added
+        self._indexed = {}
+        self.load(transactions or [])
+
+    def __len__(self):
+        return len(self.transactions)
+
+    def __contains__(self, key):
+        return key in self.transactions
+
+    def get(self, asset_manager_id, transaction_id):
+        return self.transactions.get((asset_manager_id, transaction_id))
+
+    def add(self, transaction):
+        """
+        :param transaction:
+        :return: True if the transaction was stored, False if a later version is already in the store
+        """
+        key = (transaction.asset_manager_id, transaction.transaction_id)
+        existing = self.transactions.get(key)
+        if existing is not None:
+            if transaction.version < existing.version:
+                return False
+            self._unindex(key)
+        self.transactions[key] = transaction
+        indexed_values = {}
+        for name, values in INDEXES.items():
+            index = self.indexes[name]
+            indexed_values[name] = list(values(transaction))
+            for value in indexed_values[name]:
+                index.setdefault(value, set()).add(key)
+        transaction_date = transaction.transaction_date
+        position = bisect_right(self._dates, transaction_date)
+        self._dates.insert(position, transaction_date)
+        self._date_keys.insert(position, key)
+        self._indexed[key] = (transaction_date, indexed_values)
+        return True
+
+    def load(self, transactions):
+        """
+        :param transactions: Any iterable of transactions - e.g. the results of search or transactions_by_asset_manager,
+        or a stream of decoded transactions
+        :return: The number of transactions stored
+        """
+        return sum(1 for transaction in transactions if self.add(transaction))
+
+    def load_json(self, json_transactions):
+        return self.load(json_to_transaction(json_transaction) for json_transaction in json_transactions)
+
+    def remove(self, asset_manager_id, transaction_id):
+        key = (asset_manager_id, transaction_id)
+        transaction = self.transactions.pop(key, None)
+        if transaction is not None:
+            self._unindex(key)
+        return transaction
+
+    def _unindex(self, key):
+        transaction_date, indexed_values = self._indexed.pop(key)
+        for name, values in indexed_values.items():
+            index = self.indexes[name]
+            for value in values:
+                keys = index.get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[value]
+        start = bisect_left(self._dates, transaction_date)
+        end = bisect_right(self._dates, transaction_date)
+        position = self._date_keys.index(key, start, end)
+        del self._dates[position]
+        del self._date_keys[position]
+
+    def search(self, asset_manager_ids=[], transaction_ids=[], transaction_statuses=[],
+               asset_book_ids=[], counterparty_book_ids=[], asset_ids=[], transaction_date_start=None,
+               transaction_date_end=None, code_types=[], code_values=[], link_types=[], linked_transaction_ids=[],
+               party_types=[], party_ids=[], reference_types=[], reference_values=[], client_ids=[]):
+        """
+        The same filters as TransactionsInterface.search - a transaction matches if it has any of the values for every
+        filter which is specified.
+        :return: A list of the matching transactions in transaction date order
+        """
+        filters = {'asset_manager_ids': asset_manager_ids, 'transaction_ids': transaction_ids,
+                   'transaction_statuses': transaction_statuses, 'asset_book_ids': asset_book_ids,
+                   'counterparty_book_ids': counterparty_book_ids, 'asset_ids': asset_ids, 'code_types': code_types,
+                   'code_values': code_values, 'link_types': link_types,
+                   'linked_transaction_ids': linked_transaction_ids, 'party_types': party_types,
+                   'party_ids': party_ids, 'reference_types': reference_types, 'reference_values': reference_values,
+                   'client_ids': client_ids}
+        matches = []
+        for name, values in filters.items():
+            if values:
+                index = self.indexes[name]
+                keys = set()
+                for value in values:
+                    keys.update(index.get(value, ()))
+                matches.append(keys)
+        date_start = None if transaction_date_start is None else _as_date(transaction_date_start)
+        date_end = None if transaction_date_end is None else _as_date(transaction_date_end)
+        start = 0 if date_start is None else bisect_left(self._dates, date_start)
+        end = len(self._dates) if date_end is None else bisect_right(self._dates, date_end)
+        if not matches:
+            return [self.transactions[key] for key in self._date_keys[start:end]]
+        # Intersect the smallest sets first to keep the intermediate results small
+        matches.sort(key=len)
+        keys = matches[0].intersection(*matches[1:])
+        if len(keys) >= end - start:
+            return [self.transactions[key] for key in self._date_keys[start:end] if key in keys]
+        # A selective filter - check the dates of the matches rather than scanning the whole date range
+        dated_keys = []
+        for key in keys:
+            transaction_date = self._indexed[key][0]
+            if (date_start is None or transaction_date >= date_start) and (date_end is None or
+                                                                           transaction_date <= date_end):
+                dated_keys.append((transaction_date, key))
+        dated_keys.sort(key=lambda dated_key: dated_key[0])
+        return [self.transactions[key] for _, key in dated_keys]
@@ -1,5 +1,6 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.interning import intern_json
 from amaascore.transactions.cash_transaction import CashTransaction
 from amaascore.transactions.enums import CASH_TRANSACTION_TYPES
 from amaascore.transactions.position import Position
@@ -8,11 +9,13 @@ from amaascore.transactions.transaction import Transaction
 import inspect
 
 def json_to_position(json_position):
+    json_position = intern_json(json_position)
     position = Position(**json_position)
     return position
 
 
 def json_to_transaction(json_transaction):
+    json_transaction = intern_json(json_transaction)
     # Iterate through the Transaction children, converting the various JSON attributes into the relevant class type
     for (collection_name, clazz) in Transaction.children().items():
         children = json_transaction.pop(collection_name, {})
@@ -0,0 +1,52 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import inspect
+import pickle
+import timeit
+
+from amaascore.assets.utils import json_to_asset
+from amaascore.core.binary import dumps, loads
+from amaascore.core.json_codec import JSONCodec
+from amaascore.tools.generate_asset import generate_asset
+from amaascore.tools.generate_transaction import generate_position, generate_transaction
+from amaascore.transactions.utils import json_to_position, json_to_transaction
+
+NUMBER_OF_MODELS = 2000
+REPEAT = 3
+
+
+def json_round_trip(models, hydrate):
+    codec = JSONCodec()
+    encode = lambda: codec.encode([model.to_json() for model in models])
+    data = encode()
+    decode = lambda: [hydrate(json_model) for json_model in codec.decode(data)]
+    return data, encode, decode
+
+
+def benchmark(name, models, hydrate):
+    data, json_encode, json_decode = json_round_trip(models, hydrate)
+    pickled = pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL)
+    binary = dumps(models)
+    formats = [('json', len(data), json_encode, json_decode),
+               ('pickle', len(pickled), lambda: pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL),
+                lambda: pickle.loads(pickled)),
+               ('binary', len(binary), lambda: dumps(models), lambda: loads(binary))]
+    print('%s x %s' % (NUMBER_OF_MODELS, name))
+    for format_name, size, encode, decode in formats:
+        encode_time = min(timeit.repeat(encode, number=1, repeat=REPEAT))
+        decode_time = min(timeit.repeat(decode, number=1, repeat=REPEAT))
+        print('  %-7s %10d bytes  encode %8.2f ms  decode %8.2f ms' % (format_name, size, encode_time * 1000,
+                                                                        decode_time * 1000))
+
+
+def main():
+    if not hasattr(inspect, 'getargspec'):
+        # json_to_transaction still relies on getargspec, which was removed in Python 3.11
+        inspect.getargspec = inspect.getfullargspec
+    benchmark('Transaction', [generate_transaction() for _ in range(NUMBER_OF_MODELS)], json_to_transaction)
+    benchmark('Position', [generate_position() for _ in range(NUMBER_OF_MODELS)], json_to_position)
+    benchmark('Asset', [generate_asset() for _ in range(NUMBER_OF_MODELS)], json_to_asset)
+
+
+if __name__ == '__main__':
+    main()
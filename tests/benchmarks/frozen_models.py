@@ -0,0 +1,36 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import timeit
+
+from amaascore.transactions.children import FrozenLink, Link
+
+NUMBER_OF_LINKS = 10000
+REPEAT = 3
+
+
+def benchmark(name, clazz):
+    links = [clazz(linked_transaction_id='T%s' % index) for index in range(NUMBER_OF_LINKS)]
+    # Equal but distinct objects, e.g. the same links hydrated again from a response
+    lookups = [clazz(linked_transaction_id='T%s' % index) for index in range(0, NUMBER_OF_LINKS, 2)]
+    link_set = set(links)
+    link_dict = {link: index for index, link in enumerate(links)}
+    timings = [
+        ('build set', lambda: set(links)),
+        ('membership', lambda: [link in link_set for link in lookups]),
+        ('dict lookup', lambda: [link_dict[link] for link in lookups]),
+        ('set difference', lambda: link_set - set(lookups)),
+        ('equality', lambda: [link == lookup for link, lookup in zip(links, lookups)]),
+    ]
+    print('%s x %s' % (NUMBER_OF_LINKS, name))
+    for operation, function in timings:
+        duration = min(timeit.repeat(function, number=1, repeat=REPEAT))
+        print('  %-15s %8.2f ms' % (operation, duration * 1000))
+
+
+def main():
+    benchmark('Link', Link)
+    benchmark('FrozenLink', FrozenLink)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import random
+import sys
+import timeit
+
+from amaascore.market_data.fx import CrossRates, FXRateCache
+from amaascore.tools.generate_market_data import generate_fx_rate
+
+NUMBER_OF_AMOUNTS = 1000000
+CURRENCIES = ['AUD', 'CAD', 'CHF', 'CNY', 'EUR', 'GBP', 'HKD', 'INR', 'JPY', 'KRW', 'MYR', 'NZD', 'SGD', 'THB',
+              'TWD']
+REPEAT = 3
+
+
+def main():
+    number_of_amounts = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_AMOUNTS
+    random.seed(1)
+    business_date = datetime.date(2017, 1, 3)
+    # Every currency is quoted against USD, so every other pair is triangulated
+    fx_rates = [generate_fx_rate(asset_id='USD' + currency, business_date=business_date,
+                                 rate=Decimal(random.randint(50, 20000)) / 100) for currency in CURRENCIES]
+    currencies = CURRENCIES + ['USD']
+    amounts = [random.uniform(1, 1000000) for _ in range(number_of_amounts)]
+    from_currencies = [random.choice(currencies) for _ in range(number_of_amounts)]
+
+    duration = min(timeit.repeat(lambda: FXRateCache(fx_rates=fx_rates).matrix(business_date), number=1, repeat=REPEAT))
+    print('Build matrix:    %8.4f s (%s currencies)' % (duration, len(currencies)))
+    engine = FXRateCache(fx_rates=fx_rates)
+    engine.matrix(business_date)
+    duration = min(timeit.repeat(lambda: engine.matrix(business_date), number=1000, repeat=REPEAT)) / 1000
+    print('Memoized matrix: %8.2f us' % (duration * 1000000))
+
+    sample = min(number_of_amounts, 100000)
+
+    def per_amount():
+        cross_rates = CrossRates(fx_rates)
+        return [float(cross_rates.convert(Decimal(amount), currency, 'EUR'))
+                for amount, currency in zip(amounts[:sample], from_currencies[:sample])]
+    duration = min(timeit.repeat(per_amount, number=1, repeat=REPEAT)) * number_of_amounts / sample
+    print('Per amount:      %8.2f s (scaled from %s amounts)' % (duration, sample))
+    duration = min(timeit.repeat(lambda: engine.convert(amounts, from_currencies, 'EUR', business_date), number=1,
+                                 repeat=REPEAT))
+    print('Vectorized:      %8.2f s (%s amounts, %.1fM amounts/s)' % (duration, number_of_amounts,
+                                                                       number_of_amounts / duration / 1000000))
+
+
+if __name__ == '__main__':
+    main()
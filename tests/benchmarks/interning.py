@@ -0,0 +1,78 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import inspect
+import random
+import timeit
+
+from amaascore.core.interning import STRING_POOL
+from amaascore.core.json_codec import JSONCodec
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.utils import json_to_transaction
+
+NUMBER_OF_TRANSACTIONS = 20000
+ASSET_MANAGER_ID = 1
+BOOK_IDS = ['BOOK%s' % i for i in range(20)]
+ASSET_IDS = ['ASSET%s' % i for i in range(200)]
+CURRENCIES = ['USD', 'SGD', 'JPY', 'EUR', 'GBP']
+
+
+def generate_payload():
+    """
+    A realistic bulk result - one asset manager, a handful of books and currencies and a few hundred assets.
+    """
+    transactions = []
+    for _ in range(NUMBER_OF_TRANSACTIONS):
+        currency = random.choice(CURRENCIES)
+        transactions.append(generate_transaction(asset_manager_id=ASSET_MANAGER_ID,
+                                                 asset_book_id=random.choice(BOOK_IDS),
+                                                 counterparty_book_id=random.choice(BOOK_IDS),
+                                                 asset_id=random.choice(ASSET_IDS),
+                                                 transaction_currency=currency,
+                                                 settlement_currency=currency).to_json())
+    return JSONCodec().encode(transactions)
+
+
+def hydrate(payload, intern):
+    json_transactions = JSONCodec().decode(payload)
+    if intern:
+        return [json_to_transaction(json_transaction) for json_transaction in json_transactions]
+    # Bypass the pool to measure the previous behaviour
+    attributes, STRING_POOL.attributes = STRING_POOL.attributes, set()
+    try:
+        return [json_to_transaction(json_transaction) for json_transaction in json_transactions]
+    finally:
+        STRING_POOL.attributes = attributes
+
+
+def measure(payload, intern):
+    # Python 3 only - imported here so that the tests can still be discovered on Python 2
+    import tracemalloc
+
+    STRING_POOL.clear()
+    tracemalloc.start()
+    transactions = hydrate(payload, intern)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    duration = min(timeit.repeat(lambda: hydrate(payload, intern), number=1, repeat=3))
+    del transactions
+    return size, peak, duration
+
+
+def main():
+    if not hasattr(inspect, 'getargspec'):
+        # json_to_transaction still relies on getargspec, which was removed in Python 3.11
+        inspect.getargspec = inspect.getfullargspec
+    payload = generate_payload()
+    print('%s transactions (%s bytes of JSON)' % (NUMBER_OF_TRANSACTIONS, len(payload)))
+    results = {}
+    for name, intern in [('plain', False), ('interned', True)]:
+        size, peak, duration = measure(payload, intern)
+        results[name] = size
+        print('  %-9s retained %8.2f MB  peak %8.2f MB  hydrate %8.2f ms' % (name, size / 1e6, peak / 1e6,
+                                                                              duration * 1000))
+    saved = results['plain'] - results['interned']
+    print('  saved     %8.2f MB (%.1f%%)' % (saved / 1e6, 100.0 * saved / results['plain']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import timeit
+
+from amaascore.core.json_codec import CODECS
+from amaascore.tools.generate_transaction import generate_transaction
+
+NUMBER_OF_TRANSACTIONS = 1000
+REPEAT = 5
+
+
+def payloads():
+    # What new / amend send - already converted to JSON types by to_interface()
+    interface_payload = [generate_transaction().to_interface() for _ in range(NUMBER_OF_TRANSACTIONS)]
+    # What partial / allocate_transaction send - raw Decimals, dates and sets go through json_handler
+    today = datetime.date.today()
+    raw_payload = [{'quantity': Decimal(i), 'price': Decimal('101.25'), 'settlement_date': today,
+                    'execution_time': datetime.datetime.utcnow(), 'book_ids': {'ABC', 'XYZ'}}
+                   for i in range(NUMBER_OF_TRANSACTIONS)]
+    return interface_payload, raw_payload
+
+
+def benchmark(codec, interface_payload, raw_payload):
+    encoded = codec.encode(interface_payload)
+    results = {'encode (to_interface)': min(timeit.repeat(lambda: codec.encode(interface_payload),
+                                                          number=1, repeat=REPEAT)),
+               'encode (raw values)': min(timeit.repeat(lambda: codec.encode(raw_payload), number=1, repeat=REPEAT)),
+               'decode': min(timeit.repeat(lambda: codec.decode(encoded), number=1, repeat=REPEAT))}
+    return results
+
+
+def main():
+    interface_payload, raw_payload = payloads()
+    print('%s transactions, best of %s runs' % (NUMBER_OF_TRANSACTIONS, REPEAT))
+    for name, codec_class in sorted(CODECS.items()):
+        try:
+            codec = codec_class()
+        except ImportError:
+            print('%-8s not installed' % name)
+            continue
+        for operation, seconds in sorted(benchmark(codec, interface_payload, raw_payload).items()):
+            print('%-8s %-22s %8.2f ms' % (name, operation, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
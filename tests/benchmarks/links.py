@@ -0,0 +1,53 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import timeit
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.children import Link
+
+NUMBER_OF_LINKS = 10000
+REPEAT = 3
+
+
+def build_netting_parent():
+    parent = generate_transaction(transaction_action='Deliver')
+    for index in range(NUMBER_OF_LINKS):
+        parent.add_link(link_type='NettingSet', linked_transaction_id='T%s' % index)
+    return parent
+
+
+def tear_down_netting_parent(parent):
+    for index in range(NUMBER_OF_LINKS):
+        parent.remove_link(link_type='NettingSet', linked_transaction_id='T%s' % index)
+
+
+def build_netting_parent_with_deepcopy(number_of_links):
+    """
+    The previous implementation - deepcopy the whole links dict on every upsert.
+    """
+    parent = generate_transaction(transaction_action='Deliver')
+    for index in range(number_of_links):
+        link_set = set(parent.links.get('NettingSet', set()))
+        link_set.add(Link(linked_transaction_id='T%s' % index))
+        links = copy.deepcopy(parent.links)
+        links.update({'NettingSet': link_set})
+        parent.links = links
+    return parent
+
+
+def main():
+    build = min(timeit.repeat(build_netting_parent, number=1, repeat=REPEAT))
+    parent = build_netting_parent()
+    tear_down = min(timeit.repeat(lambda: tear_down_netting_parent(copy.deepcopy(parent)), number=1, repeat=1))
+    print('%s links' % NUMBER_OF_LINKS)
+    print('  add_link     %8.2f ms' % (build * 1000))
+    print('  remove_link  %8.2f ms (including one deepcopy of the parent)' % (tear_down * 1000))
+    # The old approach is quadratic, so time a tenth of the links and the trend is clear enough
+    sample = NUMBER_OF_LINKS // 10
+    deepcopy_time = min(timeit.repeat(lambda: build_netting_parent_with_deepcopy(sample), number=1, repeat=1))
+    print('  deepcopy per upsert, %s links only  %8.2f ms' % (sample, deepcopy_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import random
+import time
+
+from amaascore.transactions.pnl import LotBook
+
+NUMBER_OF_LOTS = 1000000
+
+
+def benchmark(method):
+    # Python 3 only - imported here so that the tests can still be discovered on Python 2
+    import tracemalloc
+
+    random.seed(1)
+    trades = [(random.randint(1, 1000), random.uniform(10, 20)) for _ in range(NUMBER_OF_LOTS)]
+    start = time.time()
+    lot_book = LotBook(method)
+    for quantity, price in trades:
+        lot_book.trade(quantity, price)
+    opened = time.time() - start
+    start = time.time()
+    for quantity, price in trades[:NUMBER_OF_LOTS // 2]:
+        lot_book.trade(-quantity, price)
+    closed = time.time() - start
+    # Measured separately as tracing slows everything down
+    tracemalloc.start()
+    lot_book = LotBook(method)
+    for quantity, price in trades:
+        lot_book.trade(quantity, price)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('%s: open %s lots %.2f s (%.1f MB) - close half %.2f s' %
+          (method, NUMBER_OF_LOTS, opened, memory / 1024.0 / 1024.0, closed))
+
+
+def main():
+    for method in ['FIFO', 'LIFO', 'AVCO']:
+        benchmark(method)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+from decimal import Decimal
+import random
+import sys
+import timeit
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.settlement import calculate_settlements, settlement_columns
+
+NUMBER_OF_TRADES = 1000000
+# Creating a million Transaction objects takes far longer than anything measured here, so the per-object baseline
+# runs on a sample and is scaled up
+SAMPLE_SIZE = 20000
+REPEAT = 3
+
+
+def generate_columns(number_of_trades):
+    columns = OrderedDict()
+    columns['quantity'] = [Decimal(random.randint(1, 5000)) for _ in range(number_of_trades)]
+    columns['price'] = [Decimal(random.randint(100, 100000)) / 100 for _ in range(number_of_trades)]
+    columns['settlement_currency'] = [random.choice(['SGD', 'USD', 'JPY']) for _ in range(number_of_trades)]
+    for charge_type in ['Commission', 'Tax']:
+        columns['charges.%s.charge_value' % charge_type] = [Decimal(random.randint(100, 10000)) / 100
+                                                            for _ in range(number_of_trades)]
+        columns['charges.%s.net_affecting' % charge_type] = [random.choice([True, False])
+                                                             for _ in range(number_of_trades)]
+    return columns
+
+
+def per_object(transactions):
+    return [(transaction.gross_settlement, transaction.charges_net_effect(), transaction.net_settlement)
+            for transaction in transactions]
+
+
+def main():
+    number_of_trades = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_TRADES
+    transactions = [generate_transaction() for _ in range(SAMPLE_SIZE)]
+    sample = min(timeit.repeat(lambda: per_object(transactions), number=1, repeat=REPEAT))
+    print('Per object:      %8.2f s (scaled from %s transactions)' % (sample * number_of_trades / SAMPLE_SIZE,
+                                                                       SAMPLE_SIZE))
+    sample = min(timeit.repeat(lambda: calculate_settlements(settlement_columns(transactions)), number=1,
+                               repeat=REPEAT))
+    print('Columns + exact: %8.2f s (scaled from %s transactions)' % (sample * number_of_trades / SAMPLE_SIZE,
+                                                                       SAMPLE_SIZE))
+    columns = generate_columns(number_of_trades)
+    # e.g. columns loaded from a float source rather than from Decimal model attributes
+    float_columns = OrderedDict((name, [float(value) if isinstance(value, Decimal) else value for value in column])
+                                for name, column in columns.items())
+    # Fast mode on Decimal columns is included to show the cost of converting them to floats
+    for name, data, exact in [('Exact/Decimal:', columns, True), ('Exact/float:', float_columns, True),
+                              ('Fast/Decimal:', columns, False), ('Fast/float:', float_columns, False)]:
+        duration = min(timeit.repeat(lambda: calculate_settlements(data, exact=exact), number=1, repeat=REPEAT))
+        print('%-16s %8.2f s (%s trades)' % (name, duration, number_of_trades))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import unittest
 
-from amaascore.assets.children import Link
+from amaascore.assets.children import FrozenLink, Link
 
 
 class AssetChildrenTest(unittest.TestCase):
@@ -18,5 +18,12 @@ class AssetChildrenTest(unittest.TestCase):
         link = Link(linked_asset_id='TEST')
         self.assertEqual(type(link), Link)
 
+    def test_FrozenLink(self):
+        link = Link(linked_asset_id='TEST')
+        frozen = link.freeze()
+        self.assertEqual(type(frozen), FrozenLink)
+        self.assertEqual(frozen, FrozenLink(linked_asset_id='TEST', active=True))
+        self.assertEqual(frozen.thaw(), link)
+
 if __name__ == '__main__':
     unittest.main()
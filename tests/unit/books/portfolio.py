@@ -1 +1,43 @@
-from __future__ import absolute_import, division, print_function, unicode_literals
\ No newline at end of file
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+import unittest
+
+from amaascore.books.portfolio import Portfolio
+from amaascore.tools.generate_book import generate_book
+from amaascore.transactions.position import Position
+
+
+class PortfolioTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.books = [generate_book(asset_manager_id=1, book_id='A'), generate_book(asset_manager_id=1, book_id='B')]
+        self.books[0].positions = [Position(asset_manager_id=1, book_id='A', asset_id='X', quantity=Decimal(100)),
+                                   Position(asset_manager_id=1, book_id='A', asset_id='Y', quantity=Decimal(10))]
+        self.books[1].positions = [Position(asset_manager_id=1, book_id='B', asset_id='X', quantity=Decimal(-30))]
+        self.portfolio = Portfolio(books=self.books)
+
+    def tearDown(self):
+        pass
+
+    def test_PositionsByBook(self):
+        positions = self.portfolio.positions_by_book()
+        self.assertEqual(sorted(positions.keys()), ['A', 'B'])
+        self.assertEqual(len(positions['A']), 2)
+
+    def test_PositionsByAsset(self):
+        positions = self.portfolio.positions_by_asset()
+        self.assertEqual(sorted(positions.keys()), ['X', 'Y'])
+        self.assertEqual(positions['X'].quantity, Decimal(70))
+        self.assertEqual(positions['X'].book_id, None)
+        # The books' positions are not changed
+        self.assertEqual(self.books[0].positions[0].quantity, Decimal(100))
+
+    def test_ResetBooks(self):
+        self.assertEqual(self.portfolio.group_by('book_id'), {'A': 110, 'B': -30})
+        self.portfolio.books = self.books[:1]
+        self.assertEqual(self.portfolio.group_by('book_id'), {'A': 110})
+
+if __name__ == '__main__':
+    unittest.main()
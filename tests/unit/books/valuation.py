@@ -0,0 +1,77 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import unittest
+
+from amaascore.assets.asset import Asset
+from amaascore.books.portfolio import Portfolio
+from amaascore.books.valuation import ValuationEngine
+from amaascore.market_data.fx import FXRateCache
+from amaascore.tools.generate_book import generate_book
+from amaascore.tools.generate_market_data import generate_fx_rate
+from amaascore.transactions.position import Position
+from amaascore.transactions.position_frame import PositionFrame
+
+
+class ValuationEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.business_date = datetime.date(2017, 1, 3)
+        fx_rate_cache = FXRateCache()
+        fx_rate_cache.add(self.business_date, [generate_fx_rate(asset_id='USDJPY', rate=Decimal(100)),
+                                               generate_fx_rate(asset_id='EURUSD', rate=Decimal(2))])
+        self.engine = ValuationEngine(fx_rate_cache, reporting_currency='USD')
+        self.books = [generate_book(asset_manager_id=1, book_id='A'), generate_book(asset_manager_id=1, book_id='B')]
+        self.books[0].base_currency = 'EUR'
+        self.books[1].base_currency = 'JPY'
+        self.books[0].positions = [Position(asset_manager_id=1, book_id='A', asset_id='X', quantity=Decimal(100)),
+                                   Position(asset_manager_id=1, book_id='A', asset_id='Y', quantity=Decimal(10))]
+        self.books[1].positions = [Position(asset_manager_id=1, book_id='B', asset_id='X', quantity=Decimal(-30)),
+                                   Position(asset_manager_id=1, book_id='B', asset_id='Z', quantity=Decimal(5))]
+        self.assets = {'X': Asset(asset_manager_id=1, asset_id='X', fungible=True, currency='JPY'),
+                       'Y': Asset(asset_manager_id=1, asset_id='Y', fungible=True, currency='EUR'),
+                       'Z': Asset(asset_manager_id=1, asset_id='Z', fungible=True, currency='HKD')}
+        self.prices = {'X': Decimal(1000), 'Y': Decimal(4), 'Z': Decimal(1)}
+
+    def tearDown(self):
+        pass
+
+    def test_Value(self):
+        valuation = self.engine.value_portfolio(Portfolio(self.books), self.prices, self.assets, self.business_date)
+        rows = valuation.rows()
+        self.assertEqual(len(valuation), 4)
+        # 100 * 1000 JPY is 1000 USD and 500 EUR
+        self.assertEqual(rows[0]['market_value'], 100000)
+        self.assertEqual(rows[0]['base_market_value'], 500)
+        self.assertEqual(rows[0]['reporting_market_value'], 1000)
+        self.assertEqual(rows[1]['base_market_value'], 40)
+        # There is no rate for HKD
+        self.assertEqual(rows[3]['market_value'], 5)
+        self.assertIsNone(rows[3]['reporting_market_value'])
+        self.assertEqual(valuation.group_by('book_id', column='base_market_value'), {'A': 540, 'B': -30000})
+        self.assertEqual(valuation.group_by('book_id'), {'A': 1080, 'B': -300})
+        self.assertEqual(valuation.group_by('currency'), {'JPY': 700, 'EUR': 80})
+
+    def test_ValueFloats(self):
+        frame = PositionFrame.from_positions(self.books[0].positions + self.books[1].positions, exact=False)
+        del self.prices['Y']
+        valuation = self.engine.value(frame, self.prices, self.assets, self.business_date)
+        self.assertEqual(valuation.columns['base_currency'], ['USD'] * 4)
+        self.assertEqual(valuation.group_by('book_id'), {'A': 1000.0, 'B': -300.0})
+
+    def test_SingleCurrencyWithoutRates(self):
+        # Nothing needs converting, so no FX rates are needed for the date
+        engine = ValuationEngine(FXRateCache(), reporting_currency='JPY')
+        self.books[1].positions = [self.books[1].positions[0]]
+        for exact in [True, False]:
+            frame = PositionFrame.from_positions(self.books[1].positions, exact=exact)
+            valuation = engine.value(frame, self.prices, self.assets, datetime.date(2017, 1, 1),
+                                     books={'B': self.books[1]})
+            row = valuation.rows()[0]
+            self.assertEqual(row['base_market_value'], -30000, exact)
+            self.assertEqual(row['reporting_market_value'], -30000, exact)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,15 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+from decimal import Decimal
+import pickle
 import unittest
 
 from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.binary import dumps, loads
+from amaascore.core.reference import FrozenReference, Reference
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.children import Charge, FrozenCharge, FrozenLink, Link
 
 
 class AMaaSModelTest(unittest.TestCase):
@@ -12,6 +19,70 @@ class AMaaSModelTest(unittest.TestCase):
         self.assertEqual(type(model.version), int)
         self.assertEqual(model.version, 1)
 
+    def test_EqualityDoesNotMutate(self):
+        link = Link(linked_transaction_id='TEST', created_by='USER1')
+        other = Link(linked_transaction_id='TEST', created_by='USER2')
+        self.assertEqual(link, other)
+        self.assertEqual(link.created_by, 'USER1')
+        self.assertEqual(other.to_json().get('created_by'), 'USER2')
+        self.assertNotEqual(link, Link(linked_transaction_id='OTHER'))
+
+    def test_ContentDigest(self):
+        transaction = generate_transaction(quantity=Decimal('100'))
+        other = copy.deepcopy(transaction)
+        other.quantity = Decimal('100.00')
+        other.created_by = 'TEST'
+        other.upsert_link_set('Multiple', set(reversed(list(other.links['Multiple']))))
+        self.assertEqual(transaction.content_digest(), other.content_digest())
+        other.quantity = Decimal('101')
+        self.assertNotEqual(transaction.content_digest(), other.content_digest())
+
+
+class FrozenModelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+
+    def test_ValueSemantics(self):
+        reference = FrozenReference(reference_value='TEST', created_by='USER1')
+        other = FrozenReference('TEST', version=2)
+        self.assertEqual(reference, other)
+        self.assertEqual(hash(reference), hash(other))
+        self.assertEqual(len({reference, other, FrozenReference('OTHER')}), 2)
+        self.assertEqual(reference.created_by, 'USER1')
+        self.assertEqual(other.version, 2)
+        self.assertNotEqual(FrozenReference('TEST'), FrozenLink('TEST'))
+
+    def test_Immutable(self):
+        link = FrozenLink(linked_transaction_id='TEST')
+        with self.assertRaises(AttributeError):
+            link.linked_transaction_id = 'OTHER'
+        with self.assertRaises(AttributeError):
+            del link.linked_transaction_id
+        self.assertEqual(link.replace(linked_transaction_id='OTHER').linked_transaction_id, 'OTHER')
+        self.assertEqual(link.linked_transaction_id, 'TEST')
+
+    def test_Validation(self):
+        charge = FrozenCharge(charge_value='1.5', currency='USD')
+        self.assertEqual(charge.charge_value, Decimal('1.5'))
+        self.assertTrue(charge.net_affecting)
+
+    def test_FreezeAndThaw(self):
+        charge = Charge(charge_value=Decimal('2'), currency='SGD', net_affecting=False, version=3)
+        frozen = charge.freeze()
+        self.assertEqual(type(frozen), FrozenCharge)
+        self.assertEqual(frozen.to_json(), charge.to_json())
+        thawed = frozen.thaw()
+        self.assertEqual(type(thawed), Charge)
+        self.assertEqual(thawed, charge)
+        self.assertEqual(Reference(reference_value='REF').freeze(), FrozenReference(reference_value='REF'))
+
+    def test_Copies(self):
+        reference = FrozenReference(reference_value='TEST', version=2)
+        for copied in [copy.deepcopy(reference), pickle.loads(pickle.dumps(reference)), loads(dumps(reference))]:
+            self.assertEqual(copied, reference)
+            self.assertEqual(copied.version, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,95 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+from io import BytesIO
+import pytz
+import unittest
+
+from amaascore.core.binary import BinaryReader, BinaryWriter, dump_stream, dumps, load_stream, loads
+from amaascore.tools.generate_asset import generate_asset
+from amaascore.tools.generate_market_data import generate_fx_rate
+from amaascore.tools.generate_transaction import generate_position, generate_transaction
+
+
+def normalise(json_model):
+    # Sets of children (e.g. links) are rebuilt on decode, so they may iterate in a different order
+    return {key: sorted(value, key=repr) if isinstance(value, list) else
+            normalise(value) if isinstance(value, dict) else value
+            for key, value in json_model.items()}
+
+
+class BinaryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+
+    def tearDown(self):
+        pass
+
+    def test_BasicTypes(self):
+        values = [None, True, False, 0, -1, 2 ** 70, -2 ** 70, 1.5, 'caf\xe9', b'\x00\x01', [1, 'a'], (1, 2),
+                  {'a', 'b'}, frozenset(['c']), {'key': {'nested': [1]}, 1: 'int key'}]
+        for value in values:
+            self.assertEqual(loads(dumps(value)), value)
+            self.assertEqual(type(loads(dumps(value))), type(value))
+
+    def test_Decimals(self):
+        for value in ['0', '-0', '1.10', '-123.456789', '1E+5', '0.000001', '12345678901234567890.123456789012',
+                      'NaN', 'Infinity', '-Infinity']:
+            decoded = loads(dumps(Decimal(value)))
+            self.assertEqual(str(decoded), str(Decimal(value)))
+
+    def test_Dates(self):
+        values = [datetime.date(2017, 3, 14), datetime.datetime(2017, 3, 14, 10, 11, 12, 13),
+                  datetime.datetime(2017, 3, 14, 23, 59, 59, tzinfo=pytz.utc), datetime.timedelta(hours=18),
+                  datetime.timedelta(days=-1, microseconds=5)]
+        for value in values:
+            decoded = loads(dumps(value))
+            self.assertEqual(decoded, value)
+            self.assertEqual(type(decoded), type(value))
+        aware = datetime.datetime(2017, 3, 14, 10, tzinfo=pytz.timezone('Asia/Singapore').localize(
+            datetime.datetime(2017, 3, 14)).tzinfo)
+        self.assertEqual(loads(dumps(aware)).utcoffset(), aware.utcoffset())
+
+    def test_Models(self):
+        transaction = generate_transaction()
+        decoded = loads(dumps(transaction))
+        self.assertEqual(type(decoded), type(transaction))
+        self.assertEqual(normalise(decoded.to_json()), normalise(transaction.to_json()))
+        self.assertEqual(decoded.net_settlement, transaction.net_settlement)
+        asset = generate_asset()
+        self.assertEqual(loads(dumps(asset)).to_json(), asset.to_json())
+        fx_rate = generate_fx_rate()
+        self.assertEqual(loads(dumps(fx_rate)).rate_timestamp, fx_rate.rate_timestamp)
+
+    def test_Stream(self):
+        models = [generate_transaction() for _ in range(5)] + [generate_position() for _ in range(5)]
+        stream = BytesIO()
+        dump_stream(models, stream)
+        stream.seek(0)
+        decoded = list(load_stream(stream))
+        self.assertEqual([normalise(model.to_json()) for model in decoded],
+                         [normalise(model.to_json()) for model in models])
+
+    def test_StreamSharesStrings(self):
+        transaction = generate_transaction()
+        single = len(dumps(transaction))
+        stream = BytesIO()
+        writer = BinaryWriter(stream)
+        writer.write(transaction)
+        first = len(stream.getvalue())
+        writer.write(transaction)
+        self.assertLess(len(stream.getvalue()) - first, single / 2)
+        stream.seek(0)
+        self.assertEqual(len(list(BinaryReader(stream))), 2)
+
+    def test_InvalidData(self):
+        with self.assertRaises(TypeError):
+            dumps(object())
+        with self.assertRaises(ValueError):
+            BinaryReader(BytesIO(b'JUNK'))
+
+
+if __name__ == '__main__':
+    unittest.main()
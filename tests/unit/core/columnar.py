@@ -0,0 +1,69 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+import unittest
+
+from amaascore.core.columnar import json_to_columns, to_columns
+from amaascore.core.date_utils import parse_date
+from amaascore.tools.generate_market_data import generate_eod_price
+from amaascore.tools.generate_transaction import generate_position, generate_transaction
+
+
+class ColumnarTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transactions = [generate_transaction() for _ in range(5)]
+
+    def tearDown(self):
+        pass
+
+    def test_PositionColumns(self):
+        positions = [generate_position() for _ in range(3)]
+        columns = to_columns(positions)
+        self.assertEqual(columns['quantity'], [position.quantity for position in positions])
+        self.assertEqual(columns['book_id'], [position.book_id for position in positions])
+
+    def test_SelectedAttributes(self):
+        prices = [generate_eod_price() for _ in range(3)]
+        columns = to_columns(prices, attributes=['asset_id', 'price'])
+        self.assertEqual(list(columns.keys()), ['asset_id', 'price'])
+        self.assertEqual(type(columns['price'][0]), Decimal)
+
+    def test_TransactionChildren(self):
+        columns = to_columns(self.transactions, children=['charges', 'references', 'links'])
+        self.assertNotIn('charges', columns)
+        self.assertEqual(columns['charges.Tax.charge_value'],
+                         [transaction.charges['Tax'].charge_value for transaction in self.transactions])
+        self.assertEqual(columns['references.AMaaS.reference_value'],
+                         [transaction.transaction_id for transaction in self.transactions])
+        self.assertEqual(len(columns['links.Multiple.linked_transaction_id'][0]), 3)
+        self.assertNotIn('charges.Tax.version', columns)
+
+    def test_EmptyLinkSet(self):
+        for transaction in self.transactions[:2]:
+            for link in list(transaction.links['Multiple']):
+                transaction.remove_link('Multiple', link.linked_transaction_id)
+        columns = to_columns(self.transactions[:2], children=['links'])
+        self.assertNotIn('links.Multiple.linked_transaction_id', columns)
+        columns = to_columns(self.transactions, children=['links'])
+        self.assertEqual(columns['links.Multiple.linked_transaction_id'][:2], [None, None])
+        self.assertEqual(len(columns['links.Multiple.linked_transaction_id'][2]), 3)
+
+    def test_JsonToColumns(self):
+        json_transactions = [transaction.to_json() for transaction in self.transactions]
+        columns = json_to_columns(json_transactions, children=['charges'],
+                                  converters={'quantity': Decimal, 'transaction_date': parse_date})
+        model_columns = to_columns(self.transactions, children=['charges'])
+        self.assertEqual(columns['quantity'], model_columns['quantity'])
+        self.assertEqual(columns['transaction_date'], model_columns['transaction_date'])
+        self.assertEqual(columns['charges.Commission.currency'], model_columns['charges.Commission.currency'])
+        self.assertNotIn('charges', columns)
+
+    def test_Empty(self):
+        self.assertEqual(list(to_columns([], attributes=['quantity']).keys()), ['quantity'])
+        self.assertEqual(len(json_to_columns([])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from dateutil.parser import parse
+import unittest
+
+from amaascore.core.date_utils import clear_caches, parse_date, parse_datetime
+
+
+class DateUtilsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        clear_caches()
+
+    def tearDown(self):
+        pass
+
+    def test_ParseDate(self):
+        self.assertEqual(parse_date('2017-03-14'), datetime.date(2017, 3, 14))
+        self.assertEqual(parse_date('2017-03-14T10:11:12'), datetime.date(2017, 3, 14))
+
+    def test_ParseDatetimeMatchesDateutil(self):
+        values = ['2017-03-14', '2017-03-14T10:11', '2017-03-14T10:11:12', '2017-03-14T10:11:12.123',
+                  '2017-03-14T10:11:12.123456', '2017-03-14 10:11:12', '2017-03-14T10:11:12Z',
+                  '2017-03-14T10:11:12+00:00', '2017-03-14T10:11:12.5-05:30', '2017-03-14T10:11:12+0800']
+        for value in values:
+            parsed = parse_datetime(value)
+            self.assertEqual(parsed, parse(value), value)
+            self.assertEqual(parsed.utcoffset(), parse(value).utcoffset(), value)
+
+    def test_Isoformat(self):
+        now = datetime.datetime.utcnow()
+        self.assertEqual(parse_datetime(now.isoformat()), now)
+        today = datetime.date.today()
+        self.assertEqual(parse_date(today.isoformat()), today)
+
+    def test_Fallback(self):
+        self.assertEqual(parse_date('14 March 2017'), datetime.date(2017, 3, 14))
+        self.assertEqual(parse_date('20170314'), datetime.date(2017, 3, 14))
+
+    def test_InvalidDate(self):
+        with self.assertRaises(ValueError):
+            parse_date('2017-02-30')
+        with self.assertRaises(ValueError):
+            parse_date('not a date')
+
+    def test_Memoized(self):
+        first = parse_datetime('2017-03-14T10:11:12')
+        self.assertIs(parse_datetime('2017-03-14T10:11:12'), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import datetime
+from decimal import Decimal
+import pickle
+import unittest
+
+from amaascore.core.binary import dumps, loads
+from amaascore.core.diff import diff, minimal_updates
+from amaascore.tools.generate_party import generate_party
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.children import Charge, Link
+
+
+class DiffTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transaction = generate_transaction()
+        self.transaction.mark_clean()
+
+    def tearDown(self):
+        pass
+
+    def test_DirtyAttributes(self):
+        self.assertEqual(self.transaction.dirty_attributes(), set())
+        self.transaction.price = Decimal('1.23')
+        self.transaction.settlement_date = self.transaction.settlement_date + datetime.timedelta(days=1)
+        self.assertEqual(self.transaction.dirty_attributes(), {'price', 'settlement_date'})
+        self.assertNotIn('_clean_state', self.transaction.__dict__)
+        self.transaction.mark_clean()
+        self.assertEqual(self.transaction.dirty_attributes(), set())
+
+    def test_DirtyChildren(self):
+        self.transaction.charges['Tax'].charge_value = Decimal('2')
+        self.transaction.add_link(link_type='Multiple', linked_transaction_id='NEW')
+        self.assertEqual(self.transaction.dirty_attributes(), {'charges', 'links'})
+        self.transaction.mark_clean()
+        self.assertEqual(self.transaction.charges['Tax'].dirty_attributes(), set())
+
+    def test_AddChild(self):
+        self.transaction.charges['Levy'] = Charge(charge_value=Decimal('1'), currency='USD')
+        self.assertEqual(self.transaction.dirty_attributes(), {'charges'})
+        self.assertIn('Levy', minimal_updates(self.transaction)['charges'])
+
+    def test_RemoveChild(self):
+        self.transaction.references.pop('AMaaS')
+        self.assertEqual(self.transaction.dirty_attributes(), {'references'})
+        self.assertNotIn('AMaaS', minimal_updates(self.transaction)['references'])
+
+    def test_ReplaceChild(self):
+        self.transaction.charges['Tax'] = Charge(charge_value=Decimal('99'), currency='USD')
+        self.assertEqual(self.transaction.dirty_attributes(), {'charges'})
+        # Replacing a child with an equal one is not a change
+        self.transaction.mark_clean()
+        self.transaction.charges['Tax'] = Charge(charge_value=Decimal('99'), currency='USD')
+        self.assertEqual(self.transaction.dirty_attributes(), set())
+
+    def test_AddToLinkSet(self):
+        self.transaction.links['Multiple'].add(Link(linked_transaction_id='NEW'))
+        self.assertEqual(self.transaction.dirty_attributes(), {'links'})
+        self.assertEqual(len(minimal_updates(self.transaction)['links']['Multiple']), 4)
+
+    def test_NotMarkedClean(self):
+        transaction = generate_transaction()
+        self.assertFalse(transaction.tracks_changes())
+        self.assertIsNone(transaction.dirty_attributes())
+        with self.assertRaises(ValueError):
+            minimal_updates(transaction)
+        original = copy.deepcopy(transaction)
+        transaction.charges['Levy'] = Charge(charge_value=Decimal('1'), currency='USD')
+        self.assertEqual(list(minimal_updates(transaction, original).keys()), ['charges'])
+
+    def test_CopiesKeepChanges(self):
+        self.transaction.price = Decimal('1.23')
+        self.assertEqual(copy.deepcopy(self.transaction).dirty_attributes(), {'price'})
+        self.assertEqual(pickle.loads(pickle.dumps(self.transaction)).dirty_attributes(), {'price'})
+        # The binary codec builds a new model, which has not been marked clean
+        self.assertIsNone(loads(dumps(self.transaction)).dirty_attributes())
+
+    def test_MinimalUpdates(self):
+        self.assertEqual(minimal_updates(self.transaction), {})
+        self.transaction.price = Decimal('1.23')
+        self.transaction.version = 5
+        self.assertEqual(minimal_updates(self.transaction), {'price': '1.23'})
+        party = generate_party()
+        party.mark_clean()
+        party.description = 'TEST'
+        self.assertEqual(minimal_updates(party), {'description': 'TEST'})
+
+    def test_Diff(self):
+        modified = copy.deepcopy(self.transaction)
+        self.assertEqual(diff(self.transaction, modified), {})
+        modified.quantity = Decimal('99')
+        modified.version = 2
+        modified.upsert_link_set('Multiple', set(reversed(list(modified.links['Multiple']))))
+        self.assertEqual(diff(self.transaction, modified), {'quantity': '99'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from amaascore.core.file_utils import save_json
+
+
+class FileUtilsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'data.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_SaveJson(self):
+        save_json(self.filename, {'a': 1})
+        save_json(self.filename, {'a': 2})
+        with open(self.filename, 'r') as f:
+            self.assertEqual(json.load(f), {'a': 2})
+        self.assertEqual(os.listdir(self.directory), ['data.json'])
+
+    def test_FailureKeepsExistingFile(self):
+        save_json(self.filename, {'a': 1})
+        with self.assertRaises(TypeError):
+            save_json(self.filename, {'a': object()})
+        with open(self.filename, 'r') as f:
+            self.assertEqual(json.load(f), {'a': 1})
+
+if __name__ == '__main__':
+    unittest.main()
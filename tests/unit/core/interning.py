@@ -0,0 +1,57 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import unittest
+
+from amaascore.core.interning import STRING_POOL, StringPool
+from amaascore.tools.generate_transaction import generate_position
+from amaascore.transactions.utils import json_to_position
+
+
+class InterningTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.pool = StringPool()
+
+    def tearDown(self):
+        pass
+
+    def test_InternJson(self):
+        first = {'asset_manager_id': ''.join(['AM', '1']), 'transaction_id': ''.join(['T', '1']),
+                 'asset_id': ''.join(['A', '1']), 'charges': {'Tax': {'currency': ''.join(['US', 'D'])}}}
+        second = {'asset_manager_id': ''.join(['AM', '1']), 'transaction_id': ''.join(['T', '1']),
+                  'asset_id': ''.join(['A', '1']), 'charges': {'Tax': {'currency': ''.join(['US', 'D'])}}}
+        # Updated in place
+        self.assertIs(self.pool.intern_json(first), first)
+        self.pool.intern_json(second)
+        self.assertIs(first['asset_manager_id'], second['asset_manager_id'])
+        self.assertIs(first['charges']['Tax']['currency'], second['charges']['Tax']['currency'])
+        # Unique identifiers are not pooled
+        self.assertIsNot(first['transaction_id'], second['transaction_id'])
+        self.assertIsNot(first['asset_id'], second['asset_id'])
+        self.assertEqual(first, second)
+
+    def test_Clear(self):
+        self.pool.intern_json({'currency': 'USD'})
+        self.assertEqual(len(self.pool), 1)
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+
+    def test_MaxSize(self):
+        pool = StringPool(max_size=3)
+        for currency in ['USD', 'SGD', 'JPY', 'USD']:
+            pool.intern_json({'currency': currency})
+        self.assertEqual(len(pool), 3)
+        # The pool was cleared when it was full
+        pool.intern_json({'currency': 'EUR'})
+        self.assertEqual(len(pool), 1)
+
+    def test_Hydration(self):
+        json_positions = [generate_position(book_id=''.join(['BOOK', '1'])).to_json() for _ in range(2)]
+        first, second = [json_to_position(json_position) for json_position in json_positions]
+        self.assertIs(first.book_id, second.book_id)
+        self.assertIn('BOOK1', STRING_POOL.strings)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import json
+import unittest
+
+from amaascore.core.amaas_model import json_handler
+from amaascore.core.json_codec import JSONCodec, OrjsonCodec, get_codec, set_codec
+from amaascore.tools.generate_transaction import generate_transaction
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodecTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transaction = generate_transaction()
+        self.payload = {'quantity': Decimal('1.2345'), 'settlement_date': datetime.date(2017, 3, 14),
+                        'execution_time': datetime.datetime(2017, 3, 14, 10, 11, 12, 345),
+                        'close_time': datetime.timedelta(hours=18), 'book_ids': {'ABC'},
+                        'transaction': self.transaction, 'name': 'caf\xe9'}
+
+    def tearDown(self):
+        set_codec(None)
+
+    def test_MatchesJsonHandler(self):
+        expected = json.loads(json.dumps(self.payload, default=json_handler))
+        self.assertEqual(JSONCodec().decode(JSONCodec().encode(self.payload)), expected)
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_OrjsonMatchesStdlib(self):
+        stdlib, fast = JSONCodec(), OrjsonCodec()
+        self.assertEqual(fast.encode(self.payload), stdlib.encode(self.payload))
+        encoded = stdlib.encode(self.payload)
+        self.assertEqual(fast.decode(encoded), stdlib.decode(encoded))
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_OrjsonLargeInteger(self):
+        # 2 ** 70 itself is exactly representable as a float
+        for value in [2 ** 70 + 1, -(2 ** 63) - 1]:
+            self.assertEqual(OrjsonCodec().decode(OrjsonCodec().encode({'value': value})), {'value': value})
+            self.assertEqual(OrjsonCodec().decode(('{"value":%s}' % value)), {'value': value})
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_OrjsonNaN(self):
+        decoded = OrjsonCodec().decode(b'{"value":NaN,"other":Infinity}')
+        self.assertNotEqual(decoded['value'], decoded['value'])
+        self.assertEqual(decoded['other'], float('inf'))
+
+    def test_SetCodec(self):
+        self.assertEqual(type(set_codec('json')), JSONCodec)
+        self.assertEqual(type(get_codec()), JSONCodec)
+        codec = JSONCodec()
+        self.assertIs(set_codec(codec), codec)
+        with self.assertRaises(KeyError):
+            set_codec('invalid')
+
+
+if __name__ == '__main__':
+    unittest.main()
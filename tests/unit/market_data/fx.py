@@ -0,0 +1,123 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import math
+import unittest
+
+from amaascore.exceptions import MissingFXRate
+from amaascore.market_data.fx import CrossRates, FXMatrix, FXRateCache, pair_currencies
+from amaascore.tools.generate_market_data import generate_fx_rate
+
+
+class FakeMarketDataInterface(object):
+
+    def __init__(self, fx_rates):
+        self.fx_rates = fx_rates
+        self.calls = 0
+
+    def retrieve_fx_rates(self, asset_manager_id, business_date, asset_ids=None):
+        self.calls += 1
+        return self.fx_rates
+
+
+class FXTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.business_date = datetime.date(2017, 1, 3)
+        self.fx_rates = [generate_fx_rate(asset_id='USDJPY', rate=Decimal(100), business_date=self.business_date),
+                         generate_fx_rate(asset_id='EURUSD', rate=Decimal(2), business_date=self.business_date),
+                         generate_fx_rate(asset_id='USDSGD', rate=Decimal('1.5'), rate_type='Intraday')]
+        self.cross_rates = CrossRates(self.fx_rates)
+
+    def tearDown(self):
+        pass
+
+    def test_PairCurrencies(self):
+        self.assertEqual(pair_currencies('USDJPY'), ('USD', 'JPY'))
+
+    def test_CrossRates(self):
+        self.assertEqual(self.cross_rates.rate('USD', 'JPY'), 100)
+        self.assertEqual(self.cross_rates.rate('USD', 'EUR'), Decimal('0.5'))
+        self.assertEqual(self.cross_rates.rate('EUR', 'JPY'), 200)
+        self.assertEqual(self.cross_rates.convert(Decimal(10), 'SGD', 'USD'), Decimal(10) / Decimal('1.5'))
+        self.assertEqual(self.cross_rates.rate('HKD', 'HKD'), 1)
+        self.assertEqual(self.cross_rates.currencies(), ['EUR', 'JPY', 'SGD', 'USD'])
+        with self.assertRaises(MissingFXRate):
+            self.cross_rates.rate('HKD', 'USD')
+        self.assertIsNone(self.cross_rates.get('HKD', 'USD'))
+
+    def test_RateType(self):
+        cross_rates = CrossRates(self.fx_rates, rate_type='EOD')
+        self.assertIsNone(cross_rates.get('USD', 'SGD'))
+
+    def test_LatestRate(self):
+        later = generate_fx_rate(asset_id='USDJPY', rate=Decimal(110),
+                                 rate_timestamp=self.fx_rates[0].rate_timestamp + datetime.timedelta(hours=1))
+        inactive = generate_fx_rate(asset_id='USDJPY', rate=Decimal(120),
+                                    rate_timestamp=later.rate_timestamp + datetime.timedelta(hours=1))
+        inactive.active = False
+        self.assertEqual(CrossRates([later, self.fx_rates[0], inactive]).rate('JPY', 'USD'), Decimal(1) / 110)
+
+    def test_FXRateCache(self):
+        interface = FakeMarketDataInterface(self.fx_rates)
+        cache = FXRateCache(interface, asset_manager_id=1)
+        self.assertEqual(cache.cross_rates(self.business_date).rate('EUR', 'JPY'), 200)
+        self.assertIs(cache.cross_rates(self.business_date), cache.cross_rates(self.business_date))
+        self.assertEqual(interface.calls, 1)
+        with self.assertRaises(ValueError):
+            FXRateCache().cross_rates(self.business_date)
+
+    def test_FXRateCacheEOD(self):
+        intraday = generate_fx_rate(asset_id='USDJPY', rate=Decimal(120), rate_type='Intraday',
+                                    rate_timestamp=self.fx_rates[0].rate_timestamp + datetime.timedelta(hours=1))
+        cache = FXRateCache()
+        self.assertEqual(cache.add(self.business_date, self.fx_rates + [intraday]).rate('USD', 'JPY'), 100)
+        cache = FXRateCache(rate_type=None)
+        self.assertEqual(cache.add(self.business_date, self.fx_rates + [intraday]).rate('USD', 'JPY'), 120)
+
+    def test_FXMatrix(self):
+        matrix = FXMatrix(self.cross_rates)
+        self.assertEqual(matrix.currencies, ['EUR', 'JPY', 'SGD', 'USD'])
+        self.assertEqual(matrix.rate('EUR', 'JPY'), 200.0)
+        self.assertEqual(matrix.rate('JPY', 'EUR'), 0.005)
+        self.assertTrue(math.isnan(matrix.rate('HKD', 'USD')))
+        converted = matrix.convert([1, 2, 3, 4], ['EUR', 'USD', 'HKD', 'JPY'], 'JPY')
+        self.assertEqual(list(converted[:2]), [200.0, 200.0])
+        self.assertTrue(math.isnan(converted[2]))
+        self.assertEqual(converted[3], 4.0)
+        self.assertEqual(list(matrix.convert([1, 2], 'EUR', 'USD')), [2.0, 4.0])
+        # Any iterable of currencies, not just lists
+        self.assertEqual(list(matrix.convert([1, 2], (currency for currency in ['EUR', 'USD']), 'JPY')),
+                         [200.0, 200.0])
+
+    def test_FXRateCacheMatrix(self):
+        cache = FXRateCache(fx_rates=self.fx_rates)
+        self.assertEqual(list(cache.convert([1], ['EUR'], 'JPY', self.business_date)), [200.0])
+        matrix = cache.matrix(self.business_date)
+        self.assertIs(cache.matrix(self.business_date), matrix)
+        # Adding rates rebuilds the matrix
+        cache.add_rates([generate_fx_rate(asset_id='EURUSD', rate=Decimal(3), business_date=self.business_date,
+                                           rate_timestamp=self.fx_rates[1].rate_timestamp +
+                                           datetime.timedelta(hours=1))])
+        self.assertIsNot(cache.matrix(self.business_date), matrix)
+        self.assertEqual(cache.matrix(self.business_date).rate('EUR', 'JPY'), 300.0)
+        with self.assertRaises(ValueError):
+            cache.matrix(self.business_date, rate_type='Intraday')
+
+    def test_FXRateCacheRateTypes(self):
+        intraday = generate_fx_rate(asset_id='USDJPY', rate=Decimal(120), rate_type='Intraday',
+                                    business_date=self.business_date)
+        interface = FakeMarketDataInterface(self.fx_rates[:2] + [intraday])
+        cache = FXRateCache(interface, asset_manager_id=1)
+        self.assertEqual(cache.matrix(self.business_date).rate('USD', 'EUR'), 0.5)
+        self.assertEqual(cache.cross_rates(self.business_date, rate_type='Intraday').rate('USD', 'JPY'), 120)
+        self.assertEqual(cache.matrix(self.business_date, rate_type='Intraday').rate('USD', 'JPY'), 120.0)
+        # The date is retrieved once for every rate type, and its rates are not added again
+        self.assertEqual(interface.calls, 1)
+        self.assertEqual(len(cache.fx_rates[(self.business_date, 'EOD')]), 2)
+        self.assertEqual(len(cache.fx_rates[(self.business_date, 'Intraday')]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
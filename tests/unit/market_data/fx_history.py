@@ -0,0 +1,72 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import pytz
+import unittest
+
+from amaascore.market_data.fx_history import FXRateHistory, timestamp_seconds
+from amaascore.market_data.fx_rate import FXRate
+from amaascore.tools.generate_market_data import generate_fx_rate
+
+
+class FXRateHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.start = datetime.datetime(2017, 1, 3, 9, tzinfo=pytz.utc)
+        # USDJPY every hour from 09:00, at 100, 101, 102...
+        self.fx_rates = [generate_fx_rate(asset_id='USDJPY', rate=Decimal(100 + hour), rate_type='Intraday',
+                                          rate_timestamp=self.start + datetime.timedelta(hours=hour))
+                         for hour in range(8)]
+        # Out of order
+        self.history = FXRateHistory(reversed(self.fx_rates))
+
+    def tearDown(self):
+        pass
+
+    def test_TimestampSeconds(self):
+        self.assertEqual(timestamp_seconds(datetime.datetime(1970, 1, 1, 0, 1)), 60)
+        self.assertEqual(timestamp_seconds(datetime.datetime(1970, 1, 1, 0, 1, tzinfo=pytz.utc)), 60)
+
+    def test_RateAsOf(self):
+        self.assertEqual(self.history.rate_as_of('USDJPY', datetime.datetime(2017, 1, 3, 14, 32, 5, tzinfo=pytz.utc)),
+                         105)
+        # Exactly on a rate
+        self.assertEqual(self.history.rate_as_of('USDJPY', self.start), 100)
+        self.assertIsNone(self.history.rate_as_of('USDJPY', self.start - datetime.timedelta(seconds=1)))
+        self.assertEqual(self.history.rate_as_of('JPYUSD', self.start), Decimal(1) / 100)
+        self.assertIsNone(self.history.rate_as_of('USDSGD', self.start))
+        self.assertIsNone(self.history.rate_as_of('USDJPY', self.start, rate_type='EOD'))
+
+    def test_RatesAsOf(self):
+        # Naive execution times are UTC
+        timestamps = [datetime.datetime(2017, 1, 3, hour, 30) for hour in [8, 9, 12, 20]]
+        self.assertEqual(self.history.rates_as_of('USDJPY', timestamps), [None, 100, 103, 107])
+        self.assertEqual(self.history.rates_as_of(['USDJPY', 'USDJPY', 'JPYUSD', 'EURUSD'], timestamps),
+                         [None, 100, Decimal(1) / 103, None])
+
+    def test_Add(self):
+        replacement = generate_fx_rate(asset_id='USDJPY', rate=Decimal(99), rate_type='Intraday',
+                                       rate_timestamp=self.start)
+        self.assertTrue(self.history.add(replacement))
+        self.assertEqual(self.history.rate_as_of('USDJPY', self.start), 99)
+        self.assertEqual(len(self.history.series[('USDJPY', 'Intraday')][0]), 8)
+        inactive = generate_fx_rate(asset_id='USDJPY', rate=Decimal(1), rate_type='Intraday',
+                                    rate_timestamp=self.start)
+        inactive.active = False
+        self.assertFalse(self.history.add(inactive))
+        self.assertEqual(self.history.rate_as_of('USDJPY', self.start), 99)
+        untimed = FXRate(asset_manager_id=0, asset_id='USDJPY', business_date=self.start.date(), rate_timestamp=None,
+                         rate=Decimal(1), rate_type='Intraday')
+        self.assertFalse(self.history.add(untimed))
+
+    def test_ZeroRate(self):
+        self.history.add(FXRate(asset_manager_id=0, asset_id='SGDUSD', business_date=self.start.date(),
+                                rate_timestamp=self.start, rate=Decimal(0), rate_type='Intraday'))
+        self.assertEqual(self.history.rate_as_of('SGDUSD', self.start), 0)
+        # As in CrossRates, a zero rate has no inverse
+        self.assertIsNone(self.history.rate_as_of('USDSGD', self.start))
+
+if __name__ == '__main__':
+    unittest.main()
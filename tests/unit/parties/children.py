@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import unittest
 
+from amaascore.parties.children import FrozenEmail
 from amaascore.tools.generate_party import generate_address, generate_email
 
 
@@ -21,5 +22,13 @@ class PartyChildrenTest(unittest.TestCase):
         with self.assertRaisesRegexp(ValueError, 'Country ID should be a ISO 3166-1 Alpha-3 code'):
             address = generate_address(country_id='TEST')
 
+    def test_FrozenEmail(self):
+        email = generate_email('test@amaas.com')
+        frozen = FrozenEmail.freeze(email)
+        self.assertEqual(frozen.email, 'test@amaas.com')
+        self.assertEqual(frozen, FrozenEmail(email='test@amaas.com', email_primary=email.email_primary))
+        with self.assertRaisesRegexp(ValueError, 'Invalid email'):
+            frozen.replace(email='invalid.email.amaas.com')
+
 if __name__ == '__main__':
     unittest.main()
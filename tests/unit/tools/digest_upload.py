@@ -0,0 +1,79 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from amaascore.tools.digest_upload import DigestStore, DigestUploader
+from amaascore.tools.generate_asset import generate_asset
+
+
+class FakeAssetsInterface(object):
+
+    def __init__(self):
+        self.calls = []
+
+    def new(self, asset):
+        self.calls.append(('new', asset.asset_id))
+        return asset
+
+    def amend(self, asset):
+        self.calls.append(('amend', asset.asset_id))
+        return asset
+
+
+class DigestUploadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'digests.json')
+        self.interface = FakeAssetsInterface()
+        self.assets = [generate_asset(asset_manager_id=1, asset_id=str(asset_id)) for asset_id in range(5)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def uploader(self):
+        return DigestUploader(interface=self.interface, store=DigestStore(self.filename), id_attribute='asset_id')
+
+    def test_ContentDigest(self):
+        asset = self.assets[0]
+        digest = asset.content_digest()
+        asset.version = 5
+        asset.updated_by = 'TEST'
+        self.assertEqual(asset.content_digest(), digest)
+        asset.description = 'CHANGED'
+        self.assertNotEqual(asset.content_digest(), digest)
+
+    def test_Upload(self):
+        results = self.uploader().upload(self.assets)
+        self.assertEqual(len(results['new']), 5)
+        self.assertEqual(len(self.interface.calls), 5)
+        # A new run with the persisted digests only sends what has changed
+        self.assets[2].description = 'CHANGED'
+        self.interface.calls = []
+        results = self.uploader().upload(self.assets)
+        self.assertEqual(results['amended'], [self.assets[2].asset_id])
+        self.assertEqual(len(results['unchanged']), 4)
+        self.assertEqual(self.interface.calls, [('amend', self.assets[2].asset_id)])
+
+    def test_Seed(self):
+        self.uploader().seed(self.assets)
+        results = self.uploader().upload(self.assets + [generate_asset(asset_manager_id=1, asset_id='NEW')])
+        self.assertEqual(len(results['unchanged']), 5)
+        self.assertEqual(len(results['new']), 1)
+
+    def test_StorePerAssetManager(self):
+        store = DigestStore()
+        store.set(1, 'asset_id', 'A', 'digest1')
+        store.set(2, 'asset_id', 'A', 'digest2')
+        self.assertEqual(store.get(1, 'asset_id', 'A'), 'digest1')
+        store.clear(1)
+        self.assertIsNone(store.get(1, 'asset_id', 'A'))
+        self.assertEqual(store.get('2', 'asset_id', 'A'), 'digest2')
+
+
+if __name__ == '__main__':
+    unittest.main()
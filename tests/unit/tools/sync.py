@@ -0,0 +1,81 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+from amaascore.core.date_utils import parse_datetime
+from amaascore.tools.generate_book import generate_book
+from amaascore.tools.sync import SyncManager, WatermarkStore
+
+
+class FakeBooksInterface(object):
+    """ A stand-in for the books service which honours updated_since """
+
+    def __init__(self):
+        self.books = {}
+        self.calls = []
+
+    def save(self, book, updated_time):
+        book.updated_time = updated_time.isoformat()
+        self.books[book.book_id] = book
+
+    def books_by_asset_manager(self, asset_manager_id, updated_since=None):
+        self.calls.append(updated_since)
+        return [book for book in self.books.values() if book.asset_manager_id == asset_manager_id and
+                (updated_since is None or parse_datetime(book.updated_time) >= parse_datetime(updated_since))]
+
+
+class SyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'watermarks.json')
+        self.interface = FakeBooksInterface()
+        self.time = datetime.datetime(2017, 5, 1, 9, 0)
+        self.books = [generate_book(asset_manager_id=1, book_id='BOOK%s' % index) for index in range(3)]
+        for index, book in enumerate(self.books):
+            self.interface.save(book, self.time + datetime.timedelta(minutes=index))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def manager(self, replicas=None):
+        return SyncManager(interfaces={'books': self.interface}, watermarks=WatermarkStore(self.filename),
+                           replicas=replicas)
+
+    def test_Sync(self):
+        manager = self.manager()
+        self.assertEqual(len(manager.sync('books', 1)), 3)
+        self.assertEqual(manager.watermarks.get('books', 1)['updated_time'], '2017-05-01T09:02:00')
+        # Only the amended book is fetched after the watermark, even by a new manager with the persisted watermark
+        amended = generate_book(asset_manager_id=1, book_id='BOOK0')
+        amended.version = 2
+        self.interface.save(amended, self.time + datetime.timedelta(minutes=5))
+        manager = self.manager(replicas=manager.replicas)
+        replica = manager.replicas['books']
+        changed = manager.sync('books', 1)
+        self.assertEqual(self.interface.calls[-1], '2017-05-01T09:02:00')
+        self.assertEqual([book.book_id for book in changed], ['BOOK0'])
+        self.assertEqual(replica.get(1, 'BOOK0').version, 2)
+        self.assertEqual(manager.watermarks.get('books', 1), {'updated_time': '2017-05-01T09:05:00'})
+        # The same version is fetched again at the watermark time, but is not reported as a change
+        self.assertEqual(manager.sync('books', 1), [])
+        self.assertEqual(replica.get(1, 'BOOK0').version, 2)
+
+    def test_VersionOrdering(self):
+        manager = self.manager()
+        replica = manager.replicas['books']
+        amended = generate_book(asset_manager_id=1, book_id='BOOK1')
+        amended.version = 3
+        replica.add(amended)
+        manager.sync('books', 1)
+        # The older version from the server does not replace the newer local copy
+        self.assertIs(replica.get(1, 'BOOK1'), amended)
+        self.assertEqual(len(replica), 3)
+
+if __name__ == '__main__':
+    unittest.main()
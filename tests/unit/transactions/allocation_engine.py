@@ -0,0 +1,72 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+import unittest
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.allocation_engine import allocate, allocate_quantities, prorate
+from amaascore.transactions.children import Charge
+
+
+class FakeTransactionsInterface(object):
+
+    def __init__(self):
+        self.allocation_dicts = None
+
+    def allocate_transaction(self, asset_manager_id, transaction_id, allocation_type, allocation_dicts):
+        self.allocation_dicts = allocation_dicts
+        return []
+
+
+class AllocationEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transaction = generate_transaction(asset_manager_id=1, quantity=Decimal('1000'))
+        self.transaction.charges = {'Commission': Charge(charge_value=Decimal('10.00'), currency='USD')}
+
+    def tearDown(self):
+        pass
+
+    def test_AllocateQuantities(self):
+        self.assertEqual(allocate_quantities(Decimal('100'), [1, 1, 1]), [Decimal('34'), Decimal('33'), Decimal('33')])
+        quantities = allocate_quantities(Decimal('1000'), [3, 3, 1], lot_size=Decimal('100'))
+        self.assertEqual(quantities, [Decimal('400'), Decimal('400'), Decimal('200')])
+        with self.assertRaises(ValueError):
+            allocate_quantities(Decimal('150'), [1, 1], lot_size=Decimal('100'))
+
+    def test_Prorate(self):
+        shares = prorate(Decimal('10.00'), [Decimal(1), Decimal(1), Decimal(1)])
+        self.assertEqual(shares, [Decimal('3.34'), Decimal('3.33'), Decimal('3.33')])
+        self.assertEqual(sum(prorate(Decimal('10.005'), [Decimal(1), Decimal(2)])), Decimal('10.005'))
+        # The amount below the precision goes on the largest allocation, never on an empty one
+        shares = prorate(Decimal('10.005'), [Decimal(0), Decimal(3), Decimal(1)])
+        self.assertEqual(shares, [Decimal('0.00'), Decimal('7.505'), Decimal('2.50')])
+
+    def test_Allocate(self):
+        book_ids = ['BOOK%s' % index for index in range(7)]
+        allocation = allocate(self.transaction, book_ids, weights=range(1, 8), lot_size=Decimal('10'))
+        self.assertEqual(sum(allocation.quantities), self.transaction.quantity)
+        self.assertTrue(all(quantity % 10 == 0 for quantity in allocation.quantities))
+        self.assertEqual(sum(allocation.charges['Commission']), Decimal('10.00'))
+        interface = FakeTransactionsInterface()
+        allocation.submit(interface)
+        self.assertEqual(interface.allocation_dicts[0]['quantity'], allocation.quantities[0])
+        self.assertEqual(sum(allocation_dict['charges']['Commission']['charge_value']
+                             for allocation_dict in interface.allocation_dicts), Decimal('10.00'))
+
+    def test_Validate(self):
+        with self.assertRaises(ValueError):
+            allocate(self.transaction, ['ABC', 'XYZ'], quantities=[Decimal('400'), Decimal('500')])
+        with self.assertRaises(ValueError):
+            allocate(self.transaction, ['ABC', 'ABC'], quantities=[Decimal('400'), Decimal('600')])
+        allocation = allocate(self.transaction, ['ABC', 'XYZ'], quantities=[Decimal('400'), Decimal('600')],
+                              transaction_ids=['T1', 'T2'])
+        self.assertEqual(allocation.charges['Commission'], [Decimal('4.00'), Decimal('6.00')])
+        self.assertEqual(allocation.allocation_dicts()[1],
+                         {'book_id': 'XYZ', 'quantity': Decimal('600'), 'transaction_id': 'T2',
+                          'charges': {'Commission': {'charge_value': Decimal('6.00'), 'currency': 'USD',
+                                                     'net_affecting': True}}})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import unittest
+
+from amaascore.corporate_actions.dividend import Dividend
+from amaascore.tools.generate_transaction import generate_cash_transaction, generate_transaction
+from amaascore.transactions.cash_ladder import CashLadder, transaction_cash_flow
+from amaascore.transactions.position import Position
+
+
+class CashLadderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.start_date = datetime.date(2017, 1, 2)
+        self.ladder = CashLadder(self.start_date)
+
+    def tearDown(self):
+        pass
+
+    def trade(self, transaction_id, action, quantity, price, day, book_id='A', currency='USD'):
+        transaction = generate_transaction(asset_manager_id=1, asset_book_id=book_id, asset_id='X',
+                                           transaction_id=transaction_id, transaction_action=action,
+                                           quantity=Decimal(quantity), price=Decimal(price),
+                                           transaction_date=datetime.date(2017, 1, day),
+                                           settlement_currency=currency)
+        transaction.charges = {}
+        return transaction
+
+    def test_TransactionCashFlow(self):
+        transaction = self.trade('T1', 'Buy', 100, 10, 2)
+        self.assertEqual(transaction_cash_flow(transaction), ('USD', Decimal(-1000)))
+        transaction.transaction_action = 'Sell'
+        self.assertEqual(transaction_cash_flow(transaction), ('USD', Decimal(1000)))
+        cash = generate_cash_transaction(asset_id='SGD', transaction_action='Receive', quantity=Decimal(50))
+        self.assertEqual(transaction_cash_flow(cash), ('SGD', Decimal(50)))
+
+    def test_Ladder(self):
+        # Trades settle two days after the trade date
+        self.ladder.add_transactions([self.trade('T1', 'Buy', 100, 10, 2), self.trade('T2', 'Sell', 50, 12, 3),
+                                      self.trade('T3', 'Buy', 10, 5, 3, book_id='B')])
+        self.assertEqual(self.ladder.dates(), [datetime.date(2017, 1, day) for day in range(2, 6)])
+        ladder = self.ladder.ladder()
+        self.assertEqual(list(ladder.keys()), [(1, 'A', 'USD'), (1, 'B', 'USD')])
+        self.assertEqual(ladder[(1, 'A', 'USD')], [0, 0, -1000, 600])
+        self.assertEqual(self.ladder.ladder(cumulative=True)[(1, 'A', 'USD')], [0, 0, -1000, -400])
+        self.assertEqual(self.ladder.currency_ladder(cumulative=True)['USD'], [0, 0, -1000, -450])
+        self.assertEqual(list(self.ladder.ladder(book_ids=['B']).keys()), [(1, 'B', 'USD')])
+
+    def test_Incremental(self):
+        self.ladder.add_transaction(self.trade('T1', 'Buy', 100, 10, 2))
+        amended = self.trade('T1', 'Buy', 100, 11, 3)
+        amended.version = 2
+        self.assertTrue(self.ladder.add_transaction(amended))
+        self.assertEqual(self.ladder.ladder()[(1, 'A', 'USD')], [0, 0, 0, -1100])
+        # An older version is ignored
+        self.assertFalse(self.ladder.add_transaction(self.trade('T1', 'Buy', 100, 10, 2)))
+        cancelled = self.trade('T1', 'Buy', 100, 11, 3)
+        cancelled.version = 3
+        cancelled.transaction_status = 'Cancelled'
+        self.ladder.add_transaction(cancelled)
+        self.assertEqual(self.ladder.ladder()[(1, 'A', 'USD')], [0, 0, 0, 0])
+
+    def test_Buckets(self):
+        ladder = CashLadder(self.start_date, bucket_days=7)
+        ladder.add_transactions([self.trade('T1', 'Buy', 1, 10, 1), self.trade('T2', 'Buy', 1, 20, 9)])
+        # Settling on the 3rd (before the end of the first week) and the 11th
+        self.assertEqual(ladder.dates(), [self.start_date, datetime.date(2017, 1, 9)])
+        self.assertEqual(ladder.ladder()[(1, 'A', 'USD')], [-10, -20])
+        with self.assertRaises(ValueError):
+            CashLadder(self.start_date, bucket_days=0)
+
+    def test_Dividend(self):
+        dividend = Dividend(asset_manager_id=1, corporate_action_id='D1', record_date=datetime.date(2017, 1, 3),
+                            settlement_date=datetime.date(2017, 1, 4), dividend_rate=Decimal('0.5'),
+                            dividend_asset_id='USD', asset_id='X')
+        positions = [Position(asset_manager_id=1, book_id='A', asset_id='X', quantity=Decimal(100)),
+                     Position(asset_manager_id=1, book_id='B', asset_id='Y', quantity=Decimal(100))]
+        self.ladder.add_dividend(dividend, positions)
+        self.assertEqual(self.ladder.ladder(), {(1, 'A', 'USD'): [0, 0, 50]})
+        dividend.corporate_action_status = 'Cancelled'
+        self.ladder.add_dividend(dividend, positions)
+        self.assertEqual(self.ladder.ladder(), {(1, 'A', 'USD'): [0, 0, 0]})
+
+if __name__ == '__main__':
+    unittest.main()
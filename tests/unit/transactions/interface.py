@@ -88,6 +88,23 @@ class TransactionsInterfaceTest(unittest.TestCase):
         self.assertEqual(transaction.version, 2)
         self.assertEqual(transaction.price, price)
 
+    @requests_mock.Mocker()
+    def test_AmendMinimal(self, mocker):
+        endpoint = '%s/transactions/%s/%s' % (self.transactions_interface.endpoint, self.asset_manager_id,
+                                              self.transaction_id)
+        mocker.patch(endpoint, json=self.transaction.to_json())
+        self.transaction.mark_clean()
+        # Nothing has changed, so there is no need to call AMaaS
+        self.assertIs(self.transactions_interface.amend(self.transaction, minimal=True), self.transaction)
+        self.assertFalse(mocker.called)
+        self.transaction.price = Decimal('3.14')
+        self.transaction.charges['Tax'].charge_value = Decimal('1.5')
+        transaction = self.transactions_interface.amend(self.transaction, minimal=True)
+        self.assertEqual(type(transaction), Transaction)
+        updates = mocker.last_request.json()
+        self.assertEqual(set(updates.keys()), {'price', 'charges'})
+        self.assertEqual(updates['price'], '3.14')
+
     def test_Retrieve(self):
         self.transactions_interface.new(self.transaction)
         transaction = self.transactions_interface.retrieve(self.transaction.asset_manager_id,
@@ -122,6 +139,14 @@ class TransactionsInterfaceTest(unittest.TestCase):
         results = self.transactions_interface.transactions_by_asset_manager(asset_manager_id=self.asset_manager_id)
         self.assertEqual(results, transactions)
 
+    @requests_mock.Mocker()
+    def test_TransactionsByAssetManagerUpdatedSince(self, mocker):
+        endpoint = '%s/transactions/%s' % (self.transactions_interface.endpoint, self.asset_manager_id)
+        mocker.get(endpoint, json=[])
+        self.transactions_interface.transactions_by_asset_manager(asset_manager_id=self.asset_manager_id,
+                                                                  updated_since='2017-05-01T09:00:00')
+        self.assertEqual(mocker.last_request.qs, {'updated_since': ['2017-05-01t09:00:00']})
+
     @requests_mock.Mocker()
     def test_PositionSearch(self, mocker):
         # This test is somewhat fake - but the integration tests are for the bigger picture
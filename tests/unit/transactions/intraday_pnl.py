@@ -0,0 +1,77 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import unittest
+
+from amaascore.market_data.quote import Quote
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.intraday_pnl import IntradayPnL
+from amaascore.transactions.pnl import PnLEngine
+from amaascore.transactions.position import Position
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class IntradayPnLTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.clock = FakeClock()
+        self.snapshots = []
+        self.intraday = IntradayPnL(snapshot_interval=5, on_snapshot=self.snapshots.append, clock=self.clock)
+        positions = [Position(asset_manager_id=1, book_id='A', asset_id='X', quantity=Decimal(100)),
+                     Position(asset_manager_id=1, book_id='B', asset_id='X', quantity=Decimal(-50)),
+                     Position(asset_manager_id=1, book_id='B', asset_id='Y', quantity=Decimal(10))]
+        self.intraday.load_positions(positions, {'X': Decimal(10), 'Y': Decimal(20)})
+
+    def tearDown(self):
+        pass
+
+    def quote(self, asset_id, bid, ask):
+        return Quote(asset_manager_id=1, asset_id=asset_id, quote_datetime=datetime.datetime.utcnow(), bid=bid,
+                     ask=ask)
+
+    def test_Ticks(self):
+        self.intraday.on_quote(self.quote('X', '11.5', '12.5'))
+        self.assertEqual(self.intraday.book_pnl, {(1, 'A'): 200, (1, 'B'): -100})
+        self.intraday.on_quote(self.quote('Y', '25', '25'))
+        self.assertEqual(self.intraday.book_pnl[(1, 'B')], -50)
+        self.assertEqual(self.intraday.position_pnl(1, 'B', 'Y'), 50)
+        # A quote without an ask is ignored
+        self.intraday.on_quote(Quote(asset_manager_id=1, asset_id='X', quote_datetime=datetime.datetime.utcnow(),
+                                     bid='1'))
+        self.assertEqual(self.intraday.book_pnl[(1, 'A')], 200)
+
+    def test_Throttle(self):
+        self.intraday.on_quote(self.quote('X', '11', '11'))
+        self.clock.now += 1
+        self.intraday.on_quote(self.quote('X', '12', '12'))
+        self.assertEqual(len(self.snapshots), 1)
+        self.clock.now += 5
+        self.intraday.on_quote(self.quote('X', '13', '13'))
+        self.assertEqual(len(self.snapshots), 2)
+        self.assertEqual(self.snapshots[-1][(1, 'A')], 300)
+        metrics = self.intraday.metrics()
+        self.assertEqual(metrics['ticks'], 3)
+        self.assertEqual(metrics['ticks_per_second'], 0.5)
+
+    def test_PnLEngine(self):
+        engine = PnLEngine()
+        engine.apply_all([generate_transaction(asset_manager_id=1, asset_book_id='C', asset_id='Z',
+                                               transaction_action=action, quantity=Decimal(quantity),
+                                               price=Decimal(price), transaction_date=datetime.date(2017, 1, day))
+                          for day, action, quantity, price in [(2, 'Buy', 100, 10), (3, 'Sell', 50, 12)]])
+        self.intraday.load_pnl_engine(engine)
+        self.intraday.on_quote(self.quote('Z', '15', '15'))
+        self.assertEqual(self.intraday.book_pnl[(1, 'C')], 100 + 250)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import unittest
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.link_graph import LinkGraph
+
+
+class LinkGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transactions = {}
+        for transaction_id in ['BLOCK', 'ALLOC1', 'ALLOC2', 'NET', 'OTHER', 'SOLO']:
+            transaction = generate_transaction(asset_manager_id=1, transaction_id=transaction_id)
+            transaction.links = {}
+            self.transactions[transaction_id] = transaction
+        self.transactions['BLOCK'].add_link('Allocation', 'ALLOC1')
+        self.transactions['BLOCK'].add_link('Allocation', 'ALLOC2')
+        self.transactions['NET'].add_link('NettingSet', 'ALLOC2')
+        self.transactions['NET'].add_link('NettingSet', 'OTHER')
+        self.graph = LinkGraph(self.transactions.values())
+
+    def tearDown(self):
+        pass
+
+    def test_Adjacency(self):
+        self.assertEqual(self.graph.linked(1, 'BLOCK'), {'ALLOC1', 'ALLOC2'})
+        self.assertEqual(self.graph.linked_from(1, 'ALLOC2'), {'BLOCK', 'NET'})
+        self.assertEqual(self.graph.linked_from(1, 'ALLOC2', link_types=['NettingSet']), {'NET'})
+        self.assertEqual(self.graph.linked(1, 'SOLO'), set())
+
+    def test_Traversal(self):
+        self.assertEqual(self.graph.descendants(1, 'BLOCK'), {'ALLOC1', 'ALLOC2'})
+        self.assertEqual(self.graph.ancestors(1, 'OTHER'), {'NET'})
+        self.assertEqual(self.graph.component(1, 'ALLOC1'), {'BLOCK', 'ALLOC2', 'NET', 'OTHER'})
+        self.assertEqual(self.graph.component(1, 'ALLOC1', link_types=['Allocation']), {'BLOCK', 'ALLOC2'})
+        components = self.graph.components(link_types=['NettingSet'])
+        self.assertEqual(components, [(1, {'NET', 'ALLOC2', 'OTHER'})])
+
+    def test_Amend(self):
+        net = self.transactions['NET']
+        net.remove_link('NettingSet', 'ALLOC2')
+        self.graph.add(net)
+        self.assertEqual(self.graph.linked_from(1, 'ALLOC2'), {'BLOCK'})
+        self.assertEqual(len(self.graph.components()), 2)
+        self.graph.remove(1, 'BLOCK')
+        self.assertEqual(self.graph.descendants(1, 'BLOCK'), set())
+        self.assertEqual(self.graph.components(), [(1, {'NET', 'OTHER'})])
+
+if __name__ == '__main__':
+    unittest.main()
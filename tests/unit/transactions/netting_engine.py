@@ -0,0 +1,103 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import unittest
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.cash_ladder import transaction_cash_flow
+from amaascore.transactions.netting_engine import NettingEngine, netting_key
+
+
+class FakeTransactionsInterface(object):
+
+    def __init__(self):
+        self.calls = []
+
+    def net_transactions(self, asset_manager_id, transaction_ids, netting_type='Net'):
+        self.calls.append((asset_manager_id, sorted(transaction_ids), netting_type))
+
+
+class NettingEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transaction_date = datetime.date(2017, 6, 1)
+
+    def tearDown(self):
+        pass
+
+    def generate(self, transaction_action, quantity, price, asset_id='ASSET', transaction_status=None):
+        transaction = generate_transaction(asset_manager_id=1, asset_book_id='BOOK', counterparty_book_id='CPTY',
+                                           asset_id=asset_id, transaction_action=transaction_action,
+                                           quantity=Decimal(quantity), price=Decimal(price),
+                                           transaction_date=self.transaction_date, transaction_currency='USD',
+                                           transaction_status=transaction_status, net_affecting_charges=True,
+                                           charge_currency='USD')
+        for charge in transaction.charges.values():
+            charge.charge_value = Decimal(1)
+        return transaction
+
+    def test_NettingSet(self):
+        buy = self.generate('Buy', 100, 10)
+        sell = self.generate('Sell', 40, 12)
+        engine = NettingEngine([buy, sell, self.generate('Buy', 10, 10, asset_id='OTHER'),
+                                self.generate('Buy', 10, 10, transaction_status='Cancelled')])
+        self.assertEqual(len(engine.skipped), 1)
+        netting_sets = engine.sets()
+        self.assertEqual(len(netting_sets), 1)
+        netting_set = netting_sets[0]
+        self.assertEqual(netting_set.net_quantity, Decimal(60))
+        # Cash paid is negative, as in the cash ladder
+        self.assertEqual(netting_set.gross_settlement, Decimal(-520))
+        self.assertEqual(netting_set.charges_net_effect, Decimal(4))
+        self.assertEqual(netting_set.net_settlement, Decimal(-524))
+        self.assertEqual(netting_set.net_settlement, sum(transaction_cash_flow(transaction)[1]
+                                                         for transaction in [buy, sell]))
+        net = netting_set.to_transaction()
+        self.assertEqual(net.transaction_type, 'Net')
+        self.assertEqual(net.transaction_action, 'Buy')
+        self.assertEqual(net.quantity, Decimal(60))
+        self.assertEqual(net.settlement_date, buy.settlement_date)
+        self.assertEqual(net.charges_net_effect(), Decimal(4))
+        self.assertEqual(sorted(net.charges.keys()), sorted(buy.charges.keys()))
+        self.assertEqual(net.gross_settlement, Decimal(520))
+        self.assertEqual(transaction_cash_flow(net), ('USD', netting_set.net_settlement))
+        self.assertEqual(set(net.links['NettingSet'].linked_transaction_ids()),
+                         {buy.transaction_id, sell.transaction_id})
+
+    def test_MixedChargeCurrencies(self):
+        buy = self.generate('Buy', 100, 10)
+        sell = self.generate('Sell', 40, 12)
+        charge_type = sorted(sell.charges)[0]
+        sell.charges[charge_type].currency = 'SGD'
+        engine = NettingEngine([buy])
+        with self.assertRaisesRegexp(ValueError, charge_type):
+            engine.add(sell)
+        # The set is left as it was
+        self.assertEqual(engine.netting_sets[netting_key(buy)].transactions, [buy])
+        sell.charges[charge_type].currency = 'USD'
+        sell.charges[charge_type].net_affecting = False
+        with self.assertRaises(ValueError):
+            engine.add(sell)
+
+    def test_Preview(self):
+        engine = NettingEngine([self.generate('Buy', 10, 10), self.generate('Sell', 30, 10),
+                                self.generate('Buy', 5, 10, asset_id='OTHER'),
+                                self.generate('Buy', 5, 10, asset_id='OTHER')])
+        preview = engine.preview()
+        self.assertEqual(preview['asset_id'], ['ASSET', 'OTHER'])
+        self.assertEqual(preview['net_action'], ['Sell', 'Buy'])
+        self.assertEqual(preview['net_quantity'], [Decimal(-20), Decimal(10)])
+        self.assertEqual(preview['transaction_count'], [2, 2])
+        self.assertEqual(engine.preview(min_size=3)['asset_id'], [])
+
+    def test_Submit(self):
+        buy = self.generate('Buy', 10, 10)
+        sell = self.generate('Sell', 10, 10)
+        interface = FakeTransactionsInterface()
+        NettingEngine([buy, sell, self.generate('Buy', 5, 10, asset_id='OTHER')]).submit(interface)
+        self.assertEqual(interface.calls, [(1, sorted([buy.transaction_id, sell.transaction_id]), 'Net')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import datetime
+from decimal import Decimal
+import pytz
+import unittest
+
+from amaascore.market_data.eod_price import EODPrice
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.pnl import LotBook, PnLEngine
+
+
+class PnLTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.start_date = datetime.date(2017, 1, 2)
+        self.trades = [self.generate(0, 'Buy', 100, 10), self.generate(1, 'Buy', 100, 20),
+                       self.generate(2, 'Sell', 150, 30)]
+        self.prices = [EODPrice(asset_manager_id=1, asset_id='ASSET', business_date=self.start_date, price='25')]
+
+    def tearDown(self):
+        pass
+
+    def generate(self, days, transaction_action, quantity, price):
+        return generate_transaction(asset_manager_id=1, asset_book_id='BOOK', asset_id='ASSET',
+                                    transaction_action=transaction_action, quantity=Decimal(quantity),
+                                    price=Decimal(price),
+                                    transaction_date=self.start_date + datetime.timedelta(days=days))
+
+    def pnl(self, method, trades=None):
+        engine = PnLEngine(method=method)
+        engine.apply_all(trades or self.trades)
+        return engine.pnl(self.prices)[0]
+
+    def test_Methods(self):
+        fifo = self.pnl('FIFO')
+        self.assertEqual((fifo['quantity'], fifo['realized'], fifo['unrealized']), (50, 2500, 250))
+        lifo = self.pnl('LIFO')
+        self.assertEqual((lifo['quantity'], lifo['realized'], lifo['unrealized']), (50, 2000, 750))
+        avco = self.pnl('AVCO')
+        self.assertEqual((avco['quantity'], avco['realized'], avco['unrealized']), (50, 2250, 500))
+        self.assertEqual(avco['average_cost'], 15)
+
+    def test_Short(self):
+        lot_book = LotBook()
+        lot_book.trade(-100, 10)
+        self.assertEqual(lot_book.trade(150, 8), 200)
+        self.assertEqual(lot_book.quantity, 50)
+        self.assertEqual(lot_book.unrealized(9), 50)
+
+    def test_ExecutionTimes(self):
+        # Trades on the same date without an execution time, or with naive and aware times, can still be ordered
+        trades = [self.generate(0, 'Buy', 100, 10), self.generate(0, 'Buy', 100, 20), self.generate(0, 'Sell', 50, 30)]
+        trades[0].execution_time = datetime.datetime(2017, 1, 2, 10, tzinfo=pytz.utc)
+        trades[1].execution_time = datetime.datetime(2017, 1, 2, 9)
+        trades[2].execution_time = None
+        result = self.pnl('FIFO', trades)
+        # The sale closes the 09:00 lot at 20
+        self.assertEqual((result['quantity'], result['realized']), (150, 500))
+
+    def test_Amend(self):
+        engine = PnLEngine()
+        engine.apply_all(self.trades)
+        sell = self.trades[2]
+        original = copy.deepcopy(sell)
+        sell.transaction_status = 'Cancelled'
+        sell.version = 2
+        engine.apply(sell)
+        # The older version is ignored, as the engine keeps the version of each trade
+        self.assertFalse(engine.apply(original))
+        # A back-dated trade is applied in date order on the rebuild
+        engine.apply(self.generate(-1, 'Buy', 100, 5))
+        result = engine.pnl({'ASSET': Decimal('25')})[0]
+        self.assertEqual((result['quantity'], result['realized'], result['unrealized']), (300, 0, 4000))
+
+if __name__ == '__main__':
+    unittest.main()
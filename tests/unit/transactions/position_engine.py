@@ -0,0 +1,81 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import random
+import unittest
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.position import Position
+from amaascore.transactions.position_engine import PositionEngine
+
+
+class PositionEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.asset_manager_id = random.randint(1, 2**31-1)
+        self.today = datetime.date.today()
+
+    def tearDown(self):
+        pass
+
+    def generate(self, transaction_action, quantity, book_id='BOOK', asset_id='ASSET', transaction_date=None):
+        return generate_transaction(asset_manager_id=self.asset_manager_id, asset_book_id=book_id, asset_id=asset_id,
+                                    transaction_action=transaction_action, quantity=Decimal(quantity),
+                                    transaction_date=transaction_date or self.today)
+
+    def test_ApplyTransactions(self):
+        engine = PositionEngine()
+        engine.apply_all([self.generate('Buy', 100), self.generate('Sell', 30), self.generate('Short Sell', 20),
+                          self.generate('Receive', 5, asset_id='OTHER')])
+        self.assertEqual(engine.quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(50))
+        self.assertEqual(engine.quantity(self.asset_manager_id, 'BOOK', 'OTHER'), Decimal(5))
+        positions = engine.positions(asset_manager_id=self.asset_manager_id, asset_ids=['OTHER'])
+        self.assertEqual(positions, [Position(asset_manager_id=self.asset_manager_id, book_id='BOOK',
+                                              asset_id='OTHER', quantity=Decimal(5))])
+
+    def test_AmendAndCancel(self):
+        engine = PositionEngine()
+        transaction = self.generate('Buy', 100)
+        engine.apply(transaction)
+        engine.apply(transaction)  # Reapplying the same version does not double count
+        self.assertEqual(engine.quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(100))
+        amended = transaction.__class__(**transaction.to_dict())
+        amended.quantity = Decimal(60)
+        amended.version = 2
+        engine.apply(amended)
+        self.assertEqual(engine.quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(60))
+        # A stale version arriving late is ignored
+        self.assertFalse(engine.apply(transaction))
+        self.assertEqual(engine.quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(60))
+        amended.transaction_status = 'Cancelled'
+        amended.version = 3
+        engine.apply(amended)
+        self.assertEqual(engine.quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(0))
+        self.assertEqual(engine.positions(), [])
+
+    def test_SettlementDate(self):
+        engine = PositionEngine(accounting_type='Settlement Date', position_date=self.today)
+        engine.apply(self.generate('Buy', 100, transaction_date=self.today - datetime.timedelta(days=5)))
+        engine.apply(self.generate('Buy', 10))  # Settles in two days
+        self.assertEqual(engine.quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(100))
+        self.assertEqual(engine.pending_quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(10))
+        engine.advance(self.today + datetime.timedelta(days=2))
+        self.assertEqual(engine.quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(110))
+        self.assertEqual(engine.pending_quantity(self.asset_manager_id, 'BOOK', 'ASSET'), Decimal(0))
+
+    def test_Reconcile(self):
+        engine = PositionEngine()
+        engine.apply_all([self.generate('Buy', 100), self.generate('Buy', 5, asset_id='OTHER')])
+        server_positions = [Position(asset_manager_id=self.asset_manager_id, book_id='BOOK', asset_id='ASSET',
+                                     quantity=Decimal(90)),
+                            Position(asset_manager_id=self.asset_manager_id, book_id='BOOK', asset_id='MISSING',
+                                     quantity=Decimal(1))]
+        breaks = engine.reconcile(server_positions)
+        self.assertEqual([(item['asset_id'], item['difference']) for item in breaks],
+                         [('ASSET', Decimal(10)), ('MISSING', Decimal(-1)), ('OTHER', Decimal(5))])
+        self.assertEqual(len(engine.reconcile(server_positions, tolerance=Decimal(5))), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+import math
+import unittest
+
+from amaascore.assets.asset import Asset
+from amaascore.transactions.position import Position
+from amaascore.transactions.position_frame import PositionFrame
+
+
+class PositionFrameTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.positions = [Position(asset_manager_id=1, book_id='A', asset_id='X', quantity=Decimal(100)),
+                          Position(asset_manager_id=1, book_id='A', asset_id='Y', quantity=Decimal(10)),
+                          Position(asset_manager_id=1, book_id='B', asset_id='X', quantity=Decimal(-30))]
+        self.frame = PositionFrame.from_positions(self.positions)
+        self.assets = {'X': Asset(asset_manager_id=1, asset_id='X', fungible=True, currency='USD', country_id='USA'),
+                       'Y': Asset(asset_manager_id=1, asset_id='Y', fungible=True, currency='SGD', country_id='SGP')}
+
+    def tearDown(self):
+        pass
+
+    def test_Codes(self):
+        self.assertEqual(len(self.frame), 3)
+        self.assertEqual(list(self.frame.codes['asset_id']), [0, 1, 0])
+        self.assertEqual(self.frame.column('book_id'), ['A', 'A', 'B'])
+        self.assertEqual([(position.book_id, position.asset_id, position.quantity)
+                          for position in self.frame.to_positions()],
+                         [(position.book_id, position.asset_id, position.quantity) for position in self.positions])
+
+    def test_GroupBy(self):
+        self.assertEqual(self.frame.group_by('asset_id'), {'X': 70, 'Y': 10})
+        self.assertEqual(self.frame.group_by(['book_id', 'asset_id']), {('A', 'X'): 100, ('A', 'Y'): 10,
+                                                                         ('B', 'X'): -30})
+        self.assertEqual(self.frame.group_by('currency', assets=self.assets), {'USD': 70, 'SGD': 10})
+        self.assertEqual(self.frame.group_by(['book_id', 'country_id'], assets={'X': self.assets['X']}),
+                         {('A', 'USA'): 100, ('A', None): 10, ('B', 'USA'): -30})
+        with self.assertRaises(ValueError):
+            self.frame.group_by('currency')
+        with self.assertRaises(ValueError):
+            self.frame.group_by('quantity')
+
+    def test_MarketValues(self):
+        market_values = self.frame.market_values({'X': Decimal(2)})
+        self.assertEqual(market_values, [200, None, -60])
+        self.assertEqual(self.frame.group_by('book_id', values=market_values), {'A': 200, 'B': -60})
+        frame = PositionFrame.from_positions(self.positions, exact=False)
+        market_values = frame.market_values({'X': Decimal(2)})
+        self.assertTrue(math.isnan(market_values[1]))
+        self.assertEqual(frame.group_by('book_id', values=market_values), {'A': 200.0, 'B': -60.0})
+
+    def test_Select(self):
+        frame = self.frame.select(book_ids=['A'], asset_ids=['Y', 'Z'])
+        self.assertEqual(len(frame), 1)
+        self.assertEqual(frame.quantities, [10])
+        self.assertIs(frame.code_tables, self.frame.code_tables)
+        self.assertEqual(len(self.frame.select(asset_manager_id=2)), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import random
+import unittest
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.position_engine import PositionEngine
+from amaascore.transactions.position_history import PositionHistory
+
+
+class PositionHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.asset_manager_id = random.randint(1, 2**31-1)
+        self.start_date = datetime.date(2017, 1, 2)
+
+    def tearDown(self):
+        pass
+
+    def generate(self, days, quantity, book_id='BOOK', transaction_action='Buy'):
+        return generate_transaction(asset_manager_id=self.asset_manager_id, asset_book_id=book_id, asset_id='ASSET',
+                                    transaction_action=transaction_action, quantity=Decimal(quantity),
+                                    transaction_date=self.start_date + datetime.timedelta(days=days))
+
+    def test_PositionsAsOf(self):
+        history = PositionHistory(checkpoint_interval=3)
+        transactions = [self.generate(days, random.randint(1, 100), book_id=random.choice(['A', 'B']),
+                                      transaction_action=random.choice(['Buy', 'Sell']))
+                        for days in range(20) for _ in range(3)]
+        # Apply out of date order to exercise the checkpoint invalidation
+        random.shuffle(transactions)
+        history.apply_all(transactions[:30])
+        history.positions_as_of(self.start_date + datetime.timedelta(days=19))
+        history.apply_all(transactions[30:])
+        for days in [0, 5, 11, 19]:
+            position_date = self.start_date + datetime.timedelta(days=days)
+            engine = PositionEngine(position_date=position_date)
+            engine.apply_all(transactions)
+            expected = sorted((position.book_id, position.quantity) for position in engine.positions())
+            actual = sorted((position.book_id, position.quantity)
+                            for position in history.positions_as_of(position_date))
+            self.assertEqual(actual, expected, position_date)
+
+    def test_Amend(self):
+        history = PositionHistory(checkpoint_interval=1)
+        transaction = self.generate(5, 100)
+        history.apply(transaction)
+        history.apply(self.generate(10, 50))
+        self.assertEqual(history.quantity_as_of(self.asset_manager_id, 'BOOK', 'ASSET', self.start_date +
+                                                datetime.timedelta(days=10)), Decimal(150))
+        transaction.transaction_date = self.start_date + datetime.timedelta(days=1)
+        transaction.quantity = Decimal(10)
+        transaction.version = 2
+        history.apply(transaction)
+        self.assertEqual(history.quantity_as_of(self.asset_manager_id, 'BOOK', 'ASSET', self.start_date +
+                                                datetime.timedelta(days=2)), Decimal(10))
+        self.assertEqual(history.quantity_as_of(self.asset_manager_id, 'BOOK', 'ASSET', self.start_date +
+                                                datetime.timedelta(days=10)), Decimal(60))
+
+    def test_PositionSeries(self):
+        history = PositionHistory()
+        history.apply_all([self.generate(1, 100, book_id='A'), self.generate(3, 20, book_id='B'),
+                           self.generate(4, 100, book_id='A', transaction_action='Sell')])
+        series = history.position_series(self.start_date, self.start_date + datetime.timedelta(days=5))
+        self.assertEqual(sorted(series.keys()), ['A', 'B'])
+        self.assertEqual([sum(position.quantity for position in positions) for _, positions in series['A']],
+                         [0, 100, 100, 100, 0, 0])
+        self.assertEqual([len(positions) for _, positions in series['B']], [0, 0, 0, 1, 1, 1])
+        self.assertEqual(series['B'][0][0], self.start_date)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import unittest
+
+from amaascore.tools.generate_transaction import generate_cash_transaction, generate_transaction
+from amaascore.transactions.children import Charge
+from amaascore.transactions.postings import compare_postings, generate_postings, posting_balances, \
+    transaction_postings
+
+
+class PostingsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transaction = generate_transaction(asset_manager_id=1, asset_book_id='A', counterparty_book_id='C',
+                                                asset_id='X', transaction_id='T1', transaction_action='Buy',
+                                                quantity=Decimal(100), price=Decimal(10),
+                                                transaction_date=datetime.date(2017, 1, 2),
+                                                settlement_currency='USD')
+        self.transaction.charges = {'Tax': Charge(charge_value=Decimal(5), currency='USD'),
+                                    'Commission': Charge(charge_value=Decimal(2), currency='SGD',
+                                                         net_affecting=False)}
+
+    def tearDown(self):
+        pass
+
+    def test_TransactionPostings(self):
+        postings = transaction_postings(self.transaction)
+        self.assertEqual(len(postings), 8)
+        self.assertEqual([posting['posting_type'] for posting in postings[::2]], ['Asset', 'Cash', 'Charge', 'Charge'])
+        self.assertEqual(posting_balances(postings), {('A', 'X'): 100, ('C', 'X'): -100, ('A', 'USD'): -1005,
+                                                      ('C', 'USD'): 1005, ('A', 'SGD'): -2, ('C', 'SGD'): 2})
+        self.assertEqual(postings[4]['charge_type'], 'Commission')
+        self.assertFalse(postings[4]['net_affecting'])
+        # Every leg balances
+        self.assertEqual(sum(posting['quantity'] for posting in postings), 0)
+
+    def test_CashTransactionPostings(self):
+        cash = generate_cash_transaction(asset_manager_id=1, asset_book_id='A', counterparty_book_id='C',
+                                         asset_id='USD', quantity=Decimal(50), transaction_action='Deliver')
+        self.assertEqual(posting_balances(transaction_postings(cash)), {('A', 'USD'): -50, ('C', 'USD'): 50})
+
+    def test_Inactive(self):
+        self.transaction.transaction_status = 'Cancelled'
+        self.assertEqual(generate_postings([self.transaction]), {(1, 'T1'): []})
+
+    def test_ComparePostings(self):
+        postings = transaction_postings(self.transaction)
+        # The server may net the charges into the cash leg
+        server_postings = [{'book_id': 'A', 'asset_id': 'X', 'quantity': Decimal(100)},
+                           {'book_id': 'C', 'asset_id': 'X', 'quantity': Decimal(-100)},
+                           {'book_id': 'A', 'asset_id': 'USD', 'quantity': Decimal(-1005)},
+                           {'book_id': 'C', 'asset_id': 'USD', 'quantity': Decimal(1004)}]
+        breaks = compare_postings(postings, server_postings)
+        self.assertEqual([(b['book_id'], b['asset_id'], b['difference']) for b in breaks],
+                         [('A', 'SGD', -2), ('C', 'SGD', 2), ('C', 'USD', 1)])
+        self.assertEqual(len(compare_postings(postings, server_postings, tolerance=2)), 0)
+
+if __name__ == '__main__':
+    unittest.main()
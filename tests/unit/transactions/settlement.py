@@ -0,0 +1,60 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+import unittest
+
+from amaascore.core.columnar import json_to_columns
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.children import Charge
+from amaascore.transactions.settlement import calculate_settlements
+
+
+class SettlementTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transactions = [generate_transaction(transaction_currency=currency) for currency in ['USD', 'SGD'] * 5]
+        # A charge type which only some of the transactions have
+        self.transactions[3].charges['Levy'] = Charge(charge_value=Decimal('2.5'), currency='USD')
+
+    def tearDown(self):
+        pass
+
+    def test_Exact(self):
+        results = calculate_settlements(self.transactions)
+        self.assertEqual(results['gross_settlement'],
+                         [transaction.gross_settlement for transaction in self.transactions])
+        self.assertEqual(results['charges_net_effect'],
+                         [transaction.charges_net_effect() for transaction in self.transactions])
+        self.assertEqual(results['net_settlement'],
+                         [transaction.net_settlement for transaction in self.transactions])
+        self.assertEqual(results['charge_totals']['Levy'], Decimal('2.5'))
+        self.assertEqual(results['charge_totals']['Tax'],
+                         sum(transaction.charges['Tax'].charge_value for transaction in self.transactions))
+        self.assertEqual(results['currency_totals']['SGD']['net_settlement'],
+                         sum(transaction.net_settlement for transaction in self.transactions
+                             if transaction.settlement_currency == 'SGD'))
+
+    def test_Fast(self):
+        exact = calculate_settlements(self.transactions)
+        fast = calculate_settlements(self.transactions, exact=False)
+        for expected, actual in zip(exact['net_settlement'], fast['net_settlement']):
+            self.assertAlmostEqual(float(expected), actual, places=6)
+        self.assertAlmostEqual(float(exact['currency_totals']['USD']['gross_settlement']),
+                               fast['currency_totals']['USD']['gross_settlement'], places=6)
+
+    def test_FromJSONColumns(self):
+        columns = json_to_columns([transaction.to_json() for transaction in self.transactions],
+                                  attributes=['quantity', 'price', 'settlement_currency'], children=['charges'])
+        self.assertEqual(calculate_settlements(columns)['net_settlement'],
+                         calculate_settlements(self.transactions)['net_settlement'])
+
+    def test_ExactFromFloats(self):
+        columns = {'quantity': [3.0], 'price': [0.1], 'settlement_currency': ['USD'],
+                   'charges.Tax.charge_value': [0.2], 'charges.Tax.net_affecting': [True]}
+        results = calculate_settlements(columns)
+        self.assertEqual(str(results['gross_settlement'][0]), '0.30')
+        self.assertEqual(results['net_settlement'][0], Decimal('0.1'))
+
+if __name__ == '__main__':
+    unittest.main()
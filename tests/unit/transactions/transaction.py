@@ -6,7 +6,7 @@ import json
 import unittest
 
 from amaascore.exceptions import TransactionNeedsSaving
-from amaascore.transactions.children import Link, Party
+from amaascore.transactions.children import Code, FrozenLink, Link, LinkSet, Party
 from amaascore.transactions.transaction import Transaction
 from amaascore.tools.generate_transaction import generate_transaction, REFERENCE_TYPES
 
@@ -137,6 +137,41 @@ class TransactionTest(unittest.TestCase):
         with self.assertRaisesRegexp(KeyError, 'Cannot remove link'):
             self.transaction.remove_link('Multiple', '1234')
 
+    def test_RemoveFrozenLink(self):
+        self.transaction.upsert_link_set('Single', FrozenLink(linked_transaction_id='1234'))
+        with self.assertRaisesRegexp(KeyError, 'Cannot remove link'):
+            self.transaction.remove_link('Single', '5678')
+        self.transaction.remove_link('Single', '1234')
+        self.assertNotIn('Single', self.transaction.links)
+
+    def test_LinkSetIndex(self):
+        links = self.transaction.links.get('Multiple')
+        self.assertEqual(type(links), LinkSet)
+        for link in links:
+            self.assertIs(links.get(link.linked_transaction_id), link)
+        links.update({Link(linked_transaction_id='NEW')})
+        self.assertEqual(links.get('NEW').linked_transaction_id, 'NEW')
+        links.discard(links.get('NEW'))
+        self.assertIsNone(links.get('NEW'))
+        copied = copy.deepcopy(links)
+        self.assertEqual(type(copied), LinkSet)
+        self.assertIn(copied.get(next(iter(links)).linked_transaction_id), copied)
+
+    def test_FrozenLinks(self):
+        self.transaction.upsert_link_set('Netting', {FrozenLink(linked_transaction_id=str(i)) for i in range(3)})
+        self.transaction.remove_link(link_type='Netting', linked_transaction_id='1')
+        self.assertEqual(self.transaction.links.get('Netting'), {FrozenLink('0'), FrozenLink('2')})
+        linked_ids = {link.get('linked_transaction_id') for link in self.transaction.to_json()['links']['Netting']}
+        self.assertEqual(linked_ids, {'0', '2'})
+
+    def test_UpsertCodeCopyOnWrite(self):
+        codes = self.transaction.codes
+        self.transaction.upsert_code('TEST', Code(code_value='1234'))
+        self.assertNotIn('TEST', codes)
+        self.assertEqual(self.transaction.codes.get('TEST').code_value, '1234')
+        for code_type, code in codes.items():
+            self.assertIs(self.transaction.codes.get(code_type), code)
+
     def test_InvalidTransactionType(self):
         with self.assertRaisesRegexp(ValueError, 'Invalid transaction type Invalid'):
             transaction = generate_transaction(transaction_type='Invalid')
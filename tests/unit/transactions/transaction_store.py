@@ -0,0 +1,83 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+from decimal import Decimal
+import unittest
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.children import Code
+from amaascore.transactions.transaction_store import TransactionStore
+
+
+class TransactionStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.start_date = datetime.date(2017, 3, 1)
+        self.transactions = [generate_transaction(asset_manager_id=1 + index % 2,
+                                                  asset_book_id='BOOK%s' % (index % 3),
+                                                  asset_id='ASSET%s' % (index % 4),
+                                                  transaction_date=self.start_date + datetime.timedelta(days=index))
+                             for index in range(24)]
+        self.store = TransactionStore(reversed(self.transactions))
+
+    def tearDown(self):
+        pass
+
+    def search_ids(self, **kwargs):
+        return [transaction.transaction_id for transaction in self.store.search(**kwargs)]
+
+    def expected_ids(self, predicate):
+        return [transaction.transaction_id for transaction in self.transactions if predicate(transaction)]
+
+    def test_Search(self):
+        self.assertEqual(self.search_ids(), self.expected_ids(lambda transaction: True))
+        self.assertEqual(self.search_ids(asset_manager_ids=[1], asset_book_ids=['BOOK0', 'BOOK1']),
+                         self.expected_ids(lambda transaction: transaction.asset_manager_id == 1 and
+                                           transaction.asset_book_id in ['BOOK0', 'BOOK1']))
+        self.assertEqual(self.search_ids(asset_ids=['ASSET3'], transaction_date_start='2017-03-05',
+                                         transaction_date_end=self.start_date + datetime.timedelta(days=15)),
+                         self.expected_ids(lambda transaction: transaction.asset_id == 'ASSET3' and
+                                           datetime.date(2017, 3, 5) <= transaction.transaction_date <=
+                                           datetime.date(2017, 3, 16)))
+        linked_transaction_id = next(iter(self.transactions[5].links['Multiple'])).linked_transaction_id
+        self.assertEqual(self.search_ids(link_types=['Multiple'], linked_transaction_ids=[linked_transaction_id]),
+                         [self.transactions[5].transaction_id])
+        self.assertEqual(self.search_ids(asset_ids=['MISSING']), [])
+
+    def test_SelectiveSearch(self):
+        # Fewer matches than transactions in the date range, so only the matches' dates are checked
+        transaction_ids = [self.transactions[index].transaction_id for index in [20, 3, 11]]
+        self.assertEqual(self.search_ids(transaction_ids=transaction_ids),
+                         [self.transactions[index].transaction_id for index in [3, 11, 20]])
+        self.assertEqual(self.search_ids(transaction_ids=transaction_ids, transaction_date_start='2017-03-04',
+                                         transaction_date_end='2017-03-12'),
+                         [self.transactions[index].transaction_id for index in [3, 11]])
+
+    def test_Update(self):
+        transaction = self.transactions[0]
+        amended = transaction.__class__(**transaction.to_dict())
+        amended.version = 2
+        amended.transaction_status = 'Cancelled'
+        amended.transaction_date = self.start_date + datetime.timedelta(days=100)
+        amended.codes['Settle Code'] = Code(code_value='NEWCODE')
+        self.assertTrue(self.store.add(amended))
+        self.assertFalse(self.store.add(transaction))
+        self.assertEqual(len(self.store), 24)
+        self.assertEqual(self.search_ids()[-1], transaction.transaction_id)
+        self.assertEqual(self.search_ids(transaction_statuses=['Cancelled']), [transaction.transaction_id])
+        self.assertEqual(self.search_ids(code_values=['NEWCODE']), [transaction.transaction_id])
+        self.assertEqual(self.search_ids(code_values=[transaction.codes['Settle Code'].code_value]), [])
+        self.store.remove(1, transaction.transaction_id)
+        self.assertEqual(self.search_ids(transaction_statuses=['Cancelled']), [])
+        self.assertNotIn((1, transaction.transaction_id), self.store)
+
+    def test_LoadJSON(self):
+        store = TransactionStore()
+        self.assertEqual(store.load_json(transaction.to_json() for transaction in self.transactions), 24)
+        self.assertEqual(store.get(1, self.transactions[0].transaction_id).quantity, self.transactions[0].quantity)
+        self.assertEqual(type(store.get(1, self.transactions[0].transaction_id).quantity), Decimal)
+
+
+if __name__ == '__main__':
+    unittest.main()